@@ -1,3 +1,3 @@
-from .settings import Settings, get_settings
+from .settings import SEVERITY_LEVELS, Settings, get_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["SEVERITY_LEVELS", "Settings", "get_settings"]
@@ -4,6 +4,9 @@ from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
+# Severity names, ordered like the values of the proto Severity enum
+SEVERITY_LEVELS = ("SAFE", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -15,6 +18,15 @@ class Settings(BaseSettings):
     es_user: str = Field(default="elastic", description="ES username")
     es_password: str = Field(default="changeme", description="ES password")
     es_scheme: str = Field(default="http", description="HTTP or HTTPS")
+    es_http_compress: bool = Field(
+        default=True, description="Gzip request bodies sent to Elasticsearch"
+    )
+    es_connections_per_node: int = Field(
+        default=32, description="Keep-alive HTTP connections kept open per ES node"
+    )
+    es_number_of_replicas: int = Field(
+        default=0, description="Replica count of indices created by the service"
+    )
 
     # Analyzer mode: 'external' (Gemini) or 'internal' (Ollama)
     analyzer_mode: str = Field(
@@ -50,6 +62,15 @@ class Settings(BaseSettings):
     grpc_host: str = Field(default="0.0.0.0", description="gRPC bind host")
     grpc_port: int = Field(default=50051, description="gRPC port")
     grpc_max_workers: int = Field(default=3, description="Thread pool size")
+    grpc_max_message_mb: int = Field(
+        default=50, description="Max gRPC message size sent or received, in MB"
+    )
+    batch_upload_workers: int = Field(
+        default=8, description="Documents a BatchUpload stream uploads concurrently"
+    )
+    health_check_cache_seconds: float = Field(
+        default=3.0, description="Seconds HealthCheck reuses its last probe results"
+    )
 
     # TLS Settings
     grpc_tls_enabled: bool = Field(default=False, description="Enable TLS for gRPC")
@@ -65,6 +86,12 @@ class Settings(BaseSettings):
     )
     log_dir: str = Field(default="logs", description="Log directory for JSON logs")
     service_name: str = Field(default="plagiarism", description="Service name for logging")
+    log_request_args: bool = Field(
+        default=True, description="Include unary request arguments in trace logs"
+    )
+    log_max_arg_bytes: int = Field(
+        default=4096, description="Skip logging request arguments larger than this"
+    )
     metrics_port: int = Field(default=9107, description="Prometheus metrics port")
 
     # Plagiarism Thresholds
@@ -82,6 +109,21 @@ class Settings(BaseSettings):
     chunk_overlap: int = Field(default=20, description="Overlap between chunks")
     min_chunk_size: int = Field(default=30, description="Minimum chunk size")
     min_content_length: int = Field(default=200, description="Minimum content length in chars to index")
+    pdf_max_inflight_pages: int = Field(
+        default=8, description="Max pages/sections buffered between PDF pipeline stages"
+    )
+    pdf_parallel_min_pages: int = Field(
+        default=0,
+        description="Min pages before a PDF is partitioned in parallel processes, 0 to disable",
+    )
+    pdf_parallel_workers: int = Field(
+        default=2,
+        description="Worker processes shared by all parallel PDF partitions; each loads the OCR models",
+    )
+    pdf_cache_dir: str = Field(
+        default="",
+        description="Partition result cache dir, empty to disable; entries are never evicted",
+    )
 
     # Search
     top_k_results: int = Field(default=10, description="Max search results")
@@ -91,10 +133,33 @@ class Settings(BaseSettings):
     max_results_per_source: int = Field(
         default=3, description="Max matches from one source"
     )
+    search_max_concurrent_requests: int = Field(
+        default=4, description="PDF chunk searches sent to Elasticsearch concurrently"
+    )
+    vector_search_cache_size: int = Field(
+        default=0, description="Vector search results kept in memory, 0 to disable"
+    )
+    vector_search_cache_ttl: float = Field(
+        default=10.0, description="Seconds a cached vector search result is reused"
+    )
 
     # Embedding
     embedding_dims: int = Field(default=768, description="Embedding dimensions")
     embedding_batch_size: int = Field(default=32, description="Batch size for embedding")
+    embedding_max_concurrent_requests: int = Field(
+        default=4, description="Embedding batches sent to Ollama concurrently"
+    )
+    embedding_max_wait_ms: int = Field(
+        default=20, description="Max time a text waits to be batched with others"
+    )
+    embedding_element_type: str = Field(
+        default="float",
+        description="ES vector element type: 'float' or 'byte' (int8-quantized, needs ES 8.14+)",
+    )
+    embedding_index_type: str = Field(
+        default="hnsw",
+        description="HNSW graph for float vectors: 'hnsw' or 'int8_hnsw' (quantized, needs ES 8.12+)",
+    )
 
     # MinIO Storage
     minio_endpoint: str = Field(default="127.0.0.1", description="MinIO server endpoint")
@@ -103,6 +168,18 @@ class Settings(BaseSettings):
     minio_secret_key: str = Field(default="", description="MinIO secret key")
     minio_use_ssl: bool = Field(default=False, description="Use SSL for MinIO connection")
     minio_bucket_name: str = Field(default="lvtn", description="Default MinIO bucket name")
+    minio_max_connections: int = Field(
+        default=64, description="Keep-alive HTTP connections kept open to MinIO"
+    )
+    minio_list_cache_ttl: float = Field(
+        default=30.0, description="Seconds list_objects results are reused (0 disables)"
+    )
+    minio_stat_cache_ttl: float = Field(
+        default=10.0, description="Seconds an object's stat is reused (0 disables)"
+    )
+    minio_missing_cache_ttl: float = Field(
+        default=0.0, description="Seconds an object's absence is reused (0 disables)"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -122,15 +199,19 @@ class Settings(BaseSettings):
 
     def get_severity(self, similarity: float) -> str:
         """Get severity level from similarity score."""
+        return SEVERITY_LEVELS[self.get_severity_level(similarity)]
+
+    def get_severity_level(self, similarity: float) -> int:
+        """Get the index into SEVERITY_LEVELS for a similarity score."""
         if similarity >= self.similarity_critical:
-            return "CRITICAL"
+            return 4
         elif similarity >= self.similarity_high:
-            return "HIGH"
+            return 3
         elif similarity >= self.similarity_medium:
-            return "MEDIUM"
+            return 2
         elif similarity >= self.similarity_low:
-            return "LOW"
-        return "SAFE"
+            return 1
+        return 0
 
 
 @lru_cache()
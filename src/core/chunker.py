@@ -11,6 +11,10 @@ from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 @dataclass
 class TextChunk:
@@ -46,9 +50,14 @@ class TextChunker:
         Returns:
             List of TextChunk objects
         """
-        # Normalize text first
-        text = self.normalize_text(text)
+        return self.chunk_text_normalized(self.normalize_text(text))
 
+    def chunk_text_normalized(self, text: str) -> list[TextChunk]:
+        """Split already normalized text into overlapping chunks.
+
+        Same as chunk_text, but the caller guarantees the text has been
+        through normalize_text, so it is not normalized again.
+        """
         if not text:
             return []
 
@@ -127,10 +136,10 @@ class TextChunker:
             return ""
 
         # Replace multiple whitespace with single space
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
 
         # Remove control characters
-        text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+        text = _CONTROL_CHARS_RE.sub("", text)
 
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -161,7 +170,7 @@ class TextChunker:
 
         # Split on sentence-ending punctuation
         # Keep the punctuation with the sentence
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = _SENTENCE_END_RE.split(text)
 
         # Filter out empty sentences
         sentences = [s.strip() for s in sentences if s.strip()]
@@ -3,21 +3,33 @@
 import logging
 import os
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generator, Iterable, Iterator, Optional, TypeVar
 from dataclasses import dataclass, field
+from operator import attrgetter
 from uuid import uuid4
 
-from src.config import get_settings
+from src.config import SEVERITY_LEVELS, get_settings
 from src.storage import get_es_client, SearchResult
 from src.storage.minio_client import get_minio_client
 from src.embedding import get_ollama_client
 from src.core.chunker import get_chunker, TextChunk
 from src.core.analyzer import get_analyzer, AnalysisResult
-from src.core.lexical_matcher import calculate_combined_similarity
+from src.core.lexical_matcher import (
+    LexicalFeatures,
+    calculate_combined_similarity,
+    lexical_features,
+)
 from src.core.pdf_processor import get_pdf_processor
 
 logger = logging.getLogger(__name__)
 
+_similarity_score = attrgetter("similarity_score")
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 @dataclass
 class ChunkAnalysisResult:
@@ -30,6 +42,7 @@ class ChunkAnalysisResult:
     best_match_doc_id: Optional[str] = None
     best_match_title: Optional[str] = None
     matches: list[SearchResult] = field(default_factory=list)
+    status_level: int = 0  # Index of status in SEVERITY_LEVELS
 
 
 @dataclass
@@ -116,6 +129,14 @@ class PlagiarismDetector:
         self.analyzer = get_analyzer()
         self.minio_client = get_minio_client()
         self.pdf_processor = get_pdf_processor()
+        # Each request keeps at most search_window searches in flight, plus
+        # its document count; the pool fits that for every gRPC worker, so a
+        # large PDF cannot starve concurrent checks. Threads start on demand.
+        self.search_window = max(1, self.settings.search_max_concurrent_requests)
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=(self.search_window + 1) * max(1, self.settings.grpc_max_workers),
+            thread_name_prefix="detector-io",
+        )
 
     def check_plagiarism(
         self,
@@ -137,6 +158,35 @@ class PlagiarismDetector:
         Returns:
             PlagiarismResult with detailed analysis
         """
+        updates = self.check_plagiarism_stream(
+            text, min_similarity, top_k, include_ai_analysis, exclude_doc_ids
+        )
+        while True:
+            try:
+                next(updates)
+            except StopIteration as stop:
+                return stop.value
+
+    def check_plagiarism_stream(
+        self,
+        text: str,
+        min_similarity: Optional[float] = None,
+        top_k: Optional[int] = None,
+        include_ai_analysis: bool = True,
+        exclude_doc_ids: Optional[list[str]] = None,
+    ) -> Generator[
+        tuple[ChunkAnalysisResult, list[PlagiarismMatch]], None, PlagiarismResult
+    ]:
+        """Check text for plagiarism, yielding each chunk as it is analyzed.
+
+        Same arguments as check_plagiarism.
+
+        Yields:
+            (ChunkAnalysisResult, matches of that chunk) per chunk, in order
+
+        Returns:
+            PlagiarismResult with detailed analysis, as the generator's value
+        """
         start_time = time.time()
         request_id = str(uuid4())
 
@@ -172,20 +222,23 @@ class PlagiarismDetector:
             chunk_results.append(chunk_analysis)
 
             # Add matches
-            for result in search_results:
-                all_matches.append(
-                    PlagiarismMatch(
-                        document_id=result.document_id,
-                        document_title=result.document_title,
-                        matched_text=result.matched_text,
-                        input_text=chunk.text,
-                        similarity_score=result.similarity_score,
-                        position_start=chunk.start_char,
-                        position_end=chunk.end_char,
-                        chunk_index=i,
-                        matched_chunk_id=result.chunk_id,
-                    )
+            chunk_matches = [
+                PlagiarismMatch(
+                    document_id=result.document_id,
+                    document_title=result.document_title,
+                    matched_text=result.matched_text,
+                    input_text=chunk.text,
+                    similarity_score=result.similarity_score,
+                    position_start=chunk.start_char,
+                    position_end=chunk.end_char,
+                    chunk_index=i,
+                    matched_chunk_id=result.chunk_id,
                 )
+                for result in search_results
+            ]
+            all_matches.extend(chunk_matches)
+
+            yield chunk_analysis, chunk_matches
 
         # Step 4: Calculate base plagiarism percentage
         base_percentage = self._calculate_base_percentage(chunks, chunk_results)
@@ -239,11 +292,20 @@ class PlagiarismDetector:
 
         # Recalculate similarity using combined semantic + lexical scoring
         combined_results = []
+        input_features = lexical_features(chunk.text)
         for result in search_results:
+            # Chunks indexed before lexical features were stored are normalized here
+            matched_features = None
+            if result.matched_normalized_text:
+                matched_features = LexicalFeatures.from_stored(
+                    result.matched_normalized_text, result.matched_token_hashes
+                )
             combined_score, _ = calculate_combined_similarity(
                 semantic_score=result.similarity_score,
                 input_text=chunk.text,
                 matched_text=result.matched_text,
+                input_features=input_features,
+                matched_features=matched_features,
             )
             # Update the result's similarity score with combined score
             result.similarity_score = combined_score
@@ -252,16 +314,17 @@ class PlagiarismDetector:
         # Find best match after recalculation
         max_result = max(combined_results, key=lambda x: x.similarity_score)
         max_similarity = max_result.similarity_score
-        status = self.settings.get_severity(max_similarity)
+        status_level = self.settings.get_severity_level(max_similarity)
 
         return ChunkAnalysisResult(
             chunk_index=chunk_index,
             text=chunk.text,
             max_similarity=max_similarity,
-            status=status,
+            status=SEVERITY_LEVELS[status_level],
             best_match_doc_id=max_result.document_id,
             best_match_title=max_result.document_title,
             matches=combined_results,
+            status_level=status_level,
         )
 
     def _calculate_base_percentage(
@@ -342,24 +405,20 @@ class PlagiarismDetector:
         Deduplicates by matched_chunk_id to ensure each matched chunk
         from the database appears only once, keeping the highest similarity.
         """
-        seen = set()
-        unique = []
-
-        # Sort by similarity descending
-        sorted_matches = sorted(
-            matches, key=lambda x: x.similarity_score, reverse=True
+        # One pass keeps the best match per database chunk, so only the
+        # survivors are sorted; ties keep their original order as before
+        best: dict[str, int] = {}
+        for i, match in enumerate(matches):
+            j = best.get(match.matched_chunk_id)
+            if j is None or match.similarity_score > matches[j].similarity_score:
+                best[match.matched_chunk_id] = i
+
+        return sorted(
+            (matches[i] for i in sorted(best.values())),
+            key=_similarity_score,
+            reverse=True,
         )
 
-        for match in sorted_matches:
-            # Use matched_chunk_id as key to deduplicate by database chunk
-            # This allows multiple chunks from same document if they are different chunks
-            key = match.matched_chunk_id
-            if key not in seen:
-                seen.add(key)
-                unique.append(match)
-
-        return unique
-
     def _empty_result(
         self, request_id: str, start_time: float
     ) -> PlagiarismResult:
@@ -424,18 +483,22 @@ class PlagiarismDetector:
         all_matches: list[PlagiarismMatch] = []
         chunk_results: list[ChunkAnalysisResult] = []
 
-        # Calculate cumulative character positions
-        cumulative_char = 0
-
-        for i, (pdf_chunk, embedding) in enumerate(zip(pdf_chunks, embeddings)):
-            # Vector search
-            search_results = self.es_client.vector_search(
+        def search(embedding: list[float]) -> list[SearchResult]:
+            return self.es_client.vector_search(
                 embedding=embedding,
                 top_k=top_k,
                 min_score=min_similarity,
                 exclude_doc_ids=exclude_doc_ids,
             )
 
+        # Vector searches run concurrently and overlap the analysis below;
+        # results still arrive in chunk order
+        searches = _map_bounded(self.io_executor, search, embeddings, self.search_window)
+
+        # Calculate cumulative character positions
+        cumulative_char = 0
+
+        for i, (pdf_chunk, search_results) in enumerate(zip(pdf_chunks, searches)):
             # Create wrapper for analysis with actual character positions
             chunk_obj = PdfTextChunk(
                 text=pdf_chunk.text,
@@ -498,6 +561,11 @@ class PlagiarismDetector:
         top_k = top_k or self.settings.top_k_results
 
         try:
+            # The document count does not depend on the PDF; fetch it meanwhile
+            documents_searched = self.io_executor.submit(
+                self.es_client.get_document_count
+            )
+
             # Validate object exists
             if not self.minio_client.object_exists(bucket_name, object_path):
                 return self._create_error_pdf_result(
@@ -594,7 +662,7 @@ class PlagiarismDetector:
                     total_pages=pdf_result.total_pages,
                     total_chunks=len(pdf_result.chunks),
                     chunks_analyzed=len(chunk_results),
-                    documents_searched=self.es_client.get_document_count(),
+                    documents_searched=documents_searched.result(),
                     model_used=self.settings.ollama_embed_model,
                 ),
             )
@@ -609,6 +677,23 @@ class PlagiarismDetector:
                 os.remove(local_path)
 
 
+def _map_bounded(
+    executor: ThreadPoolExecutor, fn: Callable[[_T], _R], items: Iterable[_T], window: int
+) -> Iterator[_R]:
+    """Like executor.map, but with at most window calls submitted at a time."""
+    pending: deque[Future] = deque()
+    try:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 # Singleton instance
 _detector: Optional[PlagiarismDetector] = None
 
@@ -1,7 +1,10 @@
 """Document management for plagiarism detection system."""
 
 import logging
-from typing import Optional, Generator
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Generator
 from dataclasses import dataclass
 from uuid import uuid4
 from datetime import datetime
@@ -9,14 +12,15 @@ from datetime import datetime
 from src.config import get_settings
 from src.storage import get_es_client, DocumentData, DocumentChunk
 from src.storage.minio_client import get_minio_client
-from src.embedding import get_ollama_client
-from src.core.chunker import get_chunker
-from src.core.pdf_processor import get_pdf_processor, PdfChunk
+from src.embedding import get_batching_ollama_client, get_ollama_client
+from src.core.chunker import get_chunker, TextChunk
+from src.core.lexical_matcher import lexical_features
+from src.core.pdf_processor import get_pdf_processor, PdfChunk, PdfProcessingResult
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UploadResult:
     """Result of document upload."""
 
@@ -28,7 +32,7 @@ class UploadResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchUploadResult:
     """Result of batch upload."""
 
@@ -38,7 +42,7 @@ class BatchUploadResult:
     results: list[UploadResult]
 
 
-@dataclass
+@dataclass(slots=True)
 class PdfUploadResult:
     """Result of PDF upload from MinIO."""
 
@@ -46,29 +50,68 @@ class PdfUploadResult:
     title: str
     success: bool
     total_chunks: int
-    chunks_info: list[dict]  # Info about each chunk
+    chunks_info: Iterable[dict]  # Info about each chunk, may be a one-shot generator
     processing_metadata: dict  # PDF processing stats
     error_message: str = ""
 
 
+def _document_chunk(
+    chunk_id: str,
+    text: str,
+    embedding: list[float],
+    position: int,
+    word_count: int,
+    section_title: str = "",
+) -> DocumentChunk:
+    """Build a DocumentChunk with its lexical features precomputed."""
+    features = lexical_features(text)
+    return DocumentChunk(
+        chunk_id=chunk_id,
+        text=text,
+        embedding=embedding,
+        position=position,
+        word_count=word_count,
+        section_title=section_title,
+        normalized_text=features.normalized,
+        token_hashes=features.encoded_hashes(),
+    )
+
+
 class DocumentManager:
     """Manages document upload and retrieval."""
 
+    __slots__ = (
+        "settings",
+        "es_client",
+        "ollama_client",
+        "embedder",
+        "chunker",
+        "minio_client",
+        "pdf_processor",
+        "_stats_executor",
+    )
+
     def __init__(self):
         self.settings = get_settings()
         self.es_client = get_es_client()
         self.ollama_client = get_ollama_client()
+        self.embedder = get_batching_ollama_client()
         self.chunker = get_chunker()
         self.minio_client = get_minio_client()
         self.pdf_processor = get_pdf_processor()
+        # Threads start on first use; one per get_stats probe
+        self._stats_executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="stats-probe"
+        )
 
     def upload_document(
         self,
         title: str,
         content: str,
-        metadata: Optional[dict[str, str]] = None,
+        metadata: Optional[Mapping[str, str]] = None,
         language: Optional[str] = None,
         document_id: Optional[str] = None,
+        refresh: bool = True,
     ) -> UploadResult:
         """Upload a single document.
 
@@ -78,105 +121,235 @@ class DocumentManager:
             metadata: Optional metadata dict
             language: Language code (auto-detect if not provided)
             document_id: Optional custom document ID
+            refresh: Make the document searchable before returning
 
         Returns:
             UploadResult with status
         """
+        doc_data = self._embed_document(title, content, metadata, language, document_id)
+        if isinstance(doc_data, UploadResult):
+            return doc_data
+        return self._index_embedded(doc_data, refresh)
+
+    def _embed_document(
+        self,
+        title: str,
+        content: str,
+        metadata: Optional[Mapping[str, str]],
+        language: Optional[str],
+        document_id: Optional[str],
+    ) -> DocumentData | UploadResult:
+        """Chunk and embed a document; an UploadResult if it can't be indexed."""
         try:
-            # Generate document ID if not provided
-            doc_id = document_id or str(uuid4())
-
-            # Detect language if not provided
-            if not language or language == "auto":
-                language = self.chunker.detect_language(content)
-
-            # Chunk the document
-            chunks = self.chunker.chunk_text(content)
-
-            if not chunks:
-                return UploadResult(
-                    document_id=doc_id,
-                    title=title,
-                    chunks_created=0,
-                    success=False,
-                    message="Document content too short to process",
-                )
+            prepared = self._prepare_upload(title, content, language, document_id)
+            if isinstance(prepared, UploadResult):
+                return prepared
+            doc_id, language, chunks = prepared
 
             # Generate embeddings for chunks
             chunk_texts = [chunk.text for chunk in chunks]
             embeddings = self.ollama_client.embed_batch(chunk_texts)
 
-            # Create document chunks with embeddings
-            doc_chunks = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                doc_chunks.append(
-                    DocumentChunk(
-                        chunk_id=f"{doc_id}_chunk_{i}",
-                        text=chunk.text,
-                        embedding=embedding,
-                        position=chunk.position,
-                        word_count=chunk.word_count,
-                    )
-                )
-
-            # Create document data
-            doc_data = DocumentData(
-                document_id=doc_id,
-                title=title,
-                content=content,
-                chunks=doc_chunks,
-                language=language,
-                metadata=metadata or {},
-                created_at=datetime.utcnow(),
+            return self._build_document_data(
+                doc_id, title, content, chunks, embeddings, language, metadata
             )
+        except Exception as e:
+            return self._failed_upload(title, document_id, e)
+
+    def _index_embedded(self, doc_data: DocumentData, refresh: bool = True) -> UploadResult:
+        """Index an embedded document."""
+        try:
+            success = self.es_client.index_document(doc_data, refresh=refresh)
+            return self._index_result(doc_data, success)
+        except Exception as e:
+            return self._failed_upload(doc_data.title, doc_data.document_id, e)
+
+    def upload_documents_bulk(self, documents: list[dict]) -> list[UploadResult]:
+        """Upload several documents with one embedding pass and one bulk write.
 
-            # Index document
-            success = self.es_client.index_document(doc_data)
-
-            if success:
-                logger.info(f"Uploaded document: {doc_id} ({len(doc_chunks)} chunks)")
-                return UploadResult(
-                    document_id=doc_id,
-                    title=title,
-                    chunks_created=len(doc_chunks),
-                    success=True,
-                    message=f"Successfully uploaded with {len(doc_chunks)} chunks",
+        Args:
+            documents: List of dicts with keys: title, content, metadata, language
+
+        Returns:
+            UploadResult for each document, in input order
+        """
+        results: list[Optional[UploadResult]] = [None] * len(documents)
+        prepared = []
+        for i, doc in enumerate(documents):
+            title = doc.get("title", "Untitled")
+            try:
+                item = self._prepare_upload(
+                    title, doc.get("content", ""), doc.get("language"), doc.get("document_id")
                 )
+            except Exception as e:
+                results[i] = self._failed_upload(title, doc.get("document_id"), e)
+                continue
+            if isinstance(item, UploadResult):
+                results[i] = item
             else:
-                return UploadResult(
-                    document_id=doc_id,
-                    title=title,
-                    chunks_created=0,
-                    success=False,
-                    message="Failed to index document",
-                    error="Elasticsearch indexing failed",
+                prepared.append((i, title, doc, *item))
+
+        try:
+            # Embed the chunks of every document in a single batched call
+            chunk_texts = [chunk.text for *_, chunks in prepared for chunk in chunks]
+            embeddings = self.ollama_client.embed_batch(chunk_texts) if chunk_texts else []
+
+            doc_datas = []
+            offset = 0
+            for _, title, doc, doc_id, language, chunks in prepared:
+                doc_datas.append(
+                    self._build_document_data(
+                        doc_id, title, doc.get("content", ""), chunks,
+                        embeddings[offset:offset + len(chunks)], language,
+                        doc.get("metadata"),
+                    )
                 )
+                offset += len(chunks)
 
+            indexed = self.es_client.index_documents(doc_datas)
         except Exception as e:
-            logger.error(f"Failed to upload document: {e}")
+            for i, title, _, doc_id, *_ in prepared:
+                results[i] = self._failed_upload(title, doc_id, e)
+            return results
+
+        for (i, *_), doc_data, success in zip(prepared, doc_datas, indexed):
+            results[i] = self._index_result(doc_data, success)
+        return results
+
+    def _prepare_upload(
+        self,
+        title: str,
+        content: str,
+        language: Optional[str],
+        document_id: Optional[str],
+    ) -> tuple[str, str, list[TextChunk]] | UploadResult:
+        """Resolve document ID and language, and chunk the content.
+
+        Returns:
+            Tuple of (doc_id, language, chunks), or an UploadResult when the
+            content is too short to process
+        """
+        # Generate document ID if not provided
+        doc_id = document_id or str(uuid4())
+
+        # Detect language if not provided
+        if not language or language == "auto":
+            language = self.chunker.detect_language(content)
+
+        # Chunk the document
+        chunks = self.chunker.chunk_text(content)
+
+        if not chunks:
             return UploadResult(
-                document_id=document_id or "",
+                document_id=doc_id,
                 title=title,
                 chunks_created=0,
                 success=False,
-                message="Upload failed",
-                error=str(e),
+                message="Document content too short to process",
             )
 
+        return doc_id, language, chunks
+
+    def _build_document_data(
+        self,
+        doc_id: str,
+        title: str,
+        content: str,
+        chunks: list[TextChunk],
+        embeddings: list[list[float]],
+        language: str,
+        metadata: Optional[Mapping[str, str]],
+    ) -> DocumentData:
+        """Create DocumentData with embedded chunks."""
+        doc_chunks = []
+        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+            doc_chunks.append(
+                _document_chunk(
+                    chunk_id=f"{doc_id}_chunk_{i}",
+                    text=chunk.text,
+                    embedding=embedding,
+                    position=chunk.position,
+                    word_count=chunk.word_count,
+                )
+            )
+
+        return DocumentData(
+            document_id=doc_id,
+            title=title,
+            content=content,
+            chunks=doc_chunks,
+            language=language,
+            # Protobuf maps are not JSON-serializable; copy once per document
+            metadata=dict(metadata) if metadata else {},
+            created_at=datetime.utcnow(),
+        )
+
+    def _index_result(self, doc_data: DocumentData, success: bool) -> UploadResult:
+        """Build UploadResult from the indexing outcome."""
+        doc_id = doc_data.document_id
+        if success:
+            logger.info(f"Uploaded document: {doc_id} ({len(doc_data.chunks)} chunks)")
+            return UploadResult(
+                document_id=doc_id,
+                title=doc_data.title,
+                chunks_created=len(doc_data.chunks),
+                success=True,
+                # Few distinct chunk counts: share one string per count across a batch
+                message=sys.intern(f"Successfully uploaded with {len(doc_data.chunks)} chunks"),
+            )
+        return UploadResult(
+            document_id=doc_id,
+            title=doc_data.title,
+            chunks_created=0,
+            success=False,
+            message="Failed to index document",
+            error="Elasticsearch indexing failed",
+        )
+
+    def _failed_upload(
+        self, title: str, document_id: Optional[str], error: Exception
+    ) -> UploadResult:
+        """Build UploadResult for an unexpected upload error."""
+        logger.error(f"Failed to upload document: {error}")
+        return UploadResult(
+            document_id=document_id or "",
+            title=title,
+            chunks_created=0,
+            success=False,
+            message="Upload failed",
+            error=str(error),
+        )
+
     def batch_upload(
         self,
         documents: list[dict],
         on_progress: Optional[callable] = None,
+        fast_ingest: bool = False,
     ) -> BatchUploadResult:
         """Upload multiple documents.
 
         Args:
             documents: List of dicts with keys: title, content, metadata, language
             on_progress: Optional callback for progress updates
+            fast_ingest: Disable index refresh/replicas for the duration of the
+                load; this changes the shared indices for every writer
 
         Returns:
             BatchUploadResult with all results
         """
+        if fast_ingest:
+            # ingest_mode refreshes once when the block ends
+            with self.es_client.ingest_mode():
+                return self._batch_upload(documents, on_progress, refresh=False)
+        return self._batch_upload(documents, on_progress)
+
+    def _batch_upload(
+        self,
+        documents: list[dict],
+        on_progress: Optional[callable] = None,
+        refresh: bool = True,
+    ) -> BatchUploadResult:
+        """Upload documents one by one and collect results."""
         results = []
         successful = 0
         failed = 0
@@ -187,6 +360,7 @@ class DocumentManager:
                 content=doc.get("content", ""),
                 metadata=doc.get("metadata"),
                 language=doc.get("language"),
+                refresh=refresh,
             )
 
             results.append(result)
@@ -208,24 +382,44 @@ class DocumentManager:
 
     def batch_upload_stream(
         self,
-        documents: Generator[dict, None, None],
+        documents: Iterable[dict],
     ) -> Generator[UploadResult, None, None]:
-        """Stream upload documents one by one.
+        """Stream upload documents, overlapping embedding and indexing.
+
+        While document i is being indexed in Elasticsearch, document i+1 is
+        already being chunked and embedded in a worker thread, so at most one
+        embedded document waits to be indexed.
 
         Args:
-            documents: Generator of document dicts
+            documents: Iterable of document dicts
 
         Yields:
-            UploadResult for each document
+            UploadResult for each document, in input order
         """
-        for doc in documents:
-            result = self.upload_document(
-                title=doc.get("title", "Untitled"),
-                content=doc.get("content", ""),
-                metadata=doc.get("metadata"),
-                language=doc.get("language"),
-            )
-            yield result
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="upload-embed") as executor:
+            pending: Optional[Future] = None
+            for doc in documents:
+                embedding = executor.submit(
+                    self._embed_document,
+                    doc.get("title", "Untitled"),
+                    doc.get("content", ""),
+                    doc.get("metadata"),
+                    doc.get("language"),
+                    None,
+                )
+                if pending is not None:
+                    yield self._index_pending(pending)
+                pending = embedding
+
+            if pending is not None:
+                yield self._index_pending(pending)
+
+    def _index_pending(self, embedding: Future) -> UploadResult:
+        """Index the document an embedding future resolves to."""
+        doc_data = embedding.result()
+        if isinstance(doc_data, UploadResult):
+            return doc_data
+        return self._index_embedded(doc_data)
 
     def get_document(
         self,
@@ -247,6 +441,10 @@ class DocumentManager:
 
         if doc and not include_content:
             doc.pop("content", None)
+        elif doc and not doc.get("content"):
+            # PDF documents don't store their content, rebuild it from chunks
+            chunks = doc.get("chunks") or self.es_client.get_document_chunks(document_id)
+            doc["content"] = "\n\n".join(_iter_chunk_sections(chunks))
 
         return doc
 
@@ -264,10 +462,11 @@ class DocumentManager:
     def search_documents(
         self,
         query: Optional[str] = None,
-        filters: Optional[dict[str, str]] = None,
+        filters: Optional[Mapping[str, str]] = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> tuple[list[dict], int]:
+        search_after: Optional[list] = None,
+    ) -> tuple[list[dict], int, Optional[list]]:
         """Search documents.
 
         Args:
@@ -275,23 +474,33 @@ class DocumentManager:
             filters: Metadata filters
             limit: Max results
             offset: Pagination offset
+            search_after: Sort values of the previous page's last hit
 
         Returns:
-            Tuple of (documents list, total count)
+            Tuple of (documents list, total count, last hit's sort values)
         """
         return self.es_client.search_documents(
             query=query,
             filters=filters,
             limit=limit,
             offset=offset,
+            search_after=search_after,
         )
 
     def get_stats(self) -> dict:
-        """Get system statistics."""
+        """Get system statistics.
+
+        The probes are independent and run concurrently, so this takes as
+        long as the slowest one rather than their sum.
+        """
+        executor = self._stats_executor
+        total_documents = executor.submit(self.es_client.get_document_count)
+        es_health = executor.submit(self.es_client.health_check)
+        ollama_health = executor.submit(self.ollama_client.health_check)
         return {
-            "total_documents": self.es_client.get_document_count(),
-            "es_health": self.es_client.health_check(),
-            "ollama_health": self.ollama_client.health_check(),
+            "total_documents": total_documents.result(),
+            "es_health": es_health.result(),
+            "ollama_health": ollama_health.result(),
         }
 
     def upload_pdf_from_minio(
@@ -300,7 +509,7 @@ class DocumentManager:
         object_path: str,
         document_id: Optional[str] = None,
         title: Optional[str] = None,
-        metadata: Optional[dict[str, str]] = None,
+        metadata: Optional[Mapping[str, str]] = None,
         language: Optional[str] = None,
     ) -> PdfUploadResult:
         """
@@ -317,178 +526,323 @@ class DocumentManager:
         Returns:
             PdfUploadResult with processing details
         """
-        import os
-        import tempfile
-
         doc_id = document_id or str(uuid4())
 
         try:
-            # Check if object exists
-            if not self.minio_client.object_exists(bucket_name, object_path):
-                return PdfUploadResult(
-                    document_id=doc_id,
-                    title="",
-                    success=False,
-                    total_chunks=0,
-                    chunks_info=[],
-                    processing_metadata={},
-                    error_message=f"Object not found: {bucket_name}/{object_path}",
-                )
+            # Chunks are queued for embedding as the PDF pipeline produces them
+            pending: list[Future] = []
+            pdf_result = _process_pdf_from_minio(
+                self.minio_client, self.pdf_processor, bucket_name, object_path, doc_id,
+                on_chunk=lambda chunk: pending.append(self.embedder.embed(chunk.text)),
+            )
+            if not pdf_result.success or not pdf_result.chunks:
+                return self._failed_pdf_upload(doc_id, pdf_result)
 
-            # Download PDF to temp file
-            local_path = self.minio_client.download_file(bucket_name, object_path)
-            if not local_path:
-                return PdfUploadResult(
-                    document_id=doc_id,
-                    title="",
-                    success=False,
-                    total_chunks=0,
-                    chunks_info=[],
-                    processing_metadata={},
-                    error_message="Failed to download file from MinIO",
-                )
+            embeddings = [future.result() for future in pending]
 
-            try:
-                # Process PDF
-                pdf_result = self.pdf_processor.process_pdf(
-                    pdf_path=local_path,
-                    document_id=doc_id,
-                )
+            return self._index_pdf(
+                doc_id, pdf_result, embeddings, bucket_name, object_path,
+                title, metadata, language,
+            )
 
-                if not pdf_result.success:
-                    return PdfUploadResult(
-                        document_id=doc_id,
-                        title="",
-                        success=False,
-                        total_chunks=0,
-                        chunks_info=[],
-                        processing_metadata={},
-                        error_message=pdf_result.error_message,
-                    )
+        except Exception as e:
+            logger.error(f"Failed to upload PDF from MinIO: {e}", exc_info=True)
+            return PdfUploadResult(
+                document_id=doc_id,
+                title="",
+                success=False,
+                total_chunks=0,
+                chunks_info=[],
+                processing_metadata={},
+                error_message=str(e),
+            )
 
-                if not pdf_result.chunks:
-                    return PdfUploadResult(
-                        document_id=doc_id,
-                        title=pdf_result.document_title,
-                        success=False,
-                        total_chunks=0,
-                        chunks_info=[],
-                        processing_metadata={},
-                        error_message="No content extracted from PDF",
-                    )
+    def _failed_pdf_upload(
+        self, doc_id: str, pdf_result: PdfProcessingResult
+    ) -> PdfUploadResult:
+        """Build a failed PdfUploadResult from an unusable processing result."""
+        if pdf_result.success:
+            title = pdf_result.document_title
+            error_message = "No content extracted from PDF"
+        else:
+            title = ""
+            error_message = pdf_result.error_message
+
+        return PdfUploadResult(
+            document_id=doc_id,
+            title=title,
+            success=False,
+            total_chunks=0,
+            chunks_info=[],
+            processing_metadata={},
+            error_message=error_message,
+        )
 
-                # Use provided title or extracted title
-                doc_title = title or pdf_result.document_title
-
-                # Generate embeddings for all chunks
-                chunk_texts = [chunk.text for chunk in pdf_result.chunks]
-                embeddings = self.ollama_client.embed_batch(chunk_texts)
-
-                # Detect language from first chunk if not provided
-                if not language or language == "auto":
-                    language = self.chunker.detect_language(chunk_texts[0])
-
-                # Create document chunks with embeddings
-                doc_chunks = []
-                for chunk, embedding in zip(pdf_result.chunks, embeddings):
-                    doc_chunks.append(
-                        DocumentChunk(
-                            chunk_id=chunk.chunk_id,
-                            text=chunk.text,
-                            embedding=embedding,
-                            position=chunk.position,
-                            word_count=chunk.word_count,
-                        )
-                    )
+    def batch_upload_pdfs_from_minio(
+        self,
+        objects: list[tuple[str, str]],
+        metadata: Optional[Mapping[str, str]] = None,
+        language: Optional[str] = None,
+    ) -> list[PdfUploadResult]:
+        """Upload many PDFs from MinIO, parsing them in parallel processes.
 
-                # Combine all chunk texts for full content
-                full_content = "\n\n".join(
-                    f"## {chunk.section_title}\n{chunk.text}"
-                    for chunk in pdf_result.chunks
-                )
+        PDF parsing is CPU-bound, so each (bucket, path) is downloaded and
+        processed in the PDF processor's shared worker pool, whose size is
+        pdf_parallel_workers. The chunks of all PDFs are then embedded in a
+        single batch and indexed in one _bulk request.
 
-                # Build metadata
-                doc_metadata = metadata or {}
-                doc_metadata["source_bucket"] = bucket_name
-                doc_metadata["source_path"] = object_path
-                doc_metadata["pdf_pages"] = str(pdf_result.total_pages)
-
-                # Create document data
-                doc_data = DocumentData(
-                    document_id=doc_id,
-                    title=doc_title,
-                    content=full_content,
-                    chunks=doc_chunks,
-                    language=language,
-                    metadata=doc_metadata,
-                    created_at=datetime.utcnow(),
-                )
+        Args:
+            objects: List of (bucket_name, object_path) pairs
+            metadata: Optional metadata applied to every document
+            language: Language code (auto-detect if not provided)
 
-                # Index document
-                success = self.es_client.index_document(doc_data)
-
-                if not success:
-                    return PdfUploadResult(
-                        document_id=doc_id,
-                        title=doc_title,
-                        success=False,
-                        total_chunks=0,
-                        chunks_info=[],
-                        processing_metadata={},
-                        error_message="Failed to index document in Elasticsearch",
-                    )
+        Returns:
+            One PdfUploadResult per object, in input order
+        """
+        if not objects:
+            return []
+
+        doc_ids = [str(uuid4()) for _ in objects]
+        executor = self.pdf_processor.worker_pool()
+        futures = [
+            executor.submit(_process_pdf_worker, bucket_name, object_path, doc_id)
+            for (bucket_name, object_path), doc_id in zip(objects, doc_ids)
+        ]
+        try:
+            pdf_results = [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+        results: list[Optional[PdfUploadResult]] = [None] * len(objects)
+        usable = []
+        for i, pdf_result in enumerate(pdf_results):
+            if pdf_result.success and pdf_result.chunks:
+                usable.append(i)
+            else:
+                results[i] = self._failed_pdf_upload(doc_ids[i], pdf_result)
 
-                # Build chunks info for response
-                chunks_info = [
-                    {
-                        "chunk_id": chunk.chunk_id,
-                        "section_title": chunk.section_title,
-                        "content_preview": chunk.text[:200] + "..." if len(chunk.text) > 200 else chunk.text,
-                        "element_type": chunk.element_type,
-                        "position": chunk.position,
-                        "word_count": chunk.word_count,
-                    }
-                    for chunk in pdf_result.chunks
-                ]
-
-                logger.info(
-                    f"Uploaded PDF from MinIO: {doc_id} ({len(doc_chunks)} chunks) "
-                    f"from {bucket_name}/{object_path}"
+        try:
+            # Embed the chunks of every PDF in one batch
+            chunk_texts = [
+                chunk.text for i in usable for chunk in pdf_results[i].chunks
+            ]
+            embeddings = self.ollama_client.embed_batch(chunk_texts) if chunk_texts else []
+
+            doc_datas = []
+            offset = 0
+            for i in usable:
+                count = len(pdf_results[i].chunks)
+                bucket_name, object_path = objects[i]
+                doc_datas.append(
+                    self._pdf_document_data(
+                        doc_ids[i], pdf_results[i], embeddings[offset:offset + count],
+                        bucket_name, object_path, None, metadata, language,
+                    )
                 )
+                offset += count
+
+            indexed = self.es_client.index_documents(doc_datas)
+        except Exception as e:
+            logger.error(f"Failed to upload PDF batch from MinIO: {e}", exc_info=True)
+            for i in usable:
+                pdf_results[i].success = False
+                pdf_results[i].error_message = str(e)
+                results[i] = self._failed_pdf_upload(doc_ids[i], pdf_results[i])
+            return results
+
+        for i, doc_data, success in zip(usable, doc_datas, indexed):
+            results[i] = self._pdf_upload_result(doc_data, pdf_results[i], success, *objects[i])
+
+        logger.info(
+            f"Batch uploaded {sum(r.success for r in results)}/{len(results)} PDFs from MinIO"
+        )
+        return results
+
+    def _index_pdf(
+        self,
+        doc_id: str,
+        pdf_result: PdfProcessingResult,
+        embeddings: list[list[float]],
+        bucket_name: str,
+        object_path: str,
+        title: Optional[str],
+        metadata: Optional[Mapping[str, str]],
+        language: Optional[str],
+    ) -> PdfUploadResult:
+        """Index a processed PDF with its chunk embeddings."""
+        doc_data = self._pdf_document_data(
+            doc_id, pdf_result, embeddings, bucket_name, object_path,
+            title, metadata, language,
+        )
+        success = self.es_client.index_document(doc_data)
+        return self._pdf_upload_result(
+            doc_data, pdf_result, success, bucket_name, object_path
+        )
 
-                return PdfUploadResult(
-                    document_id=doc_id,
-                    title=doc_title,
-                    success=True,
-                    total_chunks=len(doc_chunks),
-                    chunks_info=chunks_info,
-                    processing_metadata={
-                        "total_pages": pdf_result.total_pages,
-                        "total_elements": pdf_result.total_elements,
-                        "total_chunks": len(pdf_result.chunks),
-                        "processing_time_ms": pdf_result.processing_time_ms,
-                        "pdf_title": pdf_result.document_title,
-                        "pdf_author": pdf_result.pdf_metadata.get("author", ""),
-                    },
+    def _pdf_document_data(
+        self,
+        doc_id: str,
+        pdf_result: PdfProcessingResult,
+        embeddings: list[list[float]],
+        bucket_name: str,
+        object_path: str,
+        title: Optional[str],
+        metadata: Optional[Mapping[str, str]],
+        language: Optional[str],
+    ) -> DocumentData:
+        """Build DocumentData for a processed PDF and its chunk embeddings."""
+        # Use provided title or extracted title
+        doc_title = title or pdf_result.document_title
+
+        # Detect language from first chunk if not provided
+        if not language or language == "auto":
+            language = self.chunker.detect_language(pdf_result.chunks[0].text)
+
+        # Create document chunks with embeddings
+        doc_chunks = []
+        for chunk, embedding in zip(pdf_result.chunks, embeddings):
+            doc_chunks.append(
+                _document_chunk(
+                    chunk_id=chunk.chunk_id,
+                    text=chunk.text,
+                    embedding=embedding,
+                    position=chunk.position,
+                    word_count=chunk.word_count,
+                    section_title=chunk.section_title,
                 )
+            )
 
-            finally:
-                # Clean up temp file
-                if local_path and os.path.exists(local_path):
-                    os.remove(local_path)
+        # Build metadata
+        doc_metadata = dict(metadata or {})
+        doc_metadata["source_bucket"] = bucket_name
+        doc_metadata["source_path"] = object_path
+        doc_metadata["pdf_pages"] = str(pdf_result.total_pages)
+
+        # Content is rebuilt from chunks on read (see get_document), so the
+        # text is only indexed for SearchDocuments
+        return DocumentData(
+            document_id=doc_id,
+            title=doc_title,
+            content="",
+            chunks=doc_chunks,
+            language=language,
+            metadata=doc_metadata,
+            created_at=datetime.utcnow(),
+            searchable_content=[chunk.text for chunk in pdf_result.chunks],
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to upload PDF from MinIO: {e}", exc_info=True)
+    def _pdf_upload_result(
+        self,
+        doc_data: DocumentData,
+        pdf_result: PdfProcessingResult,
+        success: bool,
+        bucket_name: str,
+        object_path: str,
+    ) -> PdfUploadResult:
+        """Build PdfUploadResult from the indexing outcome."""
+        doc_id = doc_data.document_id
+        if not success:
             return PdfUploadResult(
                 document_id=doc_id,
-                title="",
+                title=doc_data.title,
                 success=False,
                 total_chunks=0,
                 chunks_info=[],
                 processing_metadata={},
-                error_message=str(e),
+                error_message="Failed to index document in Elasticsearch",
             )
 
+        logger.info(
+            f"Uploaded PDF from MinIO: {doc_id} ({len(doc_data.chunks)} chunks) "
+            f"from {bucket_name}/{object_path}"
+        )
+
+        return PdfUploadResult(
+            document_id=doc_id,
+            title=doc_data.title,
+            success=True,
+            total_chunks=len(doc_data.chunks),
+            chunks_info=_iter_chunks_info(pdf_result.chunks),
+            processing_metadata={
+                "total_pages": pdf_result.total_pages,
+                "total_elements": pdf_result.total_elements,
+                "total_chunks": len(pdf_result.chunks),
+                "processing_time_ms": pdf_result.processing_time_ms,
+                "pdf_title": pdf_result.document_title,
+                "pdf_author": pdf_result.pdf_metadata.get("author", ""),
+            },
+        )
+
+
+def _iter_chunks_info(chunks: list[PdfChunk], preview_chars: int = 200) -> Iterator[dict]:
+    """Yield response info for each PDF chunk as the caller consumes it."""
+    for chunk in chunks:
+        text = chunk.text
+        yield {
+            "chunk_id": chunk.chunk_id,
+            "section_title": chunk.section_title,
+            "content_preview": text[:preview_chars] + "..." if len(text) > preview_chars else text,
+            "element_type": chunk.element_type,
+            "position": chunk.position,
+            "word_count": chunk.word_count,
+        }
+
+
+def _iter_chunk_sections(chunks: list[dict]) -> Iterator[str]:
+    """Yield the content sections of stored PDF chunks."""
+    for chunk in chunks:
+        yield f"## {chunk.get('section_title', '')}\n{chunk.get('text', '')}"
+
+
+def _process_pdf_from_minio(
+    minio_client,
+    pdf_processor,
+    bucket_name: str,
+    object_path: str,
+    document_id: str,
+    on_chunk: Optional[Callable[[PdfChunk], None]] = None,
+) -> PdfProcessingResult:
+    """Download a PDF from MinIO and extract its chunks."""
+    # Check if object exists
+    if not minio_client.object_exists(bucket_name, object_path):
+        return PdfProcessingResult(
+            success=False,
+            document_title="",
+            error_message=f"Object not found: {bucket_name}/{object_path}",
+        )
+
+    # Download PDF to temp file
+    local_path = minio_client.download_file(bucket_name, object_path)
+    if not local_path:
+        return PdfProcessingResult(
+            success=False,
+            document_title="",
+            error_message="Failed to download file from MinIO",
+        )
+
+    try:
+        return pdf_processor.process_pdf(
+            pdf_path=local_path, document_id=document_id, on_chunk=on_chunk
+        )
+    finally:
+        # Clean up temp file
+        if os.path.exists(local_path):
+            os.remove(local_path)
+
+
+def _process_pdf_worker(
+    bucket_name: str, object_path: str, document_id: str
+) -> PdfProcessingResult:
+    """Process one MinIO PDF inside a worker process."""
+    try:
+        return _process_pdf_from_minio(
+            get_minio_client(), get_pdf_processor(), bucket_name, object_path, document_id
+        )
+    except Exception as e:
+        logger.error(f"Failed to process {bucket_name}/{object_path}: {e}", exc_info=True)
+        return PdfProcessingResult(success=False, document_title="", error_message=str(e))
+
 
 # Singleton instance
 _document_manager: Optional[DocumentManager] = None
@@ -1,24 +1,61 @@
 """Lexical matching utilities to reduce false positives."""
 
 import re
+from dataclasses import dataclass
+from hashlib import blake2b
 from typing import Optional
 from difflib import SequenceMatcher
 
+import numpy as np
+
+try:
+    from xxhash import xxh3_64_intdigest as _hash_token
+except ImportError:  # xxhash not installed, use a slower but equally stable hash
+    def _hash_token(token: str) -> int:
+        return int.from_bytes(blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+@dataclass(slots=True)
+class LexicalFeatures:
+    """Normalized text and its token hashes, reusable across comparisons."""
+
+    normalized: str
+    hashes: np.ndarray
+
+    @classmethod
+    def from_stored(cls, normalized: str, hashes: bytes) -> "LexicalFeatures":
+        """Rebuild features persisted with encode_token_hashes()."""
+        return cls(normalized, decode_token_hashes(hashes))
+
+    def encoded_hashes(self) -> bytes:
+        """Return the token hashes as bytes for storage."""
+        return encode_token_hashes(self.hashes)
+
+
+def lexical_features(text: str) -> LexicalFeatures:
+    """Normalize and hash a text once for repeated comparisons."""
+    normalized = normalize_for_comparison(text)
+    return LexicalFeatures(normalized, token_hashes(normalized))
+
 
 def calculate_lexical_similarity(text1: str, text2: str) -> float:
     """Calculate lexical similarity using multiple methods.
 
     Returns a score between 0 and 1.
     """
-    # Normalize texts
-    text1 = normalize_for_comparison(text1)
-    text2 = normalize_for_comparison(text2)
+    return _lexical_similarity(lexical_features(text1), lexical_features(text2))
+
+
+def _lexical_similarity(features1: LexicalFeatures, features2: LexicalFeatures) -> float:
+    """Calculate lexical similarity from precomputed features."""
+    text1 = features1.normalized
+    text2 = features2.normalized
 
     if not text1 or not text2:
         return 0.0
 
     # Method 1: Jaccard similarity (word overlap)
-    jaccard = jaccard_similarity(text1, text2)
+    jaccard = jaccard_from_hashes(features1.hashes, features2.hashes)
 
     # Method 2: Sequence matcher (longest common subsequence ratio)
     sequence = SequenceMatcher(None, text1, text2).ratio()
@@ -64,6 +101,40 @@ def jaccard_similarity(text1: str, text2: str) -> float:
     return len(intersection) / len(union)
 
 
+def token_hashes(text: str) -> np.ndarray:
+    """Hash the words of a normalized text into a sorted array of unique uint64.
+
+    Unlike the built-in hash(), the hashes are stable across processes, so
+    they can be computed once and stored alongside the text.
+    """
+    words = text.split()
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    hashes = np.fromiter((_hash_token(w) for w in words), dtype=np.uint64, count=len(words))
+    return np.unique(hashes)
+
+
+def jaccard_from_hashes(hashes1: np.ndarray, hashes2: np.ndarray) -> float:
+    """Calculate Jaccard similarity from token_hashes() arrays."""
+    if not hashes1.size or not hashes2.size:
+        return 0.0
+
+    intersection = np.intersect1d(hashes1, hashes2, assume_unique=True).size
+    union = hashes1.size + hashes2.size - intersection
+
+    return intersection / union
+
+
+def encode_token_hashes(hashes: np.ndarray) -> bytes:
+    """Serialize token_hashes() as a little-endian uint64 buffer."""
+    return hashes.astype("<u8", copy=False).tobytes()
+
+
+def decode_token_hashes(data: bytes) -> np.ndarray:
+    """Read a buffer written by encode_token_hashes() without copying."""
+    return np.frombuffer(data, dtype="<u8")
+
+
 def ngram_similarity(text1: str, text2: str, n: int = 2) -> float:
     """Calculate n-gram overlap similarity."""
     def get_ngrams(text: str, n: int) -> set:
@@ -84,22 +155,49 @@ def ngram_similarity(text1: str, text2: str, n: int = 2) -> float:
     return len(intersection) / len(union)
 
 
+# Common citation patterns
+CITATION_PATTERNS = (
+    r'\([^)]*\d{4}[^)]*\)',  # (Author, 2024)
+    r'\[[\d,\s]+\]',         # [1], [1, 2]
+    r'Nguồn:',               # Nguồn:
+    r'theo\s+\w+',           # theo Nguyen
+    r'và\s+đtg',             # và đtg (và đồng tác giả)
+    r'et\s+al',              # et al
+)
+
+# All patterns in one alternation: a single scan instead of one per pattern
+_CITATION_RE = re.compile("|".join(CITATION_PATTERNS), re.IGNORECASE)
+
+try:
+    import hyperscan
+
+    _citation_db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    _citation_db.compile(
+        expressions=[p.encode() for p in CITATION_PATTERNS],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP]
+        * len(CITATION_PATTERNS),
+    )
+except Exception:  # hyperscan missing or pattern unsupported, use the compiled regex
+    _citation_db = None
+
+
 def has_citation(text: str) -> bool:
     """Check if text contains citations."""
-    # Common citation patterns
-    patterns = [
-        r'\([^)]*\d{4}[^)]*\)',  # (Author, 2024)
-        r'\[[\d,\s]+\]',         # [1], [1, 2]
-        r'Nguồn:',               # Nguồn:
-        r'theo\s+\w+',           # theo Nguyen
-        r'và\s+đtg',             # và đtg (và đồng tác giả)
-        r'et\s+al',              # et al
-    ]
-
-    for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    if _citation_db is None:
+        return _CITATION_RE.search(text) is not None
+
+    found = False
+
+    def on_match(*_) -> bool:
+        nonlocal found
+        found = True
+        return True  # Stop scanning at the first match
+
+    try:
+        _citation_db.scan(text.encode(), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return found
 
 
 def calculate_asymmetric_lexical_similarity(input_text: str, matched_text: str) -> float:
@@ -111,25 +209,34 @@ def calculate_asymmetric_lexical_similarity(input_text: str, matched_text: str)
     This handles the case where a long input contains a plagiarized section
     that matches a shorter chunk in the database.
     """
-    input_normalized = normalize_for_comparison(input_text)
-    matched_normalized = normalize_for_comparison(matched_text)
+    return _asymmetric_lexical_similarity(
+        lexical_features(input_text), lexical_features(matched_text)
+    )
+
+
+def _asymmetric_lexical_similarity(
+    input_features: LexicalFeatures, matched_features: LexicalFeatures
+) -> float:
+    """Calculate asymmetric lexical similarity from precomputed features."""
+    input_normalized = input_features.normalized
+    matched_normalized = matched_features.normalized
 
     if not input_normalized or not matched_normalized:
         return 0.0
 
-    input_words = set(input_normalized.split())
-    matched_words = set(matched_normalized.split())
+    input_words = input_features.hashes
+    matched_words = matched_features.hashes
 
     # If texts are similar length, use symmetric comparison
-    len_ratio = len(matched_words) / len(input_words) if input_words else 0
+    len_ratio = matched_words.size / input_words.size if input_words.size else 0
 
     if len_ratio > 0.7:  # Similar lengths - use symmetric
-        return calculate_lexical_similarity(input_text, matched_text)
+        return _lexical_similarity(input_features, matched_features)
 
     # Asymmetric: check how much of matched_text is found in input_text
     # This is "containment" similarity - what % of matched words are in input
-    intersection = input_words & matched_words
-    containment = len(intersection) / len(matched_words) if matched_words else 0.0
+    intersection = np.intersect1d(input_words, matched_words, assume_unique=True)
+    containment = intersection.size / matched_words.size if matched_words.size else 0.0
 
     # Also check sequence similarity on the overlapping portion
     # Find the best matching substring in input that covers matched text
@@ -146,6 +253,9 @@ def calculate_combined_similarity(
     matched_text: str,
     semantic_weight: float = 0.5,
     lexical_weight: float = 0.5,
+    mode: str = "asymmetric",
+    input_features: Optional[LexicalFeatures] = None,
+    matched_features: Optional[LexicalFeatures] = None,
 ) -> tuple[float, dict]:
     """Calculate combined similarity score.
 
@@ -155,16 +265,30 @@ def calculate_combined_similarity(
         matched_text: Matched text from database
         semantic_weight: Weight for semantic score
         lexical_weight: Weight for lexical score
+        mode: "asymmetric" (containment-aware, default) or "symmetric"
+        input_features: Precomputed lexical_features(input_text), if available
+        matched_features: Precomputed lexical_features(matched_text), if available
 
     Returns:
         Tuple of (combined_score, details_dict)
     """
-    # Use asymmetric lexical similarity to handle different text lengths
-    lexical_score = calculate_asymmetric_lexical_similarity(input_text, matched_text)
+    if input_features is None:
+        input_features = lexical_features(input_text)
+    if matched_features is None:
+        matched_features = lexical_features(matched_text)
+
+    if mode == "asymmetric":
+        # Use asymmetric lexical similarity to handle different text lengths
+        lexical_score = _asymmetric_lexical_similarity(input_features, matched_features)
+    elif mode == "symmetric":
+        lexical_score = _lexical_similarity(input_features, matched_features)
+    else:
+        raise ValueError(f"Unknown similarity mode: {mode}")
 
     # If input has citation, reduce the score
+    cited = has_citation(input_text)
     citation_penalty = 0.0
-    if has_citation(input_text):
+    if cited:
         citation_penalty = 0.15  # Reduce 15% if properly cited
 
     combined = (semantic_score * semantic_weight) + (lexical_score * lexical_weight)
@@ -174,7 +298,7 @@ def calculate_combined_similarity(
         "semantic_score": semantic_score,
         "lexical_score": lexical_score,
         "combined_score": combined,
-        "has_citation": has_citation(input_text),
+        "has_citation": cited,
         "citation_penalty": citation_penalty,
     }
 
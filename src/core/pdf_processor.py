@@ -1,31 +1,67 @@
 """PDF processing utilities using unstructured library."""
 
+from __future__ import annotations
+
 import gc
+import hashlib
+import io
 import logging
+import mmap
+import multiprocessing
 import os
+import pickle
+import queue
+import tempfile
+import threading
 import time
-from typing import Optional
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from unstructured.partition.pdf import partition_pdf
-from unstructured.documents.elements import (
-    Title,
-    NarrativeText,
-    ListItem,
-    Table,
-    Header,
-    Footer,
-    Text, Element,
-)
+from pypdf import PdfReader, PdfWriter
+
+if TYPE_CHECKING:
+    from unstructured.documents.elements import Element
 
 from src.config import get_settings
 from src.core.chunker import TextChunker
 
 logger = logging.getLogger(__name__)
 
+try:
+    from blake3 import blake3
+
+    def _pdf_fingerprint(data: bytes | mmap.mmap) -> str:
+        """Hash file content with multithreaded BLAKE3."""
+        return blake3(data, max_threads=blake3.AUTO).hexdigest()
+
+except ImportError:  # blake3 not installed, use SHA-256
+
+    def _pdf_fingerprint(data: bytes | mmap.mmap) -> str:
+        """Hash file content with SHA-256."""
+        return hashlib.sha256(data).hexdigest()
+
+# Marks the end of a pipeline queue
+_DONE = object()
+
+# Leading elements kept for title and metadata extraction
+_HEAD_ELEMENTS = 10
+
+# Pages per worker task when a large PDF is partitioned in parallel
+_PARALLEL_SPLIT_PAGES = 10
 
-@dataclass
+# What _iter_sections does with an element, by class
+_SKIP = "skip"
+_TITLE = "title"
+_CONTENT = "content"
+_IGNORE = ""
+
+
+@dataclass(slots=True)
 class PdfSection:
     """A section of PDF document with title and content."""
 
@@ -36,7 +72,7 @@ class PdfSection:
     word_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PdfChunk:
     """A chunk ready for indexing with embedding."""
 
@@ -48,7 +84,7 @@ class PdfChunk:
     word_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PdfProcessingResult:
     """Result of PDF processing."""
 
@@ -65,14 +101,6 @@ class PdfProcessingResult:
 class PdfProcessor:
     """Process PDF documents and extract structured content."""
 
-    # Element types that indicate section headers/titles
-    TITLE_TYPES = (Title, Header)
-
-    # Element types to include in content
-    CONTENT_TYPES = (NarrativeText, ListItem, Table, Text)
-
-    # Element types to skip
-    SKIP_TYPES = (Footer,)
 
     def __init__(
         self,
@@ -89,18 +117,73 @@ class PdfProcessor:
             chunk_overlap=self.chunk_overlap,
             min_chunk_size=self.min_chunk_size,
         )
+        # Started on first use and shared by every parallel partition and
+        # batch upload, so the workers load the OCR models once, not per call
+        self._range_executor: Optional[ProcessPoolExecutor] = None
+        self._range_executor_lock = threading.Lock()
+
+    # unstructured pulls in torch/onnxruntime on import, so element classes
+    # are only resolved once a PDF is actually processed
+
+    @cached_property
+    def TITLE_TYPES(self) -> tuple[type, ...]:
+        """Element types that indicate section headers/titles."""
+        elements = _elements()
+        return (elements.Title, elements.Header)
+
+    @cached_property
+    def CONTENT_TYPES(self) -> tuple[type, ...]:
+        """Element types to include in content."""
+        elements = _elements()
+        return (elements.NarrativeText, elements.ListItem, elements.Table, elements.Text)
+
+    @cached_property
+    def SKIP_TYPES(self) -> tuple[type, ...]:
+        """Element types to skip."""
+        return (_elements().Footer,)
+
+    @cached_property
+    def _class_action(self) -> dict[type, str]:
+        """Map element classes to their grouping action, one lookup per element."""
+        action = {cls: _SKIP for cls in self.SKIP_TYPES}
+        for cls in self.TITLE_TYPES:
+            action.setdefault(cls, _TITLE)
+        for cls in self.CONTENT_TYPES:
+            action.setdefault(cls, _CONTENT)
+        return action
+
+    def _resolve_action(self, cls: type) -> str:
+        """Resolve and remember the action of an element subclass not in the map."""
+        if issubclass(cls, self.SKIP_TYPES):
+            action = _SKIP
+        elif issubclass(cls, self.TITLE_TYPES):
+            action = _TITLE
+        elif issubclass(cls, self.CONTENT_TYPES):
+            action = _CONTENT
+        else:
+            action = _IGNORE
+        self._class_action[cls] = action
+        return action
 
     def cut_page(self, elements: list[Element]) -> list[Element]:
-        # Khởi tạo danh sách sẽ chứa các element sau điểm cắt
-        elements_entry = []
+        page_break = _elements().PageBreak
+        return [el for el in self._iter_cut_page(elements) if not isinstance(el, page_break)]
 
+    def _iter_cut_page(self, elements: Iterable[Element]) -> Iterator[Element]:
+        """Yield elements after the table of contents, keeping every PageBreak."""
+        page_break = _elements().PageBreak
         point_cut = False
 
         words_cut = ["MỤC LỤC", "TABLE OF CONTENTS", "DANH MỤC"]
 
         for el in elements:
 
-            # Bỏ qua các PageBreak và các element không có nội dung text
+            # PageBreak được giữ lại để đếm trang và chia trang cho pipeline
+            if isinstance(el, page_break):
+                yield el
+                continue
+
+            # Bỏ qua các element không có nội dung text
             if not el.text:
                 continue
 
@@ -116,17 +199,16 @@ class PdfProcessor:
                     # Ở đây chúng ta bỏ qua chính element chứa từ khóa "MỤC LỤC"
                     continue
             else:
-                # Nếu cờ đã được bật (point_cut == True), thêm element vào danh sách kết quả
-                elements_entry.append(el)
-
-        return elements_entry
-
+                # Nếu cờ đã được bật (point_cut == True), trả về element
+                yield el
 
     def process_pdf(
         self,
         pdf_path: str,
         document_id: str,
         extract_images: bool = False,
+        force_refresh: bool = False,
+        on_chunk: Optional[Callable[[PdfChunk], None]] = None,
     ) -> PdfProcessingResult:
         """
         Process a PDF file and extract structured content with titles.
@@ -135,89 +217,338 @@ class PdfProcessor:
             pdf_path: Path to the PDF file
             document_id: Unique document identifier for chunk IDs
             extract_images: Whether to extract images (requires additional deps)
+            force_refresh: Re-partition even if the PDF is in the cache
+            on_chunk: Called with each chunk as soon as it is created
 
         Returns:
             PdfProcessingResult with extracted chunks
         """
         start_time = time.time()
 
-        if not os.path.exists(pdf_path):
+        try:
+            # The file is opened once for counting pages, hashing and partitioning
+            with _open_pdf(pdf_path) as (f, data):
+                min_pages = self.settings.pdf_parallel_min_pages
+                if min_pages > 0:
+                    reader = PdfReader(f)
+                    if len(reader.pages) >= min_pages:
+                        return self._process_pdf_parallel(
+                            pdf_path, reader, data, document_id, extract_images,
+                            force_refresh, on_chunk, start_time,
+                        )
+
+                # Extract elements from PDF using unstructured
+                logger.info(f"Processing PDF: {pdf_path}")
+                print(f"[1/3] Loading PDF: {Path(pdf_path).name}...", flush=True)
+                raw_elements = self._partition_cached(
+                    pdf_path, data, extract_images, force_refresh
+                )
+
+            return self._build_result(
+                raw_elements, pdf_path, document_id, start_time, on_chunk
+            )
+
+        except FileNotFoundError:
             return PdfProcessingResult(
                 success=False,
                 document_title="",
                 error_message=f"PDF file not found: {pdf_path}",
             )
+        except Exception as e:
+            logger.error(f"Failed to process PDF: {e}", exc_info=True)
+            return PdfProcessingResult(
+                success=False,
+                document_title="",
+                error_message=str(e),
+            )
+        finally:
+            # Force garbage collection to release OCR/ML models memory
+            gc.collect()
 
-        try:
-            # Extract elements from PDF using unstructured
-            logger.info(f"Processing PDF: {pdf_path}")
-            print(f"[1/5] Loading PDF: {Path(pdf_path).name}...", flush=True)
-
-            elements_tmp = partition_pdf(
-                filename=pdf_path,
-                strategy="hi_res",  # hi_res: with OCR + deep learning
-                ocr_agent="unstructured.partition.utils.ocr_models.paddle_ocr.OCRAgentPaddle",
-                include_page_breaks=True,
-                infer_table_structure=True,
-                extract_images_in_pdf=extract_images,
+    def _process_pdf_parallel(
+        self,
+        pdf_path: str,
+        reader: PdfReader,
+        data: mmap.mmap,
+        document_id: str,
+        extract_images: bool,
+        force_refresh: bool,
+        on_chunk: Optional[Callable[[PdfChunk], None]],
+        start_time: float,
+    ) -> PdfProcessingResult:
+        """Partition page ranges of a large PDF in parallel processes.
+
+        The PDF is split into files of _PARALLEL_SPLIT_PAGES pages, each
+        partitioned in a worker process. Results are fed to the section/chunk
+        pipeline in page order as they complete.
+        """
+        cache_key = self._cache_key(data, extract_images)
+        cached = None if force_refresh else self._load_cached_elements(cache_key)
+        if cached is not None:
+            return self._build_result(
+                cached, pdf_path, document_id, start_time, on_chunk
             )
-            elements = self.cut_page(elements_tmp)
-            print(f"[2/5] PDF loaded - extracted {len(elements)} elements", flush=True)
-
-            if not elements:
-                return PdfProcessingResult(
-                    success=False,
-                    document_title="",
-                    error_message="No content extracted from PDF",
+
+        logger.info(f"Processing PDF in parallel: {pdf_path} ({len(reader.pages)} pages)")
+        print(
+            f"[1/3] Loading PDF: {Path(pdf_path).name} "
+            f"({len(reader.pages)} pages, {_PARALLEL_SPLIT_PAGES} per worker)...",
+            flush=True,
+        )
+
+        executor = self.worker_pool()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            futures = [
+                # Elements keep the original file name, not the split's
+                executor.submit(_partition_range, path, extract_images, None, pdf_path)
+                for path in _split_pdf(reader, tmp_dir, _PARALLEL_SPLIT_PAGES)
+            ]
+            raw_elements: list[Element] = []
+            try:
+                result = self._build_result(
+                    _collect(_iter_range_elements(futures), raw_elements),
+                    pdf_path, document_id, start_time, on_chunk,
+                )
+                self._store_cached_elements(cache_key, raw_elements)
+                return result
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def worker_pool(self) -> ProcessPoolExecutor:
+        """Shared pool of pdf_parallel_workers processes, started on first use."""
+        with self._range_executor_lock:
+            if self._range_executor is None:
+                # spawn rather than fork: the parent may already run gRPC/HTTP threads
+                self._range_executor = ProcessPoolExecutor(
+                    max_workers=max(1, self.settings.pdf_parallel_workers),
+                    mp_context=multiprocessing.get_context("spawn"),
                 )
+            return self._range_executor
 
-            # Extract document title (first Title element or filename)
-            print("[3/5] Extracting document title...", flush=True)
-            document_title = self._extract_document_title(elements, pdf_path)
+    def close(self):
+        """Stop the shared worker processes."""
+        with self._range_executor_lock:
+            if self._range_executor is not None:
+                self._range_executor.shutdown(wait=False, cancel_futures=True)
+                self._range_executor = None
 
-            # Group elements by sections
-            print("[4/5] Grouping elements into sections...", flush=True)
-            sections = self._group_into_sections(elements)
-            print(f"       Created {len(sections)} sections", flush=True)
+    def _partition_cached(
+        self,
+        pdf_path: str,
+        data: mmap.mmap,
+        extract_images: bool,
+        force_refresh: bool,
+    ) -> list[Element]:
+        """Partition the mapped PDF, reusing a cached result when possible."""
+        cache_key = self._cache_key(data, extract_images)
+        raw_elements = None if force_refresh else self._load_cached_elements(cache_key)
+        if raw_elements is None:
+            raw_elements = _partition_range(pdf_path, extract_images, data)
+            self._store_cached_elements(cache_key, raw_elements)
+        return raw_elements
+
+    def _cache_key(self, data: mmap.mmap, extract_images: bool) -> Optional[str]:
+        """Key partition results by file content and partition options."""
+        if not self.settings.pdf_cache_dir:
+            return None
 
-            # Convert sections to chunks
-            print("[5/5] Converting sections to chunks...", flush=True)
-            chunks = self._sections_to_chunks(sections, document_id)
+        return f"{_pdf_fingerprint(data)}_hi_res_{int(extract_images)}"
 
-            processing_time = int((time.time() - start_time) * 1000)
-            print(f"[DONE] Processed {len(chunks)} chunks in {processing_time}ms", flush=True)
+    def _load_cached_elements(self, cache_key: Optional[str]) -> Optional[list[Element]]:
+        """Load partitioned elements from the cache, None on miss."""
+        if cache_key is None:
+            return None
 
-            logger.info(
-                f"Processed PDF: {len(elements)} elements -> {len(chunks)} chunks "
-                f"in {processing_time}ms"
-            )
+        cache_path = Path(self.settings.pdf_cache_dir) / f"{cache_key}.pkl"
+        try:
+            with open(cache_path, "rb") as f:
+                elements = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable PDF cache entry {cache_path}: {e}")
+            return None
 
-            return PdfProcessingResult(
-                success=True,
-                document_title=document_title,
-                chunks=chunks,
-                total_pages=self._count_pages(elements),
-                total_elements=len(elements),
-                processing_time_ms=processing_time,
-                pdf_metadata=self._extract_metadata(elements),
-            )
+        logger.info(f"Using cached partition result: {cache_path}")
+        return elements
+
+    def _store_cached_elements(
+        self, cache_key: Optional[str], elements: list[Element]
+    ) -> None:
+        """Store partitioned elements in the cache."""
+        if cache_key is None:
+            return
 
+        cache_dir = Path(self.settings.pdf_cache_dir)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(elements, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_dir / f"{cache_key}.pkl")
         except Exception as e:
-            logger.error(f"Failed to process PDF: {e}", exc_info=True)
+            logger.warning(f"Failed to cache partition result: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _build_result(
+        self,
+        raw_elements: Iterable[Element],
+        pdf_path: str,
+        document_id: str,
+        start_time: float,
+        on_chunk: Optional[Callable[[PdfChunk], None]] = None,
+    ) -> PdfProcessingResult:
+        """Run the section/chunk pipeline over partitioned elements."""
+        print("[2/3] Grouping elements into sections and chunks...", flush=True)
+        head, element_count, total_pages, section_count, chunks = self._run_pipeline(
+            raw_elements, document_id, on_chunk
+        )
+        print(
+            f"       {element_count} elements -> {section_count} sections", flush=True
+        )
+
+        if not element_count:
             return PdfProcessingResult(
                 success=False,
                 document_title="",
-                error_message=str(e),
+                error_message="No content extracted from PDF",
             )
+
+        # Extract document title (first Title element or filename)
+        document_title = self._extract_document_title(head, pdf_path)
+
+        processing_time = int((time.time() - start_time) * 1000)
+        print(f"[3/3] Processed {len(chunks)} chunks in {processing_time}ms", flush=True)
+
+        logger.info(
+            f"Processed PDF: {element_count} elements -> {len(chunks)} chunks "
+            f"in {processing_time}ms"
+        )
+
+        return PdfProcessingResult(
+            success=True,
+            document_title=document_title,
+            chunks=chunks,
+            total_pages=total_pages,
+            total_elements=element_count,
+            processing_time_ms=processing_time,
+            pdf_metadata=self._extract_metadata(head),
+        )
+
+    def _run_pipeline(
+        self,
+        raw_elements: Iterable[Element],
+        document_id: str,
+        on_chunk: Optional[Callable[[PdfChunk], None]] = None,
+    ) -> tuple[list[Element], int, int, int, list[PdfChunk]]:
+        """Run page filtering, section grouping and chunking as overlapping stages.
+
+        Stages run in their own threads, connected by bounded queues so a
+        slow stage applies backpressure instead of buffering the document.
+        Page and element counts are taken during the same pass, and only the
+        first elements are kept for title and metadata extraction.
+
+        Returns:
+            Tuple of (head_elements, element_count, total_pages, section_count, chunks)
+        """
+        max_inflight = self.settings.pdf_max_inflight_pages
+        pages_q: queue.Queue = queue.Queue(maxsize=max_inflight)
+        sections_q: queue.Queue = queue.Queue(maxsize=max_inflight)
+        head: list[Element] = []
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-stage") as executor:
+            pages_future = executor.submit(self._stage_pages, raw_elements, pages_q, head)
+            sections_future = executor.submit(self._stage_group, pages_q, sections_q)
+            chunks = self._stage_chunk(sections_q, document_id, on_chunk)
+            total_pages, element_count = pages_future.result()
+            section_count = sections_future.result()
+
+        return head, element_count, total_pages, section_count, chunks
+
+    def _stage_pages(
+        self,
+        raw_elements: Iterable[Element],
+        pages_q: queue.Queue,
+        head: list[Element],
+    ) -> tuple[int, int]:
+        """Stage 1: drop the front matter and emit one element list per page.
+
+        The first _HEAD_ELEMENTS kept elements are appended to head.
+
+        Returns:
+            Tuple of (page_count, element_count)
+        """
+        page_break = _elements().PageBreak
+        page_count = 1
+        element_count = 0
+        page: list[Element] = []
+        try:
+            for el in self._iter_cut_page(raw_elements):
+                if isinstance(el, page_break):
+                    page_count += 1
+                    if page:
+                        pages_q.put(page)
+                        page = []
+                    continue
+                if element_count < _HEAD_ELEMENTS:
+                    head.append(el)
+                element_count += 1
+                page.append(el)
+            if page:
+                pages_q.put(page)
         finally:
-            # Force garbage collection to release OCR/ML models memory
-            gc.collect()
+            pages_q.put(_DONE)
+        return page_count, element_count
+
+    def _stage_group(self, pages_q: queue.Queue, sections_q: queue.Queue) -> int:
+        """Stage 2: group page elements into sections as they arrive.
+
+        Returns:
+            Number of sections created
+        """
+        pages = _drain(pages_q)
+        count = 0
+        try:
+            for section in self._iter_sections(el for page in pages for el in page):
+                sections_q.put(section)
+                count += 1
+        except BaseException:
+            # Keep consuming so stage 1 doesn't block on a full queue
+            for _ in pages:
+                pass
+            raise
+        finally:
+            sections_q.put(_DONE)
+        return count
+
+    def _stage_chunk(
+        self,
+        sections_q: queue.Queue,
+        document_id: str,
+        on_chunk: Optional[Callable[[PdfChunk], None]] = None,
+    ) -> list[PdfChunk]:
+        """Stage 3: split sections into chunks, handing each to on_chunk."""
+        sections = _drain(sections_q)
+        try:
+            chunks = []
+            for chunk in self._sections_to_chunks(sections, document_id):
+                if on_chunk is not None:
+                    on_chunk(chunk)
+                chunks.append(chunk)
+            return chunks
+        except BaseException:
+            for _ in sections:
+                pass
+            raise
 
     def _extract_document_title(self, elements: list, pdf_path: str) -> str:
         """Extract document title from elements or filename."""
         # Try to find first Title element
-        for el in elements[:10]:  # Check first 10 elements
-            if isinstance(el, Title):
+        title_type = _elements().Title
+        for el in elements[:_HEAD_ELEMENTS]:  # Check first 10 elements
+            if isinstance(el, title_type):
                 title = str(el).strip()
                 if len(title) > 3:  # Avoid very short titles
                     return title
@@ -232,11 +563,13 @@ class PdfProcessor:
         return (' . ' * dot_threshold in text) or ('.' * dot_threshold in text.replace(' ', ''))
 
     def _group_into_sections(self, elements: list) -> list[PdfSection]:
-        # ... (Các dòng khai báo và khởi tạo giữ nguyên)
-        sections: list[PdfSection] = []
+        return list(self._iter_sections(elements))
+
+    def _iter_sections(self, elements: Iterable[Element]) -> Iterator[PdfSection]:
+        """Yield each section as soon as the next title closes it."""
         current_title = None  # Default section name
         current_content: list[str] = []
-        current_types: list[str] = []
+        current_type_counts: Counter[str] = Counter()
         position = 0
 
         # 1. ĐỊNH NGHĨA CÁC TIÊU ĐỀ CẦN LOẠI TRỪ (Mục lục, Danh sách, v.v.)
@@ -247,11 +580,17 @@ class PdfProcessor:
             "KÝ HIỆU", "TỪ VIẾT TẮT", "INTRODUCTION", "GIỚI THIỆU", "TÀI LIỆU THAM KHẢO"
         ]
 
+        class_action = self._class_action
+        normalize = self.chunker.normalize_text
+
         for el in elements:
-            el_type = type(el).__name__
+            cls = type(el)
+            action = class_action.get(cls)
+            if action is None:
+                action = self._resolve_action(cls)
 
             # Skip footer elements
-            if isinstance(el, self.SKIP_TYPES):
+            if action == _SKIP:
                 continue
 
             el_text = str(el).strip()
@@ -263,9 +602,9 @@ class PdfProcessor:
                 continue  # Bỏ qua ngay lập tức vì đây là dòng mục lục
 
             # Check if this is a title/header (new section)
-            if isinstance(el, self.TITLE_TYPES):
+            if action == _TITLE:
 
-                new_title = str(el).strip()
+                new_title = el_text
 
                 # KIỂM TRA TỪ KHÓA LOẠI TRỪ
                 is_excluded = any(keyword in new_title.upper() for keyword in EXCLUDED_TITLES)
@@ -286,11 +625,11 @@ class PdfProcessor:
                         section = self._create_section(
                             title=current_title,
                             content_parts=current_content,
-                            element_types=current_types,
+                            type_counts=current_type_counts,
                             position=position,
                         )
                         if section:
-                            sections.append(section)
+                            yield section
                             position += 1
                     # Nếu current_title là None, nội dung hiện tại (Introduction) sẽ bị bỏ qua
                     # và current_content sẽ được reset ở bước tiếp theo.
@@ -298,14 +637,15 @@ class PdfProcessor:
                 # 2. Start new section
                 current_title = new_title or "Untitled Section"
                 current_content = []
-                current_types = []
+                current_type_counts = Counter()
 
             # Add content (dành cho CONTENT_TYPES và các elements bị loại trừ)
-            elif isinstance(el, self.CONTENT_TYPES):
-                text = str(el).strip()
+            elif action == _CONTENT:
+                # Normalize per element so the section is only joined once
+                text = normalize(el_text)
                 if text:
                     current_content.append(text)
-                    current_types.append(el_type)
+                    current_type_counts[cls.__name__] += 1
 
         # Don't forget the last section
         # ... (Giữ nguyên phần này)
@@ -313,24 +653,23 @@ class PdfProcessor:
             section = self._create_section(
                 title=current_title,
                 content_parts=current_content,
-                element_types=current_types,
+                type_counts=current_type_counts,
                 position=position,
             )
             if section:
-                sections.append(section)
-
-        return sections
+                yield section
 
     def _create_section(
         self,
         title: str,
         content_parts: list[str],
-        element_types: list[str],
+        type_counts: Counter[str],
         position: int,
     ) -> Optional[PdfSection]:
-        """Create a PdfSection from content parts."""
-        content = "\n\n".join(content_parts)
-        content = self.chunker.normalize_text(content)
+        """Create a PdfSection from normalized content parts."""
+        # Parts are normalized and non-empty, so joining them with a space
+        # equals normalizing the "\n\n"-joined text
+        content = " ".join(content_parts)
 
         if not content:
             return None
@@ -339,12 +678,9 @@ class PdfProcessor:
 
         # Determine primary element type
         element_type = "Mixed"
-        if element_types:
+        if type_counts:
             # Most common type
-            type_counts = {}
-            for t in element_types:
-                type_counts[t] = type_counts.get(t, 0) + 1
-            element_type = max(type_counts, key=type_counts.get)
+            element_type = type_counts.most_common(1)[0][0]
 
         return PdfSection(
             section_title=title,
@@ -355,15 +691,16 @@ class PdfProcessor:
         )
 
     def _sections_to_chunks(
-        self, sections: list[PdfSection], document_id: str
-    ) -> list[PdfChunk]:
+        self, sections: Iterable[PdfSection], document_id: str
+    ) -> Iterator[PdfChunk]:
         """
         Convert sections to chunks, splitting large sections if needed.
 
         Each section is chunked if it exceeds chunk_size, preserving the section title.
         Chunks with content shorter than min_content_length (from settings) are skipped.
+        Chunks are yielded section by section, so callers can start embedding
+        before the whole document is chunked.
         """
-        chunks: list[PdfChunk] = []
         chunk_position = 0
         skipped_count = 0
 
@@ -388,11 +725,12 @@ class PdfProcessor:
                     position=chunk_position,
                     word_count=section.word_count,
                 )
-                chunks.append(chunk)
+                yield chunk
                 chunk_position += 1
             else:
                 # Split section into multiple chunks
-                text_chunks = self.chunker.chunk_text(section.content)
+                # Section content is normalized in _iter_sections
+                text_chunks = self.chunker.chunk_text_normalized(section.content)
 
                 for i, text_chunk in enumerate(text_chunks):
                     # Skip sub-chunks that are too short
@@ -414,24 +752,12 @@ class PdfProcessor:
                         position=chunk_position,
                         word_count=text_chunk.word_count,
                     )
-                    chunks.append(chunk)
+                    yield chunk
                     chunk_position += 1
 
         if skipped_count > 0:
             logger.info(f"Skipped {skipped_count} chunks with content < {self.settings.min_content_length} chars")
 
-        return chunks
-
-    def _count_pages(self, elements: list) -> int:
-        """Count pages from page break elements."""
-        from unstructured.documents.elements import PageBreak
-
-        page_count = 1
-        for el in elements:
-            if isinstance(el, PageBreak):
-                page_count += 1
-        return page_count
-
     def _extract_metadata(self, elements: list) -> dict:
         """Extract any available metadata from elements."""
         metadata = {}
@@ -449,6 +775,90 @@ class PdfProcessor:
         return metadata
 
 
+@cache
+def _elements():
+    """Import unstructured's element classes on first use."""
+    from unstructured.documents import elements
+
+    return elements
+
+
+@contextmanager
+def _open_pdf(pdf_path: str) -> Iterator[tuple[BinaryIO, mmap.mmap]]:
+    """Open a PDF once, yielding the file and a read-only map of it."""
+    with open(pdf_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        yield f, data
+
+
+def _partition_range(
+    pdf_path: str,
+    extract_images: bool = False,
+    data: Optional[mmap.mmap] = None,
+    metadata_filename: Optional[str] = None,
+) -> list[Element]:
+    """Partition a PDF with unstructured.
+
+    Reads from data instead of reopening pdf_path when it is given.
+    Elements are attributed to metadata_filename when it is given.
+    Module-level so ProcessPoolExecutor workers can run it.
+    """
+    from unstructured.partition.pdf import partition_pdf
+
+    if data is not None:
+        source = {"file": io.BytesIO(data), "metadata_filename": pdf_path}
+    else:
+        source = {"filename": pdf_path}
+    if metadata_filename:
+        source["metadata_filename"] = metadata_filename
+
+    return partition_pdf(
+        **source,
+        strategy="hi_res",  # hi_res: with OCR + deep learning
+        ocr_agent="unstructured.partition.utils.ocr_models.paddle_ocr.OCRAgentPaddle",
+        include_page_breaks=True,
+        infer_table_structure=True,
+        extract_images_in_pdf=extract_images,
+    )
+
+
+def _split_pdf(reader: PdfReader, out_dir: str, split_size: int) -> list[str]:
+    """Write consecutive page ranges of a PDF to separate files."""
+    paths = []
+    for start in range(0, len(reader.pages), split_size):
+        writer = PdfWriter()
+        for page in reader.pages[start:start + split_size]:
+            writer.add_page(page)
+        path = os.path.join(out_dir, f"pages_{start:05d}.pdf")
+        with open(path, "wb") as f:
+            writer.write(f)
+        paths.append(path)
+    return paths
+
+
+def _iter_range_elements(futures: list[Future]) -> Iterator[Element]:
+    """Yield partitioned elements of each page range in page order."""
+    for i, future in enumerate(futures):
+        if i:
+            # Each split is partitioned separately, restore the page boundary
+            yield _elements().PageBreak(text="")
+        yield from future.result()
+
+
+def _collect(elements: Iterable[Element], into: list[Element]) -> Iterator[Element]:
+    """Yield elements while keeping a copy in a list."""
+    for el in elements:
+        into.append(el)
+        yield el
+
+
+def _drain(q: queue.Queue) -> Iterator:
+    """Yield queue items until the _DONE sentinel."""
+    while (item := q.get()) is not _DONE:
+        yield item
+
+
 # Singleton instance
 _pdf_processor: Optional[PdfProcessor] = None
 
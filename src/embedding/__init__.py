@@ -1,4 +1,14 @@
 # Embedding layer (Ollama)
-from .ollama_embed import OllamaEmbeddingClient, get_ollama_client
+from .ollama_embed import (
+    BatchingOllamaClient,
+    OllamaEmbeddingClient,
+    get_batching_ollama_client,
+    get_ollama_client,
+)
 
-__all__ = ["OllamaEmbeddingClient", "get_ollama_client"]
+__all__ = [
+    "BatchingOllamaClient",
+    "OllamaEmbeddingClient",
+    "get_batching_ollama_client",
+    "get_ollama_client",
+]
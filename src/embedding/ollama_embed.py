@@ -1,14 +1,33 @@
 """Ollama embedding client for generating text embeddings."""
 
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 import httpx
 
 from src.config import get_settings
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson not installed, fall back to the stdlib encoder
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaEmbeddingClient:
     """Client for generating embeddings using Ollama."""
@@ -19,6 +38,14 @@ class OllamaEmbeddingClient:
         self.model = self.settings.ollama_embed_model
         self.timeout = self.settings.ollama_timeout
         self._client: Optional[httpx.Client] = None
+        # Shared by every caller for concurrent batch requests; threads start
+        # on first use and the pool is not recreated after close()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, self.settings.embedding_max_concurrent_requests),
+            thread_name_prefix="ollama-embed",
+        )
+        # Request bodies only differ in "input", so the rest is encoded once
+        self._request_prefix = b'{"model":' + _dumps(self.model) + b',"input":'
 
     @property
     def client(self) -> httpx.Client:
@@ -62,13 +89,11 @@ class OllamaEmbeddingClient:
         try:
             response = self.client.post(
                 "/api/embed",
-                json={
-                    "model": self.model,
-                    "input": text,
-                },
+                content=self._embed_request(text),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             # Ollama returns embeddings in different formats
             if "embeddings" in data:
@@ -90,6 +115,9 @@ class OllamaEmbeddingClient:
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
+        Batches are sent concurrently, up to embedding_max_concurrent_requests
+        at a time, over the client's pooled connections.
+
         Args:
             texts: List of texts to embed
 
@@ -97,47 +125,184 @@ class OllamaEmbeddingClient:
             List of embedding vectors
         """
         # Process in batches to avoid timeout
+        batches = self._split_batches(texts)
+
+        if len(batches) > 1 and self.settings.embedding_max_concurrent_requests > 1:
+            results = list(self.executor.map(self.embed_one_batch, batches))
+        else:
+            results = [self.embed_one_batch(batch) for batch in batches]
+
+        return _merge_batches(len(texts), results)
+
+    def _split_batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into embedding_batch_size batches."""
         batch_size = self.settings.embedding_batch_size
-        all_embeddings = []
+        return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            try:
-                response = self.client.post(
-                    "/api/embed",
-                    json={
-                        "model": self.model,
-                        "input": batch,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
+    def _embed_request(self, texts: str | list[str]) -> bytes:
+        """Encode an /api/embed request body."""
+        return self._request_prefix + _dumps(texts) + b"}"
 
-                if "embeddings" in data:
-                    all_embeddings.extend(data["embeddings"])
-                elif "embedding" in data:
-                    # Single embedding returned
-                    all_embeddings.append(data["embedding"])
-                else:
-                    raise ValueError(f"Unexpected response format: {data.keys()}")
+    def embed_one_batch(self, batch: list[str]) -> list[list[float]]:
+        """Embed texts in a single request, without splitting them into batches.
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Batch embedding failed: {e.response.text}")
-                # Fall back to individual embedding
-                for text in batch:
-                    all_embeddings.append(self.embed(text))
+        Falls back to one request per text on API errors.
+        """
+        try:
+            response = self.client.post(
+                "/api/embed",
+                content=self._embed_request(batch),
+                headers=_JSON_HEADERS,
+            )
+            response.raise_for_status()
+            return _batch_embeddings(_loads(response.content))
 
-        return all_embeddings
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Batch embedding failed: {e.response.text}")
+            # Fall back to individual embedding
+            return [self.embed(text) for text in batch]
 
     def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and stop the batch request pool."""
+        self.executor.shutdown(wait=False)
         if self._client:
             self._client.close()
             self._client = None
 
 
+def _batch_embeddings(data: dict) -> list[list[float]]:
+    """Extract the embeddings from an /api/embed batch response."""
+    if "embeddings" in data:
+        return data["embeddings"]
+    elif "embedding" in data:
+        # Single embedding returned
+        return [data["embedding"]]
+    raise ValueError(f"Unexpected response format: {data.keys()}")
+
+
+def _merge_batches(
+    total: int, results: list[list[list[float]]]
+) -> list[list[float]]:
+    """Concatenate per-batch embeddings into one preallocated list."""
+    embeddings: list = [None] * total
+    start = 0
+    for result in results:
+        embeddings[start : start + len(result)] = result
+        start += len(result)
+    return embeddings
+
+
+class BatchingOllamaClient:
+    """Coalesce single-text embedding requests into batched Ollama calls.
+
+    Texts from any number of callers are queued; a background thread sends
+    them as one /api/embed request once max_batch texts are waiting or the
+    first of them has waited max_wait_ms.
+    """
+
+    def __init__(
+        self,
+        client: Optional[OllamaEmbeddingClient] = None,
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.client = client or get_ollama_client()
+        self.max_batch = max_batch or settings.embedding_batch_size
+        if max_wait_ms is None:
+            max_wait_ms = settings.embedding_max_wait_ms
+        self.max_wait = max_wait_ms / 1000
+        max_concurrent = max(
+            1, max_concurrent or settings.embedding_max_concurrent_requests
+        )
+        self._queue: queue.SimpleQueue[tuple[str, Future]] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        # A pool of its own, so flushes don't queue behind embed_batch calls.
+        # Texts arriving while every slot is busy wait in the queue and go
+        # out as larger batches.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="ollama-batcher-flush"
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    def embed(self, text: str) -> Future:
+        """Queue a text for embedding.
+
+        Returns:
+            Future resolving to the embedding vector
+        """
+        future: Future = Future()
+        self._queue.put((text, future))
+        if self._worker is None:
+            self._start_worker()
+        return future
+
+    def _start_worker(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="ollama-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Collect queued texts into batches and dispatch them."""
+        while True:
+            items = self._collect()
+            self._slots.acquire()
+            try:
+                self._executor.submit(self._flush, items)
+            except Exception as e:
+                # Keep the worker alive; only this batch's callers see the error
+                self._slots.release()
+                logger.error(f"Failed to dispatch embedding batch: {e}")
+                _fail(items, e)
+
+    def _collect(self) -> list[tuple[str, Future]]:
+        """Wait for a text, then for up to max_batch texts or max_wait."""
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(items) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return items
+
+    def _flush(self, items: list[tuple[str, Future]]) -> None:
+        """Embed one batch and resolve its futures."""
+        try:
+            # max_batch texts go out as a single request
+            embeddings = self.client.embed_one_batch([text for text, _ in items])
+            if len(embeddings) != len(items):
+                raise ValueError(
+                    f"Expected {len(items)} embeddings, got {len(embeddings)}"
+                )
+        except Exception as e:
+            _fail(items, e)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, future), embedding in zip(items, embeddings):
+            future.set_result(embedding)
+
+
+def _fail(items: list[tuple[str, Future]], error: Exception) -> None:
+    """Resolve the futures of a batch that could not be embedded."""
+    for _, future in items:
+        if not future.done():
+            future.set_exception(error)
+
+
 # Singleton instance
 _ollama_client: Optional[OllamaEmbeddingClient] = None
+_batching_client: Optional[BatchingOllamaClient] = None
 
 
 def get_ollama_client() -> OllamaEmbeddingClient:
@@ -146,3 +311,11 @@ def get_ollama_client() -> OllamaEmbeddingClient:
     if _ollama_client is None:
         _ollama_client = OllamaEmbeddingClient()
     return _ollama_client
+
+
+def get_batching_ollama_client() -> BatchingOllamaClient:
+    """Get singleton batching Ollama client instance."""
+    global _batching_client
+    if _batching_client is None:
+        _batching_client = BatchingOllamaClient()
+    return _batching_client
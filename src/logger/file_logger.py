@@ -1,84 +1,153 @@
 """File logger for JSON structured logging - compatible with Promtail/Loki."""
 
 import json
+import logging
 import os
+import queue
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:  # orjson not installed, fall back to the stdlib encoder
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+# Buffer log lines instead of flushing every write
+_BUFFER_SIZE = 64 * 1024
+
+# Entries written per batch by the writer thread
+_MAX_BATCH = 64
+
+# Tells the writer thread to stop
+_CLOSE = object()
+
 
 class FileLogger:
-    """Handles writing logs to JSON files by date."""
+    """Handles writing logs to JSON files by date.
+
+    Callers only enqueue entries; a single writer thread serializes them,
+    writes them in batches and rotates the file when the date changes.
+    """
 
     def __init__(self, service_name: str, log_dir: str):
         self.service_name = service_name
         self.log_dir = Path(log_dir)
         self._file: Optional[Any] = None
-        self._lock = threading.Lock()
         self._current_date: Optional[str] = None
+        # Timestamp prefix and date of the last second seen by the writer
+        self._second = -1
+        self._second_prefix = b""
+        self._second_date = ""
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        # The service name never changes, so its JSON is encoded once
+        self._service_prefix = b'","service_name":' + _dumps(service_name)
 
         # Create log directory
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # Open initial log file
-        self._open_log_file()
-
-        # Start daily rotation in background
-        self._start_rotation_thread()
-
-    def _open_log_file(self) -> None:
-        """Open or create log file for today."""
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        with self._lock:
-            # Close existing file if date changed
-            if self._file is not None and self._current_date != today:
-                self._file.close()
+        self._open_log_file(time.strftime("%Y-%m-%d"))
+
+        # Start the writer in background
+        self._writer = threading.Thread(
+            target=self._drain_loop, name="file-logger", daemon=True
+        )
+        self._writer.start()
+
+    def _open_log_file(self, today: str) -> None:
+        """Open or create log file for the given date."""
+        # Close existing file if date changed
+        if self._file is not None and self._current_date != today:
+            self._file.close()
+            self._file = None
+
+        if self._file is None:
+            filename = self.log_dir / f"{today}-{self.service_name}.json"
+            self._file = open(filename, "ab", buffering=_BUFFER_SIZE)
+            self._current_date = today
+
+    def _drain_loop(self) -> None:
+        """Write queued entries in batches until close() is called.
+
+        Entries that fail to encode and batches that fail to write are
+        dropped and reported; the loop itself never stops early, so the
+        queue keeps draining.
+        """
+        while True:
+            entry = self._queue.get()
+            batch = []
+            while entry is not _CLOSE:
+                try:
+                    batch.append(self._encode_entry(*entry))
+                except Exception as e:
+                    logger.error(f"Dropped unencodable trace log entry: {e}")
+                if len(batch) >= _MAX_BATCH:
+                    break
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    # Rotate daily, by the date of the newest entry
+                    self._open_log_file(self._second_date)
+                    self._file.write(b"".join(batch))
+                    # Flush once the backlog is written, not per entry
+                    if self._queue.empty() or entry is _CLOSE:
+                        self._file.flush()
+                except Exception as e:
+                    logger.error(f"Dropped {len(batch)} trace log entries: {e}")
+
+            if entry is _CLOSE:
+                try:
+                    if self._file is not None:
+                        self._file.close()
+                except Exception as e:
+                    logger.error(f"Failed to close trace log file: {e}")
                 self._file = None
-
-            if self._file is None:
-                filename = self.log_dir / f"{today}-{self.service_name}.json"
-                self._file = open(filename, "a", encoding="utf-8")
-                self._current_date = today
-
-    def _start_rotation_thread(self) -> None:
-        """Start background thread for daily log rotation."""
-
-        def rotate():
-            import time
-
-            while True:
-                time.sleep(3600)  # Check every hour
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                if current_date != self._current_date:
-                    self._open_log_file()
-
-        thread = threading.Thread(target=rotate, daemon=True)
-        thread.start()
+                return
+
+    def _encode_entry(self, timestamp: float, data: dict) -> bytes:
+        """Encode one log line, splicing the fixed envelope around data."""
+        second = int(timestamp)
+        if second != self._second:
+            # Format the date and time once per second, not per entry
+            local = time.localtime(second)
+            self._second = second
+            self._second_prefix = b'{"timestamp":"' + time.strftime(
+                "%Y-%m-%dT%H:%M:%S", local
+            ).encode()
+            self._second_date = time.strftime("%Y-%m-%d", local)
+
+        body = _dumps(data)
+        micros = int((timestamp - second) * 1_000_000)
+        line = self._second_prefix + b".%06d" % micros + self._service_prefix
+        if len(body) > 2:
+            return line + b"," + body[1:] + b"\n"
+        return line + b"}\n"
 
     def write_trace(self, data: dict) -> None:
         """Write a trace log entry."""
-        # Add timestamp and service name
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "service_name": self.service_name,
-            **data,
-        }
-
-        json_line = json.dumps(log_entry, ensure_ascii=False, default=str)
-
-        with self._lock:
-            if self._file is not None:
-                self._file.write(json_line + "\n")
-                self._file.flush()
+        # Take the time now; the writer thread formats it
+        self._queue.put((time.time(), data))
 
     def close(self) -> None:
-        """Close the log file."""
-        with self._lock:
-            if self._file is not None:
-                self._file.close()
-                self._file = None
+        """Write pending entries and close the log file."""
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join()
 
 
 # Global logger instance
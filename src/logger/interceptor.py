@@ -1,18 +1,27 @@
 """gRPC interceptor for logging requests - compatible with Promtail/Loki."""
 
+import secrets
+import sys
 import time
-import uuid
 from typing import Any, Callable
 
 import grpc
 from google.protobuf.json_format import MessageToDict
 
+from src.config import get_settings
+
 from .file_logger import get_file_logger
 
 
 class LoggingInterceptor(grpc.ServerInterceptor):
     """gRPC server interceptor that logs all requests in JSON format."""
 
+    def __init__(self):
+        settings = get_settings()
+        self._log_request_args = settings.log_request_args
+        self._max_arg_bytes = settings.log_max_arg_bytes
+        self._handlers: dict[str, tuple[Any, Any]] = {}
+
     def intercept_service(
         self,
         continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
@@ -24,6 +33,22 @@ class LoggingInterceptor(grpc.ServerInterceptor):
         if handler is None:
             return handler
 
+        # grpc calls interceptors on every RPC; the wrapped handler is reused
+        # for as long as continuation returns the same handler for the method
+        cached = self._handlers.get(handler_call_details.method)
+        if cached is not None and cached[0] is handler:
+            return cached[1]
+
+        wrapped = self._wrap_handler(handler, handler_call_details)
+        self._handlers[handler_call_details.method] = (handler, wrapped)
+        return wrapped
+
+    def _wrap_handler(
+        self,
+        handler: grpc.RpcMethodHandler,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        """Wrap a method handler according to its kind."""
         if handler.unary_unary:
             return grpc.unary_unary_rpc_method_handler(
                 self._wrap_unary_unary(handler.unary_unary, handler_call_details),
@@ -57,9 +82,10 @@ class LoggingInterceptor(grpc.ServerInterceptor):
         handler_call_details: grpc.HandlerCallDetails,
     ) -> Callable:
         """Wrap unary-unary handler with logging."""
+        method = sys.intern(handler_call_details.method)
 
         def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
-            request_id = str(uuid.uuid4())
+            request_id = secrets.token_hex(8)
             start_time = time.time()
             error_msg = None
             success = True
@@ -75,7 +101,7 @@ class LoggingInterceptor(grpc.ServerInterceptor):
                 duration_ms = int((time.time() - start_time) * 1000)
                 self._log_request(
                     request_id=request_id,
-                    method=handler_call_details.method,
+                    method=method,
                     request=request,
                     duration_ms=duration_ms,
                     success=success,
@@ -90,9 +116,10 @@ class LoggingInterceptor(grpc.ServerInterceptor):
         handler_call_details: grpc.HandlerCallDetails,
     ) -> Callable:
         """Wrap unary-stream handler with logging."""
+        method = sys.intern(handler_call_details.method)
 
         def wrapper(request: Any, context: grpc.ServicerContext):
-            request_id = str(uuid.uuid4())
+            request_id = secrets.token_hex(8)
             start_time = time.time()
             error_msg = None
             success = True
@@ -108,7 +135,7 @@ class LoggingInterceptor(grpc.ServerInterceptor):
                 duration_ms = int((time.time() - start_time) * 1000)
                 self._log_request(
                     request_id=request_id,
-                    method=handler_call_details.method,
+                    method=method,
                     request=request,
                     duration_ms=duration_ms,
                     success=success,
@@ -124,9 +151,10 @@ class LoggingInterceptor(grpc.ServerInterceptor):
         handler_call_details: grpc.HandlerCallDetails,
     ) -> Callable:
         """Wrap stream-unary handler with logging."""
+        method = sys.intern(handler_call_details.method)
 
         def wrapper(request_iterator, context: grpc.ServicerContext) -> Any:
-            request_id = str(uuid.uuid4())
+            request_id = secrets.token_hex(8)
             start_time = time.time()
             error_msg = None
             success = True
@@ -149,7 +177,7 @@ class LoggingInterceptor(grpc.ServerInterceptor):
                 duration_ms = int((time.time() - start_time) * 1000)
                 self._log_request(
                     request_id=request_id,
-                    method=handler_call_details.method,
+                    method=method,
                     request=None,
                     duration_ms=duration_ms,
                     success=success,
@@ -166,9 +194,10 @@ class LoggingInterceptor(grpc.ServerInterceptor):
         handler_call_details: grpc.HandlerCallDetails,
     ) -> Callable:
         """Wrap stream-stream handler with logging."""
+        method = sys.intern(handler_call_details.method)
 
         def wrapper(request_iterator, context: grpc.ServicerContext):
-            request_id = str(uuid.uuid4())
+            request_id = secrets.token_hex(8)
             start_time = time.time()
             error_msg = None
             success = True
@@ -191,7 +220,7 @@ class LoggingInterceptor(grpc.ServerInterceptor):
                 duration_ms = int((time.time() - start_time) * 1000)
                 self._log_request(
                     request_id=request_id,
-                    method=handler_call_details.method,
+                    method=method,
                     request=None,
                     duration_ms=duration_ms,
                     success=success,
@@ -224,20 +253,19 @@ class LoggingInterceptor(grpc.ServerInterceptor):
             "request_type": request_type,
         }
 
-        # Extract request args for unary requests
-        if request is not None:
+        # Extract request args for unary requests; fields left at their
+        # default are already omitted, so no extra filtering is needed.
+        # Large requests (e.g. whole documents) are not worth converting.
+        if request is not None and self._log_request_args:
             try:
-                request_args = MessageToDict(
-                    request,
-                    preserving_proto_field_name=True,
-                    including_default_value_fields=False,
-                )
-                # Filter empty values
-                request_args = {
-                    k: v for k, v in request_args.items() if v not in (None, "", [], {})
-                }
-                if request_args:
-                    trace_data["request_args"] = request_args
+                if request.ByteSize() <= self._max_arg_bytes:
+                    request_args = MessageToDict(
+                        request,
+                        preserving_proto_field_name=True,
+                        use_integers_for_enums=True,
+                    )
+                    if request_args:
+                        trace_data["request_args"] = request_args
             except Exception:
                 pass
 
@@ -5,7 +5,6 @@ from .metrics import (
     grpc_requests_total,
     grpc_request_duration,
     grpc_requests_in_flight,
-    grpc_errors_total,
     plagiarism_checks_total,
     plagiarism_check_duration,
     documents_indexed_total,
@@ -13,14 +12,15 @@ from .metrics import (
     elasticsearch_query_duration,
 )
 from .interceptor import MetricsInterceptor
+from .combined_interceptor import CombinedInterceptor
 
 __all__ = [
     "MetricsServer",
     "MetricsInterceptor",
+    "CombinedInterceptor",
     "grpc_requests_total",
     "grpc_request_duration",
     "grpc_requests_in_flight",
-    "grpc_errors_total",
     "plagiarism_checks_total",
     "plagiarism_check_duration",
     "documents_indexed_total",
@@ -0,0 +1,283 @@
+"""gRPC interceptor for JSON request logs and Prometheus metrics in one pass."""
+
+import logging
+import secrets
+import sys
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import grpc
+
+from src.logger import LoggingInterceptor
+
+from .interceptor import (
+    DEFAULT_SKIP_METHODS,
+    MetricsInterceptor,
+    _error_status,
+    _on_done,
+    _code_status,
+    _watch_errors,
+)
+
+logger = logging.getLogger(__name__)
+
+_INTERNAL = grpc.StatusCode.INTERNAL
+
+
+class CombinedInterceptor(grpc.ServerInterceptor):
+    """gRPC server interceptor that logs requests and collects metrics.
+
+    Does the work of LoggingInterceptor and MetricsInterceptor from a single
+    wrapper per RPC, so each call goes through one extra frame instead of two.
+    Exceptions the servicer leaves unhandled, including ones raised while a
+    response stream is being iterated, are logged and aborted with INTERNAL
+    here, so servicer methods need no try/except of their own.
+    """
+
+    def __init__(
+        self,
+        service_name: str = "plagiarism",
+        logging_interceptor: Optional[LoggingInterceptor] = None,
+        skip_methods: Iterable[str] = DEFAULT_SKIP_METHODS,
+    ):
+        self.service_name = service_name
+        self._logging = logging_interceptor or LoggingInterceptor()
+        self._metrics = MetricsInterceptor(
+            service_name=service_name, skip_methods=skip_methods
+        )
+        self._handlers: dict[str, tuple[Any, Any]] = {}
+
+    def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        """Intercept incoming RPC calls."""
+        handler = continuation(handler_call_details)
+
+        if handler is None:
+            return handler
+
+        # Skipped methods are still logged, just not measured
+        if handler_call_details.method in self._metrics.skip_methods:
+            return self._logging.intercept_service(
+                lambda _: handler, handler_call_details
+            )
+
+        # grpc calls interceptors on every RPC; the wrapped handler is reused
+        # for as long as continuation returns the same handler for the method
+        cached = self._handlers.get(handler_call_details.method)
+        if cached is not None and cached[0] is handler:
+            return cached[1]
+
+        wrapped = self._wrap_handler(handler, handler_call_details)
+        self._handlers[handler_call_details.method] = (handler, wrapped)
+        return wrapped
+
+    def _wrap_handler(
+        self,
+        handler: grpc.RpcMethodHandler,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        """Wrap a method handler according to its kind."""
+        method = sys.intern(handler_call_details.method)
+
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._instrument_call(handler.unary_unary, method, "unary_unary"),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        elif handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._instrument_stream(handler.unary_stream, method, "unary_stream"),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        elif handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                self._instrument_call(handler.stream_unary, method, "stream_unary"),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        elif handler.stream_stream:
+            return grpc.stream_stream_rpc_method_handler(
+                self._instrument_stream(handler.stream_stream, method, "stream_stream"),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        return handler
+
+    def _finish(
+        self,
+        method: str,
+        metrics: tuple[Any, Any],
+        start_ns: int,
+        status: str,
+        error: Optional[str],
+        request: Any = None,
+        request_type: str = "unary_unary",
+        request_count: Optional[int] = None,
+    ) -> None:
+        """Record metrics and the trace log entry for a finished RPC."""
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        self._metrics._record(method, metrics, start_ns, status)
+        self._logging._log_request(
+            request_id=secrets.token_hex(8),
+            method=method,
+            request=request,
+            duration_ms=duration_ms,
+            success=status == "OK",
+            error=error,
+            request_type=request_type,
+            request_count=request_count,
+        )
+
+    def _finish_error(
+        self,
+        context: grpc.ServicerContext,
+        error: Exception,
+        method: str,
+        metrics: tuple[Any, Any],
+        start_ns: int,
+        request: Any = None,
+        request_type: str = "unary_unary",
+        request_count: Optional[int] = None,
+    ) -> None:
+        """Record an RPC that raised, aborting it with INTERNAL if unhandled."""
+        status = _error_status(context)
+        unhandled = status == "UNKNOWN"
+        if unhandled:
+            logger.error(f"{method} error: {error}", exc_info=error)
+            status = "INTERNAL"
+
+        self._finish(
+            method, metrics, start_ns, status, str(error), request,
+            request_type=request_type,
+            request_count=request_count,
+        )
+        if unhandled:
+            context.abort(_INTERNAL, str(error))
+
+    def _finish_from_context(
+        self,
+        context: grpc.ServicerContext,
+        method: str,
+        metrics: tuple[Any, Any],
+        start_ns: int,
+        request: Any = None,
+        request_type: str = "unary_stream",
+        request_count: Optional[int] = None,
+    ) -> None:
+        """Record an RPC that returned, from the status code it set."""
+        status = _code_status(context)
+        error = None
+        if status != "OK" and context.details():
+            error = context.details().decode("utf-8", "replace")
+        self._finish(
+            method, metrics, start_ns, status, error, request,
+            request_type=request_type,
+            request_count=request_count,
+        )
+
+    def _instrument_call(
+        self, behavior: Callable, method: str, request_type: str
+    ) -> Callable:
+        """Wrap a handler with a single response (unary or streaming request)."""
+        metrics = self._metrics._get_metrics(method)
+        stream_request = request_type == "stream_unary"
+
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            self._metrics._started()
+            start_ns = time.perf_counter_ns()
+            counter = _RequestCounter(request) if stream_request else None
+            logged_request = None if stream_request else request
+
+            try:
+                response = behavior(counter or request, context)
+            except Exception as e:
+                self._finish_error(
+                    context, e, method, metrics, start_ns, logged_request,
+                    request_type=request_type,
+                    request_count=counter.count if counter else None,
+                )
+                raise
+
+            # Servicers report handled failures with set_code
+            self._finish_from_context(
+                context, method, metrics, start_ns, logged_request,
+                request_type=request_type,
+                request_count=counter.count if counter else None,
+            )
+            return response
+
+        return wrapper
+
+    def _instrument_stream(
+        self, behavior: Callable, method: str, request_type: str
+    ) -> Callable:
+        """Wrap a handler with streamed responses (unary or streaming request)."""
+        metrics = self._metrics._get_metrics(method)
+        stream_request = request_type == "stream_stream"
+
+        def wrapper(request: Any, context: grpc.ServicerContext):
+            self._metrics._started()
+            start_ns = time.perf_counter_ns()
+            counter = _RequestCounter(request) if stream_request else None
+            logged_request = None if stream_request else request
+
+            try:
+                responses = behavior(counter or request, context)
+            except Exception as e:
+                self._finish_error(
+                    context, e, method, metrics, start_ns, logged_request,
+                    request_type=request_type,
+                    request_count=counter.count if counter else None,
+                )
+                raise
+
+            # Errors raised while streaming leave no code on the context, so
+            # they are recorded (and aborted) as they happen; otherwise the
+            # RPC is recorded when it ends
+            failed = []
+
+            def on_error(error: Exception) -> None:
+                failed.append(error)
+                self._finish_error(
+                    context, error, method, metrics, start_ns, logged_request,
+                    request_type=request_type,
+                    request_count=counter.count if counter else None,
+                )
+
+            def on_done() -> None:
+                if not failed:
+                    self._finish_from_context(
+                        context, method, metrics, start_ns, logged_request,
+                        request_type=request_type,
+                        request_count=counter.count if counter else None,
+                    )
+
+            _on_done(context, on_done)
+            return _watch_errors(responses, on_error)
+
+        return wrapper
+
+
+class _RequestCounter:
+    """Iterator over a request stream that counts the messages it yields."""
+
+    __slots__ = ("_requests", "count")
+
+    def __init__(self, requests: Iterator[Any]):
+        self._requests = iter(requests)
+        self.count = 0
+
+    def __iter__(self) -> "_RequestCounter":
+        return self
+
+    def __next__(self) -> Any:
+        request = next(self._requests)
+        self.count += 1
+        return request
+
@@ -1,23 +1,56 @@
 """gRPC interceptor for Prometheus metrics."""
 
 import time
-from typing import Callable, Any
+from typing import Callable, Any, Iterable, Iterator
 
 import grpc
 
 from .metrics import (
+    child,
     grpc_requests_total,
     grpc_request_duration,
     grpc_requests_in_flight,
-    grpc_errors_total,
 )
 
+# Probe and reflection RPCs that would only add noise to the histograms
+DEFAULT_SKIP_METHODS = frozenset({
+    "/grpc.health.v1.Health/Check",
+    "/grpc.reflection.v1alpha.ServerReflection/ServerReflectionInfo",
+    "/plagiarism.PlagiarismService/HealthCheck",
+})
+
+# Looked up once; _code_status runs at the end of every RPC
+_OK = grpc.StatusCode.OK
+
 
 class MetricsInterceptor(grpc.ServerInterceptor):
     """gRPC server interceptor that collects Prometheus metrics."""
 
-    def __init__(self, service_name: str = "plagiarism"):
+    def __init__(
+        self,
+        service_name: str = "plagiarism",
+        skip_methods: Iterable[str] = DEFAULT_SKIP_METHODS,
+    ):
         self.service_name = service_name
+        self.skip_methods = frozenset(skip_methods)
+        # The service is identified by the scrape target, not a label
+        in_flight = grpc_requests_in_flight.labels()
+        self._started = in_flight.inc
+        self._finished = in_flight.dec
+        # Labeled children per method, so the success path skips .labels()
+        self._method_metrics: dict[str, tuple[Any, Any]] = {}
+        self._handlers: dict[str, tuple[Any, Any]] = {}
+
+    def _get_metrics(self, method: str) -> tuple[Any, Any]:
+        """Return the duration histogram and OK counter children for method."""
+        metrics = self._method_metrics.get(method)
+        if metrics is None:
+            metrics = (
+                child(grpc_request_duration, method),
+                child(grpc_requests_total, method, "OK"),
+            )
+            self._method_metrics[method] = metrics
+        return metrics
 
     def intercept_service(
         self,
@@ -27,193 +60,151 @@ class MetricsInterceptor(grpc.ServerInterceptor):
         """Intercept incoming RPC calls."""
         handler = continuation(handler_call_details)
 
-        if handler is None:
+        if handler is None or handler_call_details.method in self.skip_methods:
             return handler
 
+        # grpc calls interceptors on every RPC; the wrapped handler is reused
+        # for as long as continuation returns the same handler for the method
+        cached = self._handlers.get(handler_call_details.method)
+        if cached is not None and cached[0] is handler:
+            return cached[1]
+
+        wrapped = self._wrap_handler(handler, handler_call_details)
+        self._handlers[handler_call_details.method] = (handler, wrapped)
+        return wrapped
+
+    def _wrap_handler(
+        self,
+        handler: grpc.RpcMethodHandler,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        """Wrap a method handler according to its kind."""
+        method = handler_call_details.method
+
         if handler.unary_unary:
             return grpc.unary_unary_rpc_method_handler(
-                self._wrap_unary_unary(handler.unary_unary, handler_call_details),
+                self._instrument_call(handler.unary_unary, method),
                 request_deserializer=handler.request_deserializer,
                 response_serializer=handler.response_serializer,
             )
         elif handler.unary_stream:
             return grpc.unary_stream_rpc_method_handler(
-                self._wrap_unary_stream(handler.unary_stream, handler_call_details),
+                self._instrument_stream(handler.unary_stream, method),
                 request_deserializer=handler.request_deserializer,
                 response_serializer=handler.response_serializer,
             )
         elif handler.stream_unary:
             return grpc.stream_unary_rpc_method_handler(
-                self._wrap_stream_unary(handler.stream_unary, handler_call_details),
+                self._instrument_call(handler.stream_unary, method),
                 request_deserializer=handler.request_deserializer,
                 response_serializer=handler.response_serializer,
             )
         elif handler.stream_stream:
             return grpc.stream_stream_rpc_method_handler(
-                self._wrap_stream_stream(handler.stream_stream, handler_call_details),
+                self._instrument_stream(handler.stream_stream, method),
                 request_deserializer=handler.request_deserializer,
                 response_serializer=handler.response_serializer,
             )
 
         return handler
 
-    def _wrap_unary_unary(
+    def _record(
         self,
-        behavior: Callable,
-        handler_call_details: grpc.HandlerCallDetails,
-    ) -> Callable:
-        """Wrap unary-unary handler with metrics."""
+        method: str,
+        metrics: tuple[Any, Any],
+        start_ns: int,
+        status: str,
+    ) -> None:
+        """Record a finished RPC."""
+        duration_metric, ok_total = metrics
+
+        self._finished()
+        duration_metric.observe_ns(time.perf_counter_ns() - start_ns)
+        if status == "OK":
+            ok_total.inc()
+        else:
+            child(grpc_requests_total, method, status).inc()
+
+    def _instrument_call(self, behavior: Callable, method: str) -> Callable:
+        """Wrap a handler with a single response (unary or streaming request)."""
+        metrics = self._get_metrics(method)
 
         def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
-            method = handler_call_details.method
-
             # Track in-flight requests
-            grpc_requests_in_flight.labels(service=self.service_name).inc()
-            start_time = time.time()
-            status = "OK"
+            self._started()
+            start_ns = time.perf_counter_ns()
 
             try:
                 response = behavior(request, context)
-                return response
-            except Exception as e:
-                status = "ERROR"
-                # Get gRPC status code if available
-                if hasattr(context, "code") and context.code():
-                    status = context.code().name
-                grpc_errors_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    code=status,
-                ).inc()
+            except Exception:
+                self._record(method, metrics, start_ns, _error_status(context))
                 raise
-            finally:
-                duration = time.time() - start_time
-                grpc_requests_in_flight.labels(service=self.service_name).dec()
-                grpc_request_duration.labels(
-                    service=self.service_name,
-                    method=method,
-                ).observe(duration)
-                grpc_requests_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    status=status,
-                ).inc()
+
+            # Servicers report handled failures with set_code
+            self._record(method, metrics, start_ns, _code_status(context))
+            return response
 
         return wrapper
 
-    def _wrap_unary_stream(
-        self,
-        behavior: Callable,
-        handler_call_details: grpc.HandlerCallDetails,
-    ) -> Callable:
-        """Wrap unary-stream handler with metrics."""
+    def _instrument_stream(self, behavior: Callable, method: str) -> Callable:
+        """Wrap a handler with streamed responses (unary or streaming request)."""
+        metrics = self._get_metrics(method)
 
         def wrapper(request: Any, context: grpc.ServicerContext):
-            method = handler_call_details.method
-            grpc_requests_in_flight.labels(service=self.service_name).inc()
-            start_time = time.time()
-            status = "OK"
+            self._started()
+            start_ns = time.perf_counter_ns()
 
             try:
-                for response in behavior(request, context):
-                    yield response
-            except Exception as e:
-                status = "ERROR"
-                grpc_errors_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    code=status,
-                ).inc()
+                responses = behavior(request, context)
+            except Exception:
+                self._record(method, metrics, start_ns, _error_status(context))
                 raise
-            finally:
-                duration = time.time() - start_time
-                grpc_requests_in_flight.labels(service=self.service_name).dec()
-                grpc_request_duration.labels(
-                    service=self.service_name,
-                    method=method,
-                ).observe(duration)
-                grpc_requests_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    status=status,
-                ).inc()
 
-        return wrapper
+            # Errors raised while streaming leave no code on the context, so
+            # they are recorded as they happen; otherwise when the RPC ends
+            failed = []
 
-    def _wrap_stream_unary(
-        self,
-        behavior: Callable,
-        handler_call_details: grpc.HandlerCallDetails,
-    ) -> Callable:
-        """Wrap stream-unary handler with metrics."""
+            def on_error(error: Exception) -> None:
+                failed.append(error)
+                self._record(method, metrics, start_ns, _error_status(context))
 
-        def wrapper(request_iterator, context: grpc.ServicerContext) -> Any:
-            method = handler_call_details.method
-            grpc_requests_in_flight.labels(service=self.service_name).inc()
-            start_time = time.time()
-            status = "OK"
+            def on_done() -> None:
+                if not failed:
+                    self._record(method, metrics, start_ns, _code_status(context))
 
-            try:
-                response = behavior(request_iterator, context)
-                return response
-            except Exception as e:
-                status = "ERROR"
-                grpc_errors_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    code=status,
-                ).inc()
-                raise
-            finally:
-                duration = time.time() - start_time
-                grpc_requests_in_flight.labels(service=self.service_name).dec()
-                grpc_request_duration.labels(
-                    service=self.service_name,
-                    method=method,
-                ).observe(duration)
-                grpc_requests_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    status=status,
-                ).inc()
+            _on_done(context, on_done)
+            return _watch_errors(responses, on_error)
 
         return wrapper
 
-    def _wrap_stream_stream(
-        self,
-        behavior: Callable,
-        handler_call_details: grpc.HandlerCallDetails,
-    ) -> Callable:
-        """Wrap stream-stream handler with metrics."""
 
-        def wrapper(request_iterator, context: grpc.ServicerContext):
-            method = handler_call_details.method
-            grpc_requests_in_flight.labels(service=self.service_name).inc()
-            start_time = time.time()
-            status = "OK"
+def _error_status(context: grpc.ServicerContext) -> str:
+    """Status label for an RPC that raised: its gRPC code if one was set."""
+    if hasattr(context, "code") and context.code():
+        return context.code().name
+    return "UNKNOWN"
 
-            try:
-                for response in behavior(request_iterator, context):
-                    yield response
-            except Exception as e:
-                status = "ERROR"
-                grpc_errors_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    code=status,
-                ).inc()
-                raise
-            finally:
-                duration = time.time() - start_time
-                grpc_requests_in_flight.labels(service=self.service_name).dec()
-                grpc_request_duration.labels(
-                    service=self.service_name,
-                    method=method,
-                ).observe(duration)
-                grpc_requests_total.labels(
-                    service=self.service_name,
-                    method=method,
-                    status=status,
-                ).inc()
 
-        return wrapper
+def _code_status(context: grpc.ServicerContext) -> str:
+    """Status label for an RPC that returned, from the code it set."""
+    code = context.code()
+    if code is None or code == _OK:
+        return "OK"
+    return code.name
+
+
+def _on_done(context: grpc.ServicerContext, callback: Callable[[], None]) -> None:
+    """Run callback when the RPC terminates, or now if it already has."""
+    if not context.add_callback(callback):
+        callback()
+
+
+def _watch_errors(
+    responses: Iterable[Any], on_error: Callable[[Exception], None]
+) -> Iterator[Any]:
+    """Pass responses through, calling on_error if iterating them raises."""
+    try:
+        yield from responses
+    except Exception as e:
+        on_error(e)
+        raise
@@ -1,21 +1,81 @@
 """Prometheus metrics definitions and HTTP server."""
 
+import hashlib
+import itertools
+import socketserver
 import threading
-from http.server import HTTPServer
+import time
+from functools import lru_cache
+
 from prometheus_client import (
     Counter,
     Histogram,
-    Gauge,
     Info,
     generate_latest,
     CONTENT_TYPE_LATEST,
 )
-from prometheus_client.core import CollectorRegistry
-from http.server import BaseHTTPRequestHandler
+from prometheus_client.core import CollectorRegistry, GaugeMetricFamily
 
 # Create a custom registry
 REGISTRY = CollectorRegistry(auto_describe=True)
 
+
+class _AtomicGaugeChild:
+    """Started/finished counters whose difference is the gauge value.
+
+    inc and dec are bound itertools.count.__next__ methods, which advance
+    atomically under the GIL, so updates take no lock.
+    """
+
+    __slots__ = ("inc", "dec")
+
+    def __init__(self):
+        self.inc = itertools.count().__next__
+        self.dec = itertools.count().__next__
+
+    def value(self) -> int:
+        # Advancing both counters leaves their difference unchanged
+        return self.inc() - self.dec()
+
+
+class AtomicGauge:
+    """Lock-free inc/dec gauge, exposed through a custom collector."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+        registry: CollectorRegistry = REGISTRY,
+    ):
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], _AtomicGaugeChild] = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def labels(self, *labelvalues: str, **labelkwargs: str) -> _AtomicGaugeChild:
+        """Get the child for the given label values, positional or by name."""
+        if labelkwargs:
+            labelvalues = tuple(labelkwargs[name] for name in self._labelnames)
+        if len(labelvalues) != len(self._labelnames):
+            raise ValueError("Incorrect label count")
+        key = tuple(str(value) for value in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, _AtomicGaugeChild())
+        return child
+
+    def collect(self):
+        gauge = GaugeMetricFamily(
+            self._name, self._documentation, labels=self._labelnames
+        )
+        for key, child in list(self._children.items()):
+            gauge.add_metric(list(key), child.value())
+        yield gauge
+
 # Service info
 service_info = Info(
     "service",
@@ -23,33 +83,52 @@ service_info = Info(
     registry=REGISTRY,
 )
 
+class NsHistogram(Histogram):
+    """Histogram of durations that can be observed in integer nanoseconds.
+
+    Buckets are declared and exposed in seconds as usual; observe_ns compares
+    against integer nanosecond bounds and converts only the sum.
+    """
+
+    def _metric_init(self) -> None:
+        super()._metric_init()
+        # The +Inf bucket becomes a bound no duration can exceed
+        self._upper_bounds_ns = tuple(
+            round(bound * 1_000_000_000) if bound != float("inf") else 1 << 63
+            for bound in self._upper_bounds
+        )
+
+    def observe_ns(self, duration_ns: int) -> None:
+        """Observe a duration given in nanoseconds."""
+        self._raise_if_not_observable()
+        self._sum.inc(duration_ns * 1e-9)
+        for i, bound in enumerate(self._upper_bounds_ns):
+            if duration_ns <= bound:
+                self._buckets[i].inc(1)
+                break
+
+
 # gRPC metrics
+# Errors are the requests whose status is not "OK"
 grpc_requests_total = Counter(
     "grpc_requests_total",
     "Total number of gRPC requests",
-    ["service", "method", "status"],
+    ["method", "status"],
     registry=REGISTRY,
 )
 
-grpc_request_duration = Histogram(
+grpc_request_duration = NsHistogram(
     "grpc_request_duration_seconds",
     "Duration of gRPC requests in seconds",
-    ["service", "method"],
-    buckets=[0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300],
+    ["method"],
+    buckets=[0.01, 0.1, 1, 5, 30, 300],
     registry=REGISTRY,
 )
 
-grpc_requests_in_flight = Gauge(
+grpc_requests_in_flight = AtomicGauge(
     "grpc_requests_in_flight",
     "Number of gRPC requests currently being processed",
-    ["service"],
-    registry=REGISTRY,
-)
-
-grpc_errors_total = Counter(
-    "grpc_errors_total",
-    "Total number of gRPC errors",
-    ["service", "method", "code"],
+    [],
     registry=REGISTRY,
 )
 
@@ -61,7 +140,7 @@ plagiarism_checks_total = Counter(
     registry=REGISTRY,
 )
 
-plagiarism_check_duration = Histogram(
+plagiarism_check_duration = NsHistogram(
     "plagiarism_check_duration_seconds",
     "Duration of plagiarism checks in seconds",
     buckets=[1, 5, 10, 30, 60, 120, 300, 600],
@@ -92,27 +171,102 @@ elasticsearch_query_duration = Histogram(
 )
 
 
-class MetricsHandler(BaseHTTPRequestHandler):
-    """HTTP handler for metrics endpoint."""
-
-    def do_GET(self):
-        if self.path == "/metrics":
-            self.send_response(200)
-            self.send_header("Content-Type", CONTENT_TYPE_LATEST)
-            self.end_headers()
-            self.wfile.write(generate_latest(REGISTRY))
-        elif self.path == "/health":
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain")
-            self.end_headers()
-            self.wfile.write(b"OK")
+@lru_cache(maxsize=2048)
+def child(metric, *labelvalues: str):
+    """Return the child of metric for positional label values, cached."""
+    return metric.labels(*labelvalues)
+
+
+# Scrapes within this many seconds share one rendering of the registry
+_METRICS_CACHE_SECONDS = 1.0
+
+_cache_bytes: bytes = b""
+_cache_etag: str = ""
+_cache_ts: float = float("-inf")
+_cache_lock = threading.Lock()
+
+
+def _latest_metrics() -> tuple[bytes, str]:
+    """Return the rendered registry and its ETag, regenerated when stale."""
+    global _cache_bytes, _cache_etag, _cache_ts
+
+    if time.monotonic() - _cache_ts >= _METRICS_CACHE_SECONDS:
+        with _cache_lock:
+            # Another scrape may have refreshed it while we waited
+            now = time.monotonic()
+            if now - _cache_ts >= _METRICS_CACHE_SECONDS:
+                _cache_bytes = generate_latest(REGISTRY)
+                # Derived from the payload, so unchanged values keep their ETag
+                _cache_etag = f'"{hashlib.blake2b(_cache_bytes, digest_size=16).hexdigest()}"'
+                _cache_ts = now
+    return _cache_bytes, _cache_etag
+
+
+_HEALTH_HEAD = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 2\r\n"
+    b"Connection: close\r\n\r\n"
+)
+_NOT_FOUND_RESPONSE = (
+    b"HTTP/1.1 404 Not Found\r\n"
+    b"Content-Length: 0\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
+
+class MetricsHandler(socketserver.StreamRequestHandler):
+    """Minimal HTTP handler for the /metrics and /health endpoints.
+
+    Only the request line and If-None-Match are looked at; GET and HEAD are
+    served and every response closes the connection.
+    """
+
+    def handle(self):
+        request_line = self.rfile.readline(256)
+
+        # Read the rest of the request head
+        etag_seen = None
+        for _ in range(100):
+            line = self.rfile.readline(8192)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if line[:14].lower() == b"if-none-match:":
+                etag_seen = line[14:].strip().decode("latin-1")
+
+        parts = request_line.split()
+        method = parts[0] if parts else b""
+        # Scrapers may add query parameters; only the path selects the endpoint
+        path = parts[1].split(b"?", 1)[0] if len(parts) > 1 else b""
+        if method not in (b"GET", b"HEAD"):
+            path = b""
+        send_body = method == b"GET"
+
+        if path == b"/metrics":
+            body, etag = _latest_metrics()
+            if etag_seen == etag:
+                self.wfile.write(
+                    b"HTTP/1.1 304 Not Modified\r\n"
+                    b"ETag: " + etag.encode() + b"\r\n"
+                    b"Connection: close\r\n\r\n"
+                )
+                return
+            self.wfile.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: " + CONTENT_TYPE_LATEST.encode() + b"\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+                b"ETag: " + etag.encode() + b"\r\n"
+                b"Connection: close\r\n\r\n" + (body if send_body else b"")
+            )
+        elif path == b"/health":
+            self.wfile.write(_HEALTH_HEAD + (b"OK" if send_body else b""))
         else:
-            self.send_response(404)
-            self.end_headers()
+            self.wfile.write(_NOT_FOUND_RESPONSE)
+
 
-    def log_message(self, format, *args):
-        # Suppress logging
-        pass
+class _MetricsTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
 
 
 class MetricsServer:
@@ -132,7 +286,9 @@ class MetricsServer:
             "version": "1.0.0",
         })
 
-        self._server = HTTPServer(("0.0.0.0", self.port), MetricsHandler)
+        self._server = _MetricsTCPServer(("0.0.0.0", self.port), MetricsHandler)
+        # A daemon thread never holds up interpreter exit, even when startup
+        # fails before stop() is called
         self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
         self._thread.start()
 
@@ -140,3 +296,4 @@ class MetricsServer:
         """Stop the metrics server."""
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
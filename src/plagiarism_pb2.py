@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10plagiarism.proto\x12\nplagiarism\"G\n\x0c\x43heckRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\x12)\n\x07options\x18\x02 \x01(\x0b\x32\x18.plagiarism.CheckOptions\"\xac\x01\n\x0c\x43heckOptions\x12\x1b\n\x0emin_similarity\x18\x01 \x01(\x02H\x00\x88\x01\x01\x12\x12\n\x05top_k\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12 \n\x13include_ai_analysis\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12\x14\n\x0c\x65xclude_docs\x18\x04 \x03(\tB\x11\n\x0f_min_similarityB\x08\n\x06_top_kB\x16\n\x14_include_ai_analysis\"\xf6\x01\n\rCheckResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x1d\n\x15plagiarism_percentage\x18\x02 \x01(\x02\x12&\n\x08severity\x18\x03 \x01(\x0e\x32\x14.plagiarism.Severity\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\x12\"\n\x07matches\x18\x05 \x03(\x0b\x32\x11.plagiarism.Match\x12)\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x19.plagiarism.ChunkAnalysis\x12&\n\x08metadata\x18\x07 \x01(\x0b\x32\x14.plagiarism.Metadata\"\xa0\x01\n\x05Match\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x16\n\x0e\x64ocument_title\x18\x02 \x01(\t\x12\x14\n\x0cmatched_text\x18\x03 \x01(\t\x12\x12\n\ninput_text\x18\x04 \x01(\t\x12\x18\n\x10similarity_score\x18\x05 \x01(\x02\x12&\n\x08position\x18\x06 \x01(\x0b\x32\x14.plagiarism.Position\";\n\x08Position\x12\r\n\x05start\x18\x01 \x01(\x05\x12\x0b\n\x03\x65nd\x18\x02 \x01(\x05\x12\x13\n\x0b\x63hunk_index\x18\x03 \x01(\x05\"\x8b\x01\n\rChunkAnalysis\x12\x13\n\x0b\x63hunk_index\x18\x01 \x01(\x05\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x16\n\x0emax_similarity\x18\x03 \x01(\x02\x12$\n\x06status\x18\x04 \x01(\x0e\x32\x14.plagiarism.Severity\x12\x19\n\x11\x62\x65st_match_doc_id\x18\x05 \x01(\t\"o\n\x08Metadata\x12\x1a\n\x12processing_time_ms\x18\x01 \x01(\x03\x12\x17\n\x0f\x63hunks_analyzed\x18\x02 \x01(\x05\x12\x1a\n\x12\x64ocuments_searched\x18\x03 \x01(\x05\x12\x12\n\nmodel_used\x18\x04 \x01(\t\"\xad\x01\n\rUploadRequest\x12\r\n\x05title\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x39\n\x08metadata\x18\x03 \x03(\x0b\x32\'.plagiarism.UploadRequest.MetadataEntry\x12\x10\n\x08language\x18\x04 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"n\n\x0eUploadResponse\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x16\n\x0e\x63hunks_created\x18\x03 \x01(\x05\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\"}\n\x13\x42\x61tchUploadResponse\x12\x17\n\x0ftotal_documents\x18\x01 \x01(\x05\x12\x12\n\nsuccessful\x18\x02 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x03 \x01(\x05\x12)\n\x07results\x18\x04 \x03(\x0b\x32\x18.plagiarism.UploadResult\"R\n\x0cUploadResult\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"Z\n\x12GetDocumentRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x17\n\x0finclude_content\x18\x02 \x01(\x08\x12\x16\n\x0einclude_chunks\x18\x03 \x01(\x08\"L\n\x13GetDocumentResponse\x12&\n\x08\x64ocument\x18\x01 \x01(\x0b\x32\x14.plagiarism.Document\x12\r\n\x05\x66ound\x18\x02 \x01(\x08\"\x98\x02\n\x08\x44ocument\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x34\n\x08metadata\x18\x04 \x03(\x0b\x32\".plagiarism.Document.MetadataEntry\x12\x10\n\x08language\x18\x05 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x06 \x01(\x05\x12!\n\x06\x63hunks\x18\x07 \x03(\x0b\x32\x11.plagiarism.Chunk\x12\x12\n\ncreated_at\x18\x08 \x01(\t\x12\x12\n\nupdated_at\x18\t \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"M\n\x05\x43hunk\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x10\n\x08position\x18\x03 \x01(\x05\x12\x12\n\nword_count\x18\x04 \x01(\x05\",\n\x15\x44\x65leteDocumentRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\":\n\x16\x44\x65leteDocumentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xa6\x01\n\rSearchRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x37\n\x07\x66ilters\x18\x02 \x03(\x0b\x32&.plagiarism.SearchRequest.FiltersEntry\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x0e\n\x06offset\x18\x04 \x01(\x05\x1a.\n\x0c\x46iltersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"O\n\x0eSearchResponse\x12.\n\tdocuments\x18\x01 \x03(\x0b\x32\x1b.plagiarism.DocumentSummary\x12\r\n\x05total\x18\x02 \x01(\x05\"\xde\x01\n\x0f\x44ocumentSummary\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12;\n\x08metadata\x18\x03 \x03(\x0b\x32).plagiarism.DocumentSummary.MetadataEntry\x12\x10\n\x08language\x18\x04 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x05 \x01(\x05\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x14\n\x12HealthCheckRequest\"\xbb\x01\n\x13HealthCheckResponse\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12\x43\n\ncomponents\x18\x02 \x03(\x0b\x32/.plagiarism.HealthCheckResponse.ComponentsEntry\x1aN\n\x0f\x43omponentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12*\n\x05value\x18\x02 \x01(\x0b\x32\x1b.plagiarism.ComponentHealth:\x02\x38\x01\"G\n\x0f\x43omponentHealth\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nlatency_ms\x18\x03 \x01(\x03\"\xf1\x01\n\x18IndexPdfFromMinioRequest\x12\x13\n\x0b\x62ucket_name\x18\x01 \x01(\t\x12\x13\n\x0bobject_path\x18\x02 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x03 \x01(\t\x12\r\n\x05title\x18\x04 \x01(\t\x12\x44\n\x08metadata\x18\x05 \x03(\x0b\x32\x32.plagiarism.IndexPdfFromMinioRequest.MetadataEntry\x12\x10\n\x08language\x18\x06 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe7\x01\n\x19IndexPdfFromMinioResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x04 \x01(\x05\x12(\n\x06\x63hunks\x18\x05 \x03(\x0b\x32\x18.plagiarism.PdfChunkInfo\x12\x15\n\rerror_message\x18\x06 \x01(\t\x12>\n\x13processing_metadata\x18\x07 \x01(\x0b\x32!.plagiarism.PdfProcessingMetadata\"\x8c\x01\n\x0cPdfChunkInfo\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x15\n\rsection_title\x18\x02 \x01(\t\x12\x17\n\x0f\x63ontent_preview\x18\x03 \x01(\t\x12\x14\n\x0c\x65lement_type\x18\x04 \x01(\t\x12\x10\n\x08position\x18\x05 \x01(\x05\x12\x12\n\nword_count\x18\x06 \x01(\x05\"\x9d\x01\n\x15PdfProcessingMetadata\x12\x13\n\x0btotal_pages\x18\x01 \x01(\x05\x12\x16\n\x0etotal_elements\x18\x02 \x01(\x05\x12\x14\n\x0ctotal_chunks\x18\x03 \x01(\x05\x12\x1a\n\x12processing_time_ms\x18\x04 \x01(\x03\x12\x11\n\tpdf_title\x18\x05 \x01(\t\x12\x12\n\npdf_author\x18\x06 \x01(\t\"o\n\x18\x43heckPdfFromMinioRequest\x12\x13\n\x0b\x62ucket_name\x18\x01 \x01(\t\x12\x13\n\x0bobject_path\x18\x02 \x01(\t\x12)\n\x07options\x18\x03 \x01(\x0b\x32\x18.plagiarism.CheckOptions\"\xca\x02\n\x19\x43heckPdfFromMinioResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nrequest_id\x18\x02 \x01(\t\x12\x16\n\x0e\x64ocument_title\x18\x03 \x01(\t\x12\x1d\n\x15plagiarism_percentage\x18\x04 \x01(\x02\x12&\n\x08severity\x18\x05 \x01(\x0e\x32\x14.plagiarism.Severity\x12\x13\n\x0b\x65xplanation\x18\x06 \x01(\t\x12\"\n\x07matches\x18\x07 \x03(\x0b\x32\x11.plagiarism.Match\x12)\n\x06\x63hunks\x18\x08 \x03(\x0b\x32\x19.plagiarism.ChunkAnalysis\x12.\n\x08metadata\x18\t \x01(\x0b\x32\x1c.plagiarism.PdfCheckMetadata\x12\x15\n\rerror_message\x18\n \x01(\t\"\xf5\x01\n\x10PdfCheckMetadata\x12\x1a\n\x12processing_time_ms\x18\x01 \x01(\x03\x12\x1e\n\x16pdf_extraction_time_ms\x18\x02 \x01(\x03\x12\x19\n\x11\x65mbedding_time_ms\x18\x03 \x01(\x03\x12\x16\n\x0esearch_time_ms\x18\x04 \x01(\x03\x12\x13\n\x0btotal_pages\x18\x05 \x01(\x05\x12\x14\n\x0ctotal_chunks\x18\x06 \x01(\x05\x12\x17\n\x0f\x63hunks_analyzed\x18\x07 \x01(\x05\x12\x1a\n\x12\x64ocuments_searched\x18\x08 \x01(\x05\x12\x12\n\nmodel_used\x18\t \x01(\t*A\n\x08Severity\x12\x08\n\x04SAFE\x10\x00\x12\x07\n\x03LOW\x10\x01\x12\n\n\x06MEDIUM\x10\x02\x12\x08\n\x04HIGH\x10\x03\x12\x0c\n\x08\x43RITICAL\x10\x04\x32\xf8\x05\n\x11PlagiarismService\x12\x46\n\x0f\x43heckPlagiarism\x12\x18.plagiarism.CheckRequest\x1a\x19.plagiarism.CheckResponse\x12G\n\x0eUploadDocument\x12\x19.plagiarism.UploadRequest\x1a\x1a.plagiarism.UploadResponse\x12K\n\x0b\x42\x61tchUpload\x12\x19.plagiarism.UploadRequest\x1a\x1f.plagiarism.BatchUploadResponse(\x01\x12N\n\x0bGetDocument\x12\x1e.plagiarism.GetDocumentRequest\x1a\x1f.plagiarism.GetDocumentResponse\x12W\n\x0e\x44\x65leteDocument\x12!.plagiarism.DeleteDocumentRequest\x1a\".plagiarism.DeleteDocumentResponse\x12H\n\x0fSearchDocuments\x12\x19.plagiarism.SearchRequest\x1a\x1a.plagiarism.SearchResponse\x12N\n\x0bHealthCheck\x12\x1e.plagiarism.HealthCheckRequest\x1a\x1f.plagiarism.HealthCheckResponse\x12`\n\x11IndexPdfFromMinio\x12$.plagiarism.IndexPdfFromMinioRequest\x1a%.plagiarism.IndexPdfFromMinioResponse\x12`\n\x11\x43heckPdfFromMinio\x12$.plagiarism.CheckPdfFromMinioRequest\x1a%.plagiarism.CheckPdfFromMinioResponseB\x12Z\x10plagiarism/protob\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10plagiarism.proto\x12\nplagiarism\"G\n\x0c\x43heckRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\x12)\n\x07options\x18\x02 \x01(\x0b\x32\x18.plagiarism.CheckOptions\"\xe4\x01\n\x0c\x43heckOptions\x12\x1b\n\x0emin_similarity\x18\x01 \x01(\x02H\x00\x88\x01\x01\x12\x12\n\x05top_k\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12 \n\x13include_ai_analysis\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12\x14\n\x0c\x65xclude_docs\x18\x04 \x03(\t\x12\x1f\n\x12include_chunk_text\x18\x05 \x01(\x08H\x03\x88\x01\x01\x42\x11\n\x0f_min_similarityB\x08\n\x06_top_kB\x16\n\x14_include_ai_analysisB\x15\n\x13_include_chunk_text\"\xf6\x01\n\rCheckResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x1d\n\x15plagiarism_percentage\x18\x02 \x01(\x02\x12&\n\x08severity\x18\x03 \x01(\x0e\x32\x14.plagiarism.Severity\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\x12\"\n\x07matches\x18\x05 \x03(\x0b\x32\x11.plagiarism.Match\x12)\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x19.plagiarism.ChunkAnalysis\x12&\n\x08metadata\x18\x07 \x01(\x0b\x32\x14.plagiarism.Metadata\"\x8c\x01\n\x10\x43heckChunkUpdate\x12(\n\x05\x63hunk\x18\x01 \x01(\x0b\x32\x19.plagiarism.ChunkAnalysis\x12\"\n\x07matches\x18\x02 \x03(\x0b\x32\x11.plagiarism.Match\x12*\n\x07summary\x18\x03 \x01(\x0b\x32\x19.plagiarism.CheckResponse\"\xa0\x01\n\x05Match\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x16\n\x0e\x64ocument_title\x18\x02 \x01(\t\x12\x14\n\x0cmatched_text\x18\x03 \x01(\t\x12\x12\n\ninput_text\x18\x04 \x01(\t\x12\x18\n\x10similarity_score\x18\x05 \x01(\x02\x12&\n\x08position\x18\x06 \x01(\x0b\x32\x14.plagiarism.Position\";\n\x08Position\x12\r\n\x05start\x18\x01 \x01(\x05\x12\x0b\n\x03\x65nd\x18\x02 \x01(\x05\x12\x13\n\x0b\x63hunk_index\x18\x03 \x01(\x05\"\x8b\x01\n\rChunkAnalysis\x12\x13\n\x0b\x63hunk_index\x18\x01 \x01(\x05\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x16\n\x0emax_similarity\x18\x03 \x01(\x02\x12$\n\x06status\x18\x04 \x01(\x0e\x32\x14.plagiarism.Severity\x12\x19\n\x11\x62\x65st_match_doc_id\x18\x05 \x01(\t\"o\n\x08Metadata\x12\x1a\n\x12processing_time_ms\x18\x01 \x01(\x03\x12\x17\n\x0f\x63hunks_analyzed\x18\x02 \x01(\x05\x12\x1a\n\x12\x64ocuments_searched\x18\x03 \x01(\x05\x12\x12\n\nmodel_used\x18\x04 \x01(\t\"\xad\x01\n\rUploadRequest\x12\r\n\x05title\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x39\n\x08metadata\x18\x03 \x03(\x0b\x32\'.plagiarism.UploadRequest.MetadataEntry\x12\x10\n\x08language\x18\x04 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"n\n\x0eUploadResponse\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x16\n\x0e\x63hunks_created\x18\x03 \x01(\x05\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\"}\n\x13\x42\x61tchUploadResponse\x12\x17\n\x0ftotal_documents\x18\x01 \x01(\x05\x12\x12\n\nsuccessful\x18\x02 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x03 \x01(\x05\x12)\n\x07results\x18\x04 \x03(\x0b\x32\x18.plagiarism.UploadResult\"R\n\x0cUploadResult\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"Z\n\x12GetDocumentRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x17\n\x0finclude_content\x18\x02 \x01(\x08\x12\x16\n\x0einclude_chunks\x18\x03 \x01(\x08\"L\n\x13GetDocumentResponse\x12&\n\x08\x64ocument\x18\x01 \x01(\x0b\x32\x14.plagiarism.Document\x12\r\n\x05\x66ound\x18\x02 \x01(\x08\"\x98\x02\n\x08\x44ocument\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x34\n\x08metadata\x18\x04 \x03(\x0b\x32\".plagiarism.Document.MetadataEntry\x12\x10\n\x08language\x18\x05 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x06 \x01(\x05\x12!\n\x06\x63hunks\x18\x07 \x03(\x0b\x32\x11.plagiarism.Chunk\x12\x12\n\ncreated_at\x18\x08 \x01(\t\x12\x12\n\nupdated_at\x18\t \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"M\n\x05\x43hunk\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x10\n\x08position\x18\x03 \x01(\x05\x12\x12\n\nword_count\x18\x04 \x01(\x05\"W\n\nChunkBatch\x12&\n\x08\x64ocument\x18\x01 \x01(\x0b\x32\x14.plagiarism.Document\x12!\n\x06\x63hunks\x18\x02 \x03(\x0b\x32\x11.plagiarism.Chunk\",\n\x15\x44\x65leteDocumentRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\":\n\x16\x44\x65leteDocumentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xb6\x01\n\rSearchRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x37\n\x07\x66ilters\x18\x02 \x03(\x0b\x32&.plagiarism.SearchRequest.FiltersEntry\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x0e\n\x06offset\x18\x04 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x05 \x01(\t\x1a.\n\x0c\x46iltersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"d\n\x0eSearchResponse\x12.\n\tdocuments\x18\x01 \x03(\x0b\x32\x1b.plagiarism.DocumentSummary\x12\r\n\x05total\x18\x02 \x01(\x05\x12\x13\n\x0bnext_cursor\x18\x03 \x01(\t\"\xde\x01\n\x0f\x44ocumentSummary\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12;\n\x08metadata\x18\x03 \x03(\x0b\x32).plagiarism.DocumentSummary.MetadataEntry\x12\x10\n\x08language\x18\x04 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x05 \x01(\x05\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x14\n\x12HealthCheckRequest\"\xbb\x01\n\x13HealthCheckResponse\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12\x43\n\ncomponents\x18\x02 \x03(\x0b\x32/.plagiarism.HealthCheckResponse.ComponentsEntry\x1aN\n\x0f\x43omponentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12*\n\x05value\x18\x02 \x01(\x0b\x32\x1b.plagiarism.ComponentHealth:\x02\x38\x01\"G\n\x0f\x43omponentHealth\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nlatency_ms\x18\x03 \x01(\x03\"\xf1\x01\n\x18IndexPdfFromMinioRequest\x12\x13\n\x0b\x62ucket_name\x18\x01 \x01(\t\x12\x13\n\x0bobject_path\x18\x02 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x03 \x01(\t\x12\r\n\x05title\x18\x04 \x01(\t\x12\x44\n\x08metadata\x18\x05 \x03(\x0b\x32\x32.plagiarism.IndexPdfFromMinioRequest.MetadataEntry\x12\x10\n\x08language\x18\x06 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe7\x01\n\x19IndexPdfFromMinioResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x04 \x01(\x05\x12(\n\x06\x63hunks\x18\x05 \x03(\x0b\x32\x18.plagiarism.PdfChunkInfo\x12\x15\n\rerror_message\x18\x06 \x01(\t\x12>\n\x13processing_metadata\x18\x07 \x01(\x0b\x32!.plagiarism.PdfProcessingMetadata\"\x8c\x01\n\x0cPdfChunkInfo\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x15\n\rsection_title\x18\x02 \x01(\t\x12\x17\n\x0f\x63ontent_preview\x18\x03 \x01(\t\x12\x14\n\x0c\x65lement_type\x18\x04 \x01(\t\x12\x10\n\x08position\x18\x05 \x01(\x05\x12\x12\n\nword_count\x18\x06 \x01(\x05\"\x9d\x01\n\x15PdfProcessingMetadata\x12\x13\n\x0btotal_pages\x18\x01 \x01(\x05\x12\x16\n\x0etotal_elements\x18\x02 \x01(\x05\x12\x14\n\x0ctotal_chunks\x18\x03 \x01(\x05\x12\x1a\n\x12processing_time_ms\x18\x04 \x01(\x03\x12\x11\n\tpdf_title\x18\x05 \x01(\t\x12\x12\n\npdf_author\x18\x06 \x01(\t\"o\n\x18\x43heckPdfFromMinioRequest\x12\x13\n\x0b\x62ucket_name\x18\x01 \x01(\t\x12\x13\n\x0bobject_path\x18\x02 \x01(\t\x12)\n\x07options\x18\x03 \x01(\x0b\x32\x18.plagiarism.CheckOptions\"\xca\x02\n\x19\x43heckPdfFromMinioResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nrequest_id\x18\x02 \x01(\t\x12\x16\n\x0e\x64ocument_title\x18\x03 \x01(\t\x12\x1d\n\x15plagiarism_percentage\x18\x04 \x01(\x02\x12&\n\x08severity\x18\x05 \x01(\x0e\x32\x14.plagiarism.Severity\x12\x13\n\x0b\x65xplanation\x18\x06 \x01(\t\x12\"\n\x07matches\x18\x07 \x03(\x0b\x32\x11.plagiarism.Match\x12)\n\x06\x63hunks\x18\x08 \x03(\x0b\x32\x19.plagiarism.ChunkAnalysis\x12.\n\x08metadata\x18\t \x01(\x0b\x32\x1c.plagiarism.PdfCheckMetadata\x12\x15\n\rerror_message\x18\n \x01(\t\"\xf5\x01\n\x10PdfCheckMetadata\x12\x1a\n\x12processing_time_ms\x18\x01 \x01(\x03\x12\x1e\n\x16pdf_extraction_time_ms\x18\x02 \x01(\x03\x12\x19\n\x11\x65mbedding_time_ms\x18\x03 \x01(\x03\x12\x16\n\x0esearch_time_ms\x18\x04 \x01(\x03\x12\x13\n\x0btotal_pages\x18\x05 \x01(\x05\x12\x14\n\x0ctotal_chunks\x18\x06 \x01(\x05\x12\x17\n\x0f\x63hunks_analyzed\x18\x07 \x01(\x05\x12\x1a\n\x12\x64ocuments_searched\x18\x08 \x01(\x05\x12\x12\n\nmodel_used\x18\t \x01(\t*A\n\x08Severity\x12\x08\n\x04SAFE\x10\x00\x12\x07\n\x03LOW\x10\x01\x12\n\n\x06MEDIUM\x10\x02\x12\x08\n\x04HIGH\x10\x03\x12\x0c\n\x08\x43RITICAL\x10\x04\x32\xe8\x07\n\x11PlagiarismService\x12\x46\n\x0f\x43heckPlagiarism\x12\x18.plagiarism.CheckRequest\x1a\x19.plagiarism.CheckResponse\x12Q\n\x15\x43heckPlagiarismStream\x12\x18.plagiarism.CheckRequest\x1a\x1c.plagiarism.CheckChunkUpdate0\x01\x12G\n\x0eUploadDocument\x12\x19.plagiarism.UploadRequest\x1a\x1a.plagiarism.UploadResponse\x12K\n\x0b\x42\x61tchUpload\x12\x19.plagiarism.UploadRequest\x1a\x1f.plagiarism.BatchUploadResponse(\x01\x12L\n\x11\x42\x61tchUploadStream\x12\x19.plagiarism.UploadRequest\x1a\x18.plagiarism.UploadResult(\x01\x30\x01\x12N\n\x0bGetDocument\x12\x1e.plagiarism.GetDocumentRequest\x1a\x1f.plagiarism.GetDocumentResponse\x12M\n\x11GetDocumentStream\x12\x1e.plagiarism.GetDocumentRequest\x1a\x16.plagiarism.ChunkBatch0\x01\x12W\n\x0e\x44\x65leteDocument\x12!.plagiarism.DeleteDocumentRequest\x1a\".plagiarism.DeleteDocumentResponse\x12H\n\x0fSearchDocuments\x12\x19.plagiarism.SearchRequest\x1a\x1a.plagiarism.SearchResponse\x12N\n\x0bHealthCheck\x12\x1e.plagiarism.HealthCheckRequest\x1a\x1f.plagiarism.HealthCheckResponse\x12`\n\x11IndexPdfFromMinio\x12$.plagiarism.IndexPdfFromMinioRequest\x1a%.plagiarism.IndexPdfFromMinioResponse\x12`\n\x11\x43heckPdfFromMinio\x12$.plagiarism.CheckPdfFromMinioRequest\x1a%.plagiarism.CheckPdfFromMinioResponseB\x12Z\x10plagiarism/protob\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -44,80 +44,84 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_options = b'8\001'
   _globals['_INDEXPDFFROMMINIOREQUEST_METADATAENTRY']._loaded_options = None
   _globals['_INDEXPDFFROMMINIOREQUEST_METADATAENTRY']._serialized_options = b'8\001'
-  _globals['_SEVERITY']._serialized_start=4380
-  _globals['_SEVERITY']._serialized_end=4445
+  _globals['_SEVERITY']._serialized_start=4705
+  _globals['_SEVERITY']._serialized_end=4770
   _globals['_CHECKREQUEST']._serialized_start=32
   _globals['_CHECKREQUEST']._serialized_end=103
   _globals['_CHECKOPTIONS']._serialized_start=106
-  _globals['_CHECKOPTIONS']._serialized_end=278
-  _globals['_CHECKRESPONSE']._serialized_start=281
-  _globals['_CHECKRESPONSE']._serialized_end=527
-  _globals['_MATCH']._serialized_start=530
-  _globals['_MATCH']._serialized_end=690
-  _globals['_POSITION']._serialized_start=692
-  _globals['_POSITION']._serialized_end=751
-  _globals['_CHUNKANALYSIS']._serialized_start=754
-  _globals['_CHUNKANALYSIS']._serialized_end=893
-  _globals['_METADATA']._serialized_start=895
-  _globals['_METADATA']._serialized_end=1006
-  _globals['_UPLOADREQUEST']._serialized_start=1009
-  _globals['_UPLOADREQUEST']._serialized_end=1182
-  _globals['_UPLOADREQUEST_METADATAENTRY']._serialized_start=1135
-  _globals['_UPLOADREQUEST_METADATAENTRY']._serialized_end=1182
-  _globals['_UPLOADRESPONSE']._serialized_start=1184
-  _globals['_UPLOADRESPONSE']._serialized_end=1294
-  _globals['_BATCHUPLOADRESPONSE']._serialized_start=1296
-  _globals['_BATCHUPLOADRESPONSE']._serialized_end=1421
-  _globals['_UPLOADRESULT']._serialized_start=1423
-  _globals['_UPLOADRESULT']._serialized_end=1505
-  _globals['_GETDOCUMENTREQUEST']._serialized_start=1507
-  _globals['_GETDOCUMENTREQUEST']._serialized_end=1597
-  _globals['_GETDOCUMENTRESPONSE']._serialized_start=1599
-  _globals['_GETDOCUMENTRESPONSE']._serialized_end=1675
-  _globals['_DOCUMENT']._serialized_start=1678
-  _globals['_DOCUMENT']._serialized_end=1958
-  _globals['_DOCUMENT_METADATAENTRY']._serialized_start=1135
-  _globals['_DOCUMENT_METADATAENTRY']._serialized_end=1182
-  _globals['_CHUNK']._serialized_start=1960
-  _globals['_CHUNK']._serialized_end=2037
-  _globals['_DELETEDOCUMENTREQUEST']._serialized_start=2039
-  _globals['_DELETEDOCUMENTREQUEST']._serialized_end=2083
-  _globals['_DELETEDOCUMENTRESPONSE']._serialized_start=2085
-  _globals['_DELETEDOCUMENTRESPONSE']._serialized_end=2143
-  _globals['_SEARCHREQUEST']._serialized_start=2146
-  _globals['_SEARCHREQUEST']._serialized_end=2312
-  _globals['_SEARCHREQUEST_FILTERSENTRY']._serialized_start=2266
-  _globals['_SEARCHREQUEST_FILTERSENTRY']._serialized_end=2312
-  _globals['_SEARCHRESPONSE']._serialized_start=2314
-  _globals['_SEARCHRESPONSE']._serialized_end=2393
-  _globals['_DOCUMENTSUMMARY']._serialized_start=2396
-  _globals['_DOCUMENTSUMMARY']._serialized_end=2618
-  _globals['_DOCUMENTSUMMARY_METADATAENTRY']._serialized_start=1135
-  _globals['_DOCUMENTSUMMARY_METADATAENTRY']._serialized_end=1182
-  _globals['_HEALTHCHECKREQUEST']._serialized_start=2620
-  _globals['_HEALTHCHECKREQUEST']._serialized_end=2640
-  _globals['_HEALTHCHECKRESPONSE']._serialized_start=2643
-  _globals['_HEALTHCHECKRESPONSE']._serialized_end=2830
-  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_start=2752
-  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_end=2830
-  _globals['_COMPONENTHEALTH']._serialized_start=2832
-  _globals['_COMPONENTHEALTH']._serialized_end=2903
-  _globals['_INDEXPDFFROMMINIOREQUEST']._serialized_start=2906
-  _globals['_INDEXPDFFROMMINIOREQUEST']._serialized_end=3147
-  _globals['_INDEXPDFFROMMINIOREQUEST_METADATAENTRY']._serialized_start=1135
-  _globals['_INDEXPDFFROMMINIOREQUEST_METADATAENTRY']._serialized_end=1182
-  _globals['_INDEXPDFFROMMINIORESPONSE']._serialized_start=3150
-  _globals['_INDEXPDFFROMMINIORESPONSE']._serialized_end=3381
-  _globals['_PDFCHUNKINFO']._serialized_start=3384
-  _globals['_PDFCHUNKINFO']._serialized_end=3524
-  _globals['_PDFPROCESSINGMETADATA']._serialized_start=3527
-  _globals['_PDFPROCESSINGMETADATA']._serialized_end=3684
-  _globals['_CHECKPDFFROMMINIOREQUEST']._serialized_start=3686
-  _globals['_CHECKPDFFROMMINIOREQUEST']._serialized_end=3797
-  _globals['_CHECKPDFFROMMINIORESPONSE']._serialized_start=3800
-  _globals['_CHECKPDFFROMMINIORESPONSE']._serialized_end=4130
-  _globals['_PDFCHECKMETADATA']._serialized_start=4133
-  _globals['_PDFCHECKMETADATA']._serialized_end=4378
-  _globals['_PLAGIARISMSERVICE']._serialized_start=4448
-  _globals['_PLAGIARISMSERVICE']._serialized_end=5208
+  _globals['_CHECKOPTIONS']._serialized_end=334
+  _globals['_CHECKRESPONSE']._serialized_start=337
+  _globals['_CHECKRESPONSE']._serialized_end=583
+  _globals['_CHECKCHUNKUPDATE']._serialized_start=586
+  _globals['_CHECKCHUNKUPDATE']._serialized_end=726
+  _globals['_MATCH']._serialized_start=729
+  _globals['_MATCH']._serialized_end=889
+  _globals['_POSITION']._serialized_start=891
+  _globals['_POSITION']._serialized_end=950
+  _globals['_CHUNKANALYSIS']._serialized_start=953
+  _globals['_CHUNKANALYSIS']._serialized_end=1092
+  _globals['_METADATA']._serialized_start=1094
+  _globals['_METADATA']._serialized_end=1205
+  _globals['_UPLOADREQUEST']._serialized_start=1208
+  _globals['_UPLOADREQUEST']._serialized_end=1381
+  _globals['_UPLOADREQUEST_METADATAENTRY']._serialized_start=1334
+  _globals['_UPLOADREQUEST_METADATAENTRY']._serialized_end=1381
+  _globals['_UPLOADRESPONSE']._serialized_start=1383
+  _globals['_UPLOADRESPONSE']._serialized_end=1493
+  _globals['_BATCHUPLOADRESPONSE']._serialized_start=1495
+  _globals['_BATCHUPLOADRESPONSE']._serialized_end=1620
+  _globals['_UPLOADRESULT']._serialized_start=1622
+  _globals['_UPLOADRESULT']._serialized_end=1704
+  _globals['_GETDOCUMENTREQUEST']._serialized_start=1706
+  _globals['_GETDOCUMENTREQUEST']._serialized_end=1796
+  _globals['_GETDOCUMENTRESPONSE']._serialized_start=1798
+  _globals['_GETDOCUMENTRESPONSE']._serialized_end=1874
+  _globals['_DOCUMENT']._serialized_start=1877
+  _globals['_DOCUMENT']._serialized_end=2157
+  _globals['_DOCUMENT_METADATAENTRY']._serialized_start=1334
+  _globals['_DOCUMENT_METADATAENTRY']._serialized_end=1381
+  _globals['_CHUNK']._serialized_start=2159
+  _globals['_CHUNK']._serialized_end=2236
+  _globals['_CHUNKBATCH']._serialized_start=2238
+  _globals['_CHUNKBATCH']._serialized_end=2325
+  _globals['_DELETEDOCUMENTREQUEST']._serialized_start=2327
+  _globals['_DELETEDOCUMENTREQUEST']._serialized_end=2371
+  _globals['_DELETEDOCUMENTRESPONSE']._serialized_start=2373
+  _globals['_DELETEDOCUMENTRESPONSE']._serialized_end=2431
+  _globals['_SEARCHREQUEST']._serialized_start=2434
+  _globals['_SEARCHREQUEST']._serialized_end=2616
+  _globals['_SEARCHREQUEST_FILTERSENTRY']._serialized_start=2570
+  _globals['_SEARCHREQUEST_FILTERSENTRY']._serialized_end=2616
+  _globals['_SEARCHRESPONSE']._serialized_start=2618
+  _globals['_SEARCHRESPONSE']._serialized_end=2718
+  _globals['_DOCUMENTSUMMARY']._serialized_start=2721
+  _globals['_DOCUMENTSUMMARY']._serialized_end=2943
+  _globals['_DOCUMENTSUMMARY_METADATAENTRY']._serialized_start=1334
+  _globals['_DOCUMENTSUMMARY_METADATAENTRY']._serialized_end=1381
+  _globals['_HEALTHCHECKREQUEST']._serialized_start=2945
+  _globals['_HEALTHCHECKREQUEST']._serialized_end=2965
+  _globals['_HEALTHCHECKRESPONSE']._serialized_start=2968
+  _globals['_HEALTHCHECKRESPONSE']._serialized_end=3155
+  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_start=3077
+  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_end=3155
+  _globals['_COMPONENTHEALTH']._serialized_start=3157
+  _globals['_COMPONENTHEALTH']._serialized_end=3228
+  _globals['_INDEXPDFFROMMINIOREQUEST']._serialized_start=3231
+  _globals['_INDEXPDFFROMMINIOREQUEST']._serialized_end=3472
+  _globals['_INDEXPDFFROMMINIOREQUEST_METADATAENTRY']._serialized_start=1334
+  _globals['_INDEXPDFFROMMINIOREQUEST_METADATAENTRY']._serialized_end=1381
+  _globals['_INDEXPDFFROMMINIORESPONSE']._serialized_start=3475
+  _globals['_INDEXPDFFROMMINIORESPONSE']._serialized_end=3706
+  _globals['_PDFCHUNKINFO']._serialized_start=3709
+  _globals['_PDFCHUNKINFO']._serialized_end=3849
+  _globals['_PDFPROCESSINGMETADATA']._serialized_start=3852
+  _globals['_PDFPROCESSINGMETADATA']._serialized_end=4009
+  _globals['_CHECKPDFFROMMINIOREQUEST']._serialized_start=4011
+  _globals['_CHECKPDFFROMMINIOREQUEST']._serialized_end=4122
+  _globals['_CHECKPDFFROMMINIORESPONSE']._serialized_start=4125
+  _globals['_CHECKPDFFROMMINIORESPONSE']._serialized_end=4455
+  _globals['_PDFCHECKMETADATA']._serialized_start=4458
+  _globals['_PDFCHECKMETADATA']._serialized_end=4703
+  _globals['_PLAGIARISMSERVICE']._serialized_start=4773
+  _globals['_PLAGIARISMSERVICE']._serialized_end=5773
 # @@protoc_insertion_point(module_scope)
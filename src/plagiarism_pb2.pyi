@@ -29,16 +29,18 @@ class CheckRequest(_message.Message):
     def __init__(self, text: _Optional[str] = ..., options: _Optional[_Union[CheckOptions, _Mapping]] = ...) -> None: ...
 
 class CheckOptions(_message.Message):
-    __slots__ = ("min_similarity", "top_k", "include_ai_analysis", "exclude_docs")
+    __slots__ = ("min_similarity", "top_k", "include_ai_analysis", "exclude_docs", "include_chunk_text")
     MIN_SIMILARITY_FIELD_NUMBER: _ClassVar[int]
     TOP_K_FIELD_NUMBER: _ClassVar[int]
     INCLUDE_AI_ANALYSIS_FIELD_NUMBER: _ClassVar[int]
     EXCLUDE_DOCS_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_CHUNK_TEXT_FIELD_NUMBER: _ClassVar[int]
     min_similarity: float
     top_k: int
     include_ai_analysis: bool
     exclude_docs: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, min_similarity: _Optional[float] = ..., top_k: _Optional[int] = ..., include_ai_analysis: bool = ..., exclude_docs: _Optional[_Iterable[str]] = ...) -> None: ...
+    include_chunk_text: bool
+    def __init__(self, min_similarity: _Optional[float] = ..., top_k: _Optional[int] = ..., include_ai_analysis: bool = ..., exclude_docs: _Optional[_Iterable[str]] = ..., include_chunk_text: bool = ...) -> None: ...
 
 class CheckResponse(_message.Message):
     __slots__ = ("request_id", "plagiarism_percentage", "severity", "explanation", "matches", "chunks", "metadata")
@@ -58,6 +60,16 @@ class CheckResponse(_message.Message):
     metadata: Metadata
     def __init__(self, request_id: _Optional[str] = ..., plagiarism_percentage: _Optional[float] = ..., severity: _Optional[_Union[Severity, str]] = ..., explanation: _Optional[str] = ..., matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., chunks: _Optional[_Iterable[_Union[ChunkAnalysis, _Mapping]]] = ..., metadata: _Optional[_Union[Metadata, _Mapping]] = ...) -> None: ...
 
+class CheckChunkUpdate(_message.Message):
+    __slots__ = ("chunk", "matches", "summary")
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    MATCHES_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_FIELD_NUMBER: _ClassVar[int]
+    chunk: ChunkAnalysis
+    matches: _containers.RepeatedCompositeFieldContainer[Match]
+    summary: CheckResponse
+    def __init__(self, chunk: _Optional[_Union[ChunkAnalysis, _Mapping]] = ..., matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., summary: _Optional[_Union[CheckResponse, _Mapping]] = ...) -> None: ...
+
 class Match(_message.Message):
     __slots__ = ("document_id", "document_title", "matched_text", "input_text", "similarity_score", "position")
     DOCUMENT_ID_FIELD_NUMBER: _ClassVar[int]
@@ -226,6 +238,14 @@ class Chunk(_message.Message):
     word_count: int
     def __init__(self, chunk_id: _Optional[str] = ..., text: _Optional[str] = ..., position: _Optional[int] = ..., word_count: _Optional[int] = ...) -> None: ...
 
+class ChunkBatch(_message.Message):
+    __slots__ = ("document", "chunks")
+    DOCUMENT_FIELD_NUMBER: _ClassVar[int]
+    CHUNKS_FIELD_NUMBER: _ClassVar[int]
+    document: Document
+    chunks: _containers.RepeatedCompositeFieldContainer[Chunk]
+    def __init__(self, document: _Optional[_Union[Document, _Mapping]] = ..., chunks: _Optional[_Iterable[_Union[Chunk, _Mapping]]] = ...) -> None: ...
+
 class DeleteDocumentRequest(_message.Message):
     __slots__ = ("document_id",)
     DOCUMENT_ID_FIELD_NUMBER: _ClassVar[int]
@@ -241,7 +261,7 @@ class DeleteDocumentResponse(_message.Message):
     def __init__(self, success: bool = ..., message: _Optional[str] = ...) -> None: ...
 
 class SearchRequest(_message.Message):
-    __slots__ = ("query", "filters", "limit", "offset")
+    __slots__ = ("query", "filters", "limit", "offset", "cursor")
     class FiltersEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -253,19 +273,23 @@ class SearchRequest(_message.Message):
     FILTERS_FIELD_NUMBER: _ClassVar[int]
     LIMIT_FIELD_NUMBER: _ClassVar[int]
     OFFSET_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
     query: str
     filters: _containers.ScalarMap[str, str]
     limit: int
     offset: int
-    def __init__(self, query: _Optional[str] = ..., filters: _Optional[_Mapping[str, str]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+    cursor: str
+    def __init__(self, query: _Optional[str] = ..., filters: _Optional[_Mapping[str, str]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ..., cursor: _Optional[str] = ...) -> None: ...
 
 class SearchResponse(_message.Message):
-    __slots__ = ("documents", "total")
+    __slots__ = ("documents", "total", "next_cursor")
     DOCUMENTS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
     documents: _containers.RepeatedCompositeFieldContainer[DocumentSummary]
     total: int
-    def __init__(self, documents: _Optional[_Iterable[_Union[DocumentSummary, _Mapping]]] = ..., total: _Optional[int] = ...) -> None: ...
+    next_cursor: str
+    def __init__(self, documents: _Optional[_Iterable[_Union[DocumentSummary, _Mapping]]] = ..., total: _Optional[int] = ..., next_cursor: _Optional[str] = ...) -> None: ...
 
 class DocumentSummary(_message.Message):
     __slots__ = ("document_id", "title", "metadata", "language", "chunk_count", "created_at")
@@ -25,7 +25,7 @@ if _version_not_supported:
     )
 
 
-class PlagiarismServiceStub(object):
+class PlagiarismServiceStub:
     """Plagiarism Detection Service
     """
 
@@ -40,6 +40,11 @@ class PlagiarismServiceStub(object):
                 request_serializer=plagiarism__pb2.CheckRequest.SerializeToString,
                 response_deserializer=plagiarism__pb2.CheckResponse.FromString,
                 _registered_method=True)
+        self.CheckPlagiarismStream = channel.unary_stream(
+                '/plagiarism.PlagiarismService/CheckPlagiarismStream',
+                request_serializer=plagiarism__pb2.CheckRequest.SerializeToString,
+                response_deserializer=plagiarism__pb2.CheckChunkUpdate.FromString,
+                _registered_method=True)
         self.UploadDocument = channel.unary_unary(
                 '/plagiarism.PlagiarismService/UploadDocument',
                 request_serializer=plagiarism__pb2.UploadRequest.SerializeToString,
@@ -50,11 +55,21 @@ class PlagiarismServiceStub(object):
                 request_serializer=plagiarism__pb2.UploadRequest.SerializeToString,
                 response_deserializer=plagiarism__pb2.BatchUploadResponse.FromString,
                 _registered_method=True)
+        self.BatchUploadStream = channel.stream_stream(
+                '/plagiarism.PlagiarismService/BatchUploadStream',
+                request_serializer=plagiarism__pb2.UploadRequest.SerializeToString,
+                response_deserializer=plagiarism__pb2.UploadResult.FromString,
+                _registered_method=True)
         self.GetDocument = channel.unary_unary(
                 '/plagiarism.PlagiarismService/GetDocument',
                 request_serializer=plagiarism__pb2.GetDocumentRequest.SerializeToString,
                 response_deserializer=plagiarism__pb2.GetDocumentResponse.FromString,
                 _registered_method=True)
+        self.GetDocumentStream = channel.unary_stream(
+                '/plagiarism.PlagiarismService/GetDocumentStream',
+                request_serializer=plagiarism__pb2.GetDocumentRequest.SerializeToString,
+                response_deserializer=plagiarism__pb2.ChunkBatch.FromString,
+                _registered_method=True)
         self.DeleteDocument = channel.unary_unary(
                 '/plagiarism.PlagiarismService/DeleteDocument',
                 request_serializer=plagiarism__pb2.DeleteDocumentRequest.SerializeToString,
@@ -82,7 +97,7 @@ class PlagiarismServiceStub(object):
                 _registered_method=True)
 
 
-class PlagiarismServiceServicer(object):
+class PlagiarismServiceServicer:
     """Plagiarism Detection Service
     """
 
@@ -93,6 +108,13 @@ class PlagiarismServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CheckPlagiarismStream(self, request, context):
+        """Check a text for plagiarism, streaming each chunk's analysis as it completes
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UploadDocument(self, request, context):
         """Upload a document to the database
         """
@@ -107,6 +129,13 @@ class PlagiarismServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchUploadStream(self, request_iterator, context):
+        """Batch upload documents, streaming each result back as it is indexed
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDocument(self, request, context):
         """Get document by ID
         """
@@ -114,6 +143,13 @@ class PlagiarismServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetDocumentStream(self, request, context):
+        """Get document by ID, streaming its chunks in batches
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteDocument(self, request, context):
         """Delete document
         """
@@ -157,6 +193,11 @@ def add_PlagiarismServiceServicer_to_server(servicer, server):
                     request_deserializer=plagiarism__pb2.CheckRequest.FromString,
                     response_serializer=plagiarism__pb2.CheckResponse.SerializeToString,
             ),
+            'CheckPlagiarismStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.CheckPlagiarismStream,
+                    request_deserializer=plagiarism__pb2.CheckRequest.FromString,
+                    response_serializer=plagiarism__pb2.CheckChunkUpdate.SerializeToString,
+            ),
             'UploadDocument': grpc.unary_unary_rpc_method_handler(
                     servicer.UploadDocument,
                     request_deserializer=plagiarism__pb2.UploadRequest.FromString,
@@ -167,11 +208,21 @@ def add_PlagiarismServiceServicer_to_server(servicer, server):
                     request_deserializer=plagiarism__pb2.UploadRequest.FromString,
                     response_serializer=plagiarism__pb2.BatchUploadResponse.SerializeToString,
             ),
+            'BatchUploadStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.BatchUploadStream,
+                    request_deserializer=plagiarism__pb2.UploadRequest.FromString,
+                    response_serializer=plagiarism__pb2.UploadResult.SerializeToString,
+            ),
             'GetDocument': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDocument,
                     request_deserializer=plagiarism__pb2.GetDocumentRequest.FromString,
                     response_serializer=plagiarism__pb2.GetDocumentResponse.SerializeToString,
             ),
+            'GetDocumentStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetDocumentStream,
+                    request_deserializer=plagiarism__pb2.GetDocumentRequest.FromString,
+                    response_serializer=plagiarism__pb2.ChunkBatch.SerializeToString,
+            ),
             'DeleteDocument': grpc.unary_unary_rpc_method_handler(
                     servicer.DeleteDocument,
                     request_deserializer=plagiarism__pb2.DeleteDocumentRequest.FromString,
@@ -205,7 +256,7 @@ def add_PlagiarismServiceServicer_to_server(servicer, server):
 
 
  # This class is part of an EXPERIMENTAL API.
-class PlagiarismService(object):
+class PlagiarismService:
     """Plagiarism Detection Service
     """
 
@@ -236,6 +287,33 @@ class PlagiarismService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CheckPlagiarismStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/plagiarism.PlagiarismService/CheckPlagiarismStream',
+            plagiarism__pb2.CheckRequest.SerializeToString,
+            plagiarism__pb2.CheckChunkUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UploadDocument(request,
             target,
@@ -290,6 +368,33 @@ class PlagiarismService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchUploadStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/plagiarism.PlagiarismService/BatchUploadStream',
+            plagiarism__pb2.UploadRequest.SerializeToString,
+            plagiarism__pb2.UploadResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDocument(request,
             target,
@@ -317,6 +422,33 @@ class PlagiarismService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetDocumentStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/plagiarism.PlagiarismService/GetDocumentStream',
+            plagiarism__pb2.GetDocumentRequest.SerializeToString,
+            plagiarism__pb2.ChunkBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DeleteDocument(request,
             target,
@@ -7,16 +7,18 @@ import sys
 from concurrent import futures
 
 import grpc
+from google.protobuf.internal import api_implementation
 
 from src import plagiarism_pb2_grpc
 from src.config import get_settings
-from src.logger import LoggingInterceptor, init_file_logger, get_file_logger
-from src.metrics import MetricsServer, MetricsInterceptor
+from src.logger import init_file_logger, get_file_logger
+from src.metrics import MetricsServer, CombinedInterceptor
 from src.services.plagiarism_service import PlagiarismServicer
 from src.storage import get_es_client
 from src.storage.minio_client import get_minio_client
 from src.embedding import get_ollama_client
 from src.core.analyzer import get_analyzer
+from src.core.pdf_processor import get_pdf_processor
 
 # Setup logging
 logging.basicConfig(
@@ -79,16 +81,33 @@ class PlagiarismServer:
         if not self.setup_elasticsearch():
             logger.warning("Elasticsearch setup failed, continuing anyway...")
 
-        # Create gRPC server with logging and metrics interceptors
+        # Building responses is protobuf-bound; the pure-Python backend is
+        # an order of magnitude slower than upb
+        protobuf_backend = api_implementation.Type()
+        if protobuf_backend == "python":
+            logger.warning(
+                "protobuf is using the pure-Python backend; unset "
+                "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION to use upb"
+            )
+        else:
+            logger.info(f"protobuf backend: {protobuf_backend}")
+
+        # Create gRPC server; one interceptor handles both logging and metrics
+        max_message_bytes = self.settings.grpc_max_message_mb * 1024 * 1024
         self.server = grpc.server(
             futures.ThreadPoolExecutor(max_workers=self.settings.grpc_max_workers),
             interceptors=[
-                LoggingInterceptor(),
-                MetricsInterceptor(service_name=self.settings.service_name),
+                CombinedInterceptor(service_name=self.settings.service_name),
             ],
+            # Uncompressed by default; large responses opt into gzip per call
+            compression=grpc.Compression.NoCompression,
             options=[
-                ("grpc.max_send_message_length", 50 * 1024 * 1024),  # 50MB
-                ("grpc.max_receive_message_length", 50 * 1024 * 1024),  # 50MB
+                ("grpc.max_send_message_length", max_message_bytes),
+                ("grpc.max_receive_message_length", max_message_bytes),
+                # Larger HTTP/2 window and frames for big PDF responses/uploads
+                ("grpc.http2.lookahead_bytes", 1024 * 1024),  # 1MB
+                ("grpc.http2.max_frame_size", 1024 * 1024),  # 1MB
+                ("grpc.http2.bdp_probe", 1),
             ],
         )
 
@@ -159,6 +178,7 @@ class PlagiarismServer:
             get_ollama_client().close()
             get_analyzer().close()
             get_minio_client().close()
+            get_pdf_processor().close()
 
             # Stop metrics server
             if self.metrics_server:
@@ -188,13 +208,16 @@ def main():
     # Update log level
     logging.getLogger().setLevel(settings.log_level)
 
-    logger.info("=" * 50)
-    logger.info("Plagiarism Detection Service")
-    logger.info("=" * 50)
-    logger.info(f"Elasticsearch: {settings.es_url}")
-    logger.info(f"Ollama: {settings.ollama_host}")
-    logger.info(f"gRPC Port: {settings.grpc_port}")
-    logger.info("=" * 50)
+    rule = "=" * 50
+    sys.stderr.write(
+        f"{rule}\n"
+        f"Plagiarism Detection Service\n"
+        f"{rule}\n"
+        f"Elasticsearch: {settings.es_url}\n"
+        f"Ollama: {settings.ollama_host}\n"
+        f"gRPC Port: {settings.grpc_port}\n"
+        f"{rule}\n"
+    )
 
     server = PlagiarismServer()
     server.start()
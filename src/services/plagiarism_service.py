@@ -1,11 +1,19 @@
 """gRPC Service implementation for Plagiarism Detection."""
 
+import base64
+import hashlib
+import json
 import logging
-from typing import Iterator
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
 
 import grpc
 
 from src import plagiarism_pb2, plagiarism_pb2_grpc
+from src.config import get_settings
 from src.core import (
     get_detector,
     get_document_manager,
@@ -16,6 +24,35 @@ from src.storage import get_es_client
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_INTERNAL = grpc.StatusCode.INTERNAL
+_NOT_FOUND = grpc.StatusCode.NOT_FOUND
+_INVALID_ARGUMENT = grpc.StatusCode.INVALID_ARGUMENT
+
+# Chunks per message sent by GetDocumentStream
+_CHUNK_BATCH_SIZE = 64
+
+# BatchUpload(Stream) flushes buffered documents to one bulk upload at either limit
+_BULK_UPLOAD_DOCS = 100
+_BULK_UPLOAD_BYTES = 1024 * 1024
+
+# Responses past either limit are sent gzip-compressed (roughly 64 KiB of text)
+_GZIP_MIN_ITEMS = 50
+_GZIP_MIN_CHARS = 64 * 1024
+
+# Worst-case UTF-8 bytes per character when sizing a response from its text
+_MAX_BYTES_PER_CHAR = 4
+
+# Severity names from core and AI results, mapped to the proto enum
+_SEVERITY = {
+    "SAFE": plagiarism_pb2.SAFE,
+    "LOW": plagiarism_pb2.LOW,
+    "MEDIUM": plagiarism_pb2.MEDIUM,
+    "HIGH": plagiarism_pb2.HIGH,
+    "CRITICAL": plagiarism_pb2.CRITICAL,
+}
+
 
 class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
     """gRPC service implementation for plagiarism detection."""
@@ -24,6 +61,21 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         self.detector = get_detector()
         self.doc_manager = get_document_manager()
         self.es_client = get_es_client()
+        settings = get_settings()
+        self.upload_workers = settings.batch_upload_workers
+        self.max_message_bytes = settings.grpc_max_message_mb * 1024 * 1024
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=self.upload_workers, thread_name_prefix="batch-upload"
+        )
+        # Liveness probes poll HealthCheck every few seconds; they share one
+        # get_stats result per TTL instead of each hitting ES and Ollama
+        self.health_cache_seconds = settings.health_check_cache_seconds
+        self._health_lock = threading.Lock()
+        self._health_stats: Optional[dict] = None
+        self._health_expires = 0.0
+        # Identical checks running at the same time share one detector run
+        self._inflight: dict[tuple[str, bytes], Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def CheckPlagiarism(
         self,
@@ -31,101 +83,63 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.CheckResponse:
         """Check text for plagiarism."""
+        logger.info(f"CheckPlagiarism request: {len(request.text)} chars")
+
+        # Run plagiarism check
+        result = self._coalesced(
+            request,
+            lambda: self.detector.check_plagiarism(
+                text=request.text, **_check_options(request)
+            ),
+        )
+
+        return self._build_check_response(
+            result, self._fit_check_response(request, result, context)
+        )
+
+    def CheckPlagiarismStream(
+        self,
+        request: plagiarism_pb2.CheckRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[plagiarism_pb2.CheckChunkUpdate]:
+        """Check text for plagiarism, streaming each chunk as it is analyzed."""
         try:
-            logger.info(f"CheckPlagiarism request: {len(request.text)} chars")
-
-            # Extract options (with safe defaults)
-            options = request.options if request.HasField("options") else None
-            min_similarity = None
-            top_k = None
-            include_ai = False  # Mặc định TẮT AI analysis để response nhanh
-            exclude_docs = None
-
-            if options:
-                min_similarity = options.min_similarity if options.min_similarity > 0 else None
-                top_k = options.top_k if options.top_k > 0 else None
-                # Chỉ bật AI nếu client explicitly set = true
-                if options.HasField("include_ai_analysis"):
-                    include_ai = options.include_ai_analysis
-                exclude_docs = list(options.exclude_docs) if options.exclude_docs else None
-
-            # Run plagiarism check
-            result = self.detector.check_plagiarism(
-                text=request.text,
-                min_similarity=min_similarity,
-                top_k=top_k,
-                include_ai_analysis=include_ai,
-                exclude_doc_ids=exclude_docs,
-            )
+            logger.info(f"CheckPlagiarismStream request: {len(request.text)} chars")
 
-            return self._build_check_response(result)
+            updates = self.detector.check_plagiarism_stream(
+                text=request.text, **_check_options(request)
+            )
+            include_text = _include_chunk_text(request)
+            while True:
+                try:
+                    analysis, matches = next(updates)
+                except StopIteration as stop:
+                    result = stop.value
+                    break
+                update = plagiarism_pb2.CheckChunkUpdate()
+                _fill_chunk(update.chunk, analysis, include_text)
+                _add_matches(update.matches, matches)
+                yield update
+
+            # Chunks and matches were already streamed, send only the totals
+            update = plagiarism_pb2.CheckChunkUpdate()
+            _fill_check_summary(update.summary, result)
+            yield update
 
         except Exception as e:
-            logger.error(f"CheckPlagiarism error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
+            logger.error(f"CheckPlagiarismStream error: {e}")
+            context.set_code(_INTERNAL)
             context.set_details(str(e))
-            return plagiarism_pb2.CheckResponse()
 
     def _build_check_response(
-        self, result: PlagiarismResult
+        self, result: PlagiarismResult, include_chunk_text: bool = True
     ) -> plagiarism_pb2.CheckResponse:
         """Build gRPC response from PlagiarismResult."""
-        # Convert severity string to enum
-        severity_map = {
-            "SAFE": plagiarism_pb2.SAFE,
-            "LOW": plagiarism_pb2.LOW,
-            "MEDIUM": plagiarism_pb2.MEDIUM,
-            "HIGH": plagiarism_pb2.HIGH,
-            "CRITICAL": plagiarism_pb2.CRITICAL,
-        }
-
-        # Build matches
-        matches = []
-        for m in result.matches:
-            matches.append(
-                plagiarism_pb2.Match(
-                    document_id=m.document_id,
-                    document_title=m.document_title,
-                    matched_text=m.matched_text,
-                    input_text=m.input_text,
-                    similarity_score=m.similarity_score,
-                    position=plagiarism_pb2.Position(
-                        start=m.position_start,
-                        end=m.position_end,
-                        chunk_index=m.chunk_index,
-                    ),
-                )
-            )
-
-        # Build chunk analysis
-        chunks = []
-        for c in result.chunk_analysis:
-            chunks.append(
-                plagiarism_pb2.ChunkAnalysis(
-                    chunk_index=c.chunk_index,
-                    text=c.text,
-                    max_similarity=c.max_similarity,
-                    status=severity_map.get(c.status, plagiarism_pb2.SAFE),
-                    best_match_doc_id=c.best_match_doc_id or "",
-                )
-            )
-
-        # Build metadata
-        metadata = plagiarism_pb2.Metadata(
-            processing_time_ms=result.processing_time_ms,
-            chunks_analyzed=result.chunks_analyzed,
-            documents_searched=result.documents_searched,
-        )
-
-        return plagiarism_pb2.CheckResponse(
-            request_id=result.request_id,
-            plagiarism_percentage=result.plagiarism_percentage,
-            severity=severity_map.get(result.severity, plagiarism_pb2.SAFE),
-            explanation=result.explanation,
-            matches=matches,
-            chunks=chunks,
-            metadata=metadata,
-        )
+        response = plagiarism_pb2.CheckResponse()
+        _fill_check_summary(response, result)
+        _add_matches(response.matches, result.matches)
+        _add_chunks(response.chunks, result.chunk_analysis, include_chunk_text)
+        return response
 
     def UploadDocument(
         self,
@@ -133,32 +147,22 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.UploadResponse:
         """Upload a document to the database."""
-        try:
-            logger.info(f"UploadDocument: {request.title}")
-
-            # Convert metadata
-            metadata = dict(request.metadata) if request.metadata else {}
+        logger.info(f"UploadDocument: {request.title}")
 
-            result = self.doc_manager.upload_document(
-                title=request.title,
-                content=request.content,
-                metadata=metadata,
-                language=request.language or None,
-            )
-
-            return plagiarism_pb2.UploadResponse(
-                document_id=result.document_id,
-                title=result.title,
-                chunks_created=result.chunks_created,
-                message=result.message,
-                success=result.success,
-            )
+        result = self.doc_manager.upload_document(
+            title=request.title,
+            content=request.content,
+            metadata=request.metadata,
+            language=request.language or None,
+        )
 
-        except Exception as e:
-            logger.error(f"UploadDocument error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return plagiarism_pb2.UploadResponse(success=False, message=str(e))
+        return plagiarism_pb2.UploadResponse(
+            document_id=result.document_id,
+            title=result.title,
+            chunks_created=result.chunks_created,
+            message=result.message,
+            success=result.success,
+        )
 
     def BatchUpload(
         self,
@@ -166,47 +170,80 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.BatchUploadResponse:
         """Batch upload documents using streaming."""
+        response = plagiarism_pb2.BatchUploadResponse()
+        for result in self._upload_results(request_iterator):
+            response.results.append(result)
+            if result.success:
+                response.successful += 1
+            else:
+                response.failed += 1
+
+        response.total_documents = len(response.results)
+        return response
+
+    def BatchUploadStream(
+        self,
+        request_iterator: Iterator[plagiarism_pb2.UploadRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[plagiarism_pb2.UploadResult]:
+        """Batch upload documents, streaming each result as its bulk completes."""
         try:
-            results = []
-            successful = 0
-            failed = 0
-
-            for request in request_iterator:
-                metadata = dict(request.metadata) if request.metadata else {}
-
-                result = self.doc_manager.upload_document(
-                    title=request.title,
-                    content=request.content,
-                    metadata=metadata,
-                    language=request.language or None,
-                )
+            yield from self._upload_results(request_iterator)
+        except Exception as e:
+            logger.error(f"BatchUploadStream error: {e}")
+            context.set_code(_INTERNAL)
+            context.set_details(str(e))
 
-                results.append(
-                    plagiarism_pb2.UploadResult(
-                        document_id=result.document_id,
-                        title=result.title,
-                        success=result.success,
-                        error=result.error or "",
-                    )
+    def _upload_results(
+        self, request_iterator: Iterator[plagiarism_pb2.UploadRequest]
+    ) -> Iterator[plagiarism_pb2.UploadResult]:
+        """Upload streamed documents in bulk, yielding results in input order."""
+        # Documents are buffered into bulk uploads that run concurrently;
+        # the window bounds how many are held in memory
+        pending: deque[Future] = deque()
+        buffer: list[dict] = []
+        buffered_bytes = 0
+
+        def collect(future: Future) -> Iterator[plagiarism_pb2.UploadResult]:
+            for result in future.result():
+                yield plagiarism_pb2.UploadResult(
+                    document_id=result.document_id,
+                    title=result.title,
+                    success=result.success,
+                    error=result.error or "",
                 )
 
-                if result.success:
-                    successful += 1
-                else:
-                    failed += 1
-
-            return plagiarism_pb2.BatchUploadResponse(
-                total_documents=len(results),
-                successful=successful,
-                failed=failed,
-                results=results,
+        def submit(batch: list[dict]) -> None:
+            pending.append(
+                self._upload_executor.submit(
+                    self.doc_manager.upload_documents_bulk, batch
+                )
             )
 
-        except Exception as e:
-            logger.error(f"BatchUpload error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return plagiarism_pb2.BatchUploadResponse()
+        for request in request_iterator:
+            buffer.append({
+                "title": request.title,
+                "content": request.content,
+                "metadata": request.metadata,
+                "language": request.language or None,
+            })
+            buffered_bytes += len(request.content)
+            if len(buffer) < _BULK_UPLOAD_DOCS and buffered_bytes < _BULK_UPLOAD_BYTES:
+                continue
+
+            submit(buffer)
+            buffer = []
+            buffered_bytes = 0
+            if len(pending) >= self.upload_workers:
+                yield from collect(pending.popleft())
+            # Pass on finished uploads without waiting for the window to fill
+            while pending and pending[0].done():
+                yield from collect(pending.popleft())
+
+        if buffer:
+            submit(buffer)
+        while pending:
+            yield from collect(pending.popleft())
 
     def GetDocument(
         self,
@@ -214,6 +251,38 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.GetDocumentResponse:
         """Get document by ID."""
+        doc = self.doc_manager.get_document(
+            document_id=request.document_id,
+            include_content=request.include_content,
+            include_chunks=request.include_chunks,
+        )
+
+        if not doc:
+            return plagiarism_pb2.GetDocumentResponse(found=False)
+
+        # Fill the response's document in place rather than copying one in
+        response = plagiarism_pb2.GetDocumentResponse(found=True)
+        _fill_document(response.document, doc, request.include_content)
+
+        # Build chunks if included
+        chunks = doc.get("chunks") if request.include_chunks else None
+        if chunks:
+            _add_doc_chunks(response.document.chunks, chunks)
+
+        if (
+            len(chunks or ()) > _GZIP_MIN_ITEMS
+            or len(response.document.content) > _GZIP_MIN_CHARS
+        ):
+            context.set_compression(grpc.Compression.Gzip)
+
+        return response
+
+    def GetDocumentStream(
+        self,
+        request: plagiarism_pb2.GetDocumentRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[plagiarism_pb2.ChunkBatch]:
+        """Get document by ID, streaming its chunks in batches."""
         try:
             doc = self.doc_manager.get_document(
                 document_id=request.document_id,
@@ -222,40 +291,34 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
             )
 
             if not doc:
-                return plagiarism_pb2.GetDocumentResponse(found=False)
-
-            # Build chunks if included
-            chunks = []
-            if request.include_chunks and "chunks" in doc:
-                for c in doc["chunks"]:
-                    chunks.append(
-                        plagiarism_pb2.Chunk(
-                            chunk_id=c.get("chunk_id", ""),
-                            text=c.get("text", ""),
-                            position=c.get("position", 0),
-                            word_count=c.get("word_count", 0),
-                        )
-                    )
-
-            document = plagiarism_pb2.Document(
-                document_id=doc.get("document_id", ""),
-                title=doc.get("title", ""),
-                content=doc.get("content", "") if request.include_content else "",
-                metadata=doc.get("metadata", {}),
-                language=doc.get("language", ""),
-                chunk_count=doc.get("chunk_count", 0),
-                chunks=chunks,
-                created_at=str(doc.get("created_at", "")),
-                updated_at=str(doc.get("updated_at", "")),
-            )
-
-            return plagiarism_pb2.GetDocumentResponse(document=document, found=True)
+                context.set_code(_NOT_FOUND)
+                context.set_details("Document not found")
+                return
+
+            # The first batch carries the document fields
+            batch = plagiarism_pb2.ChunkBatch()
+            _fill_document(batch.document, doc, request.include_content)
+
+            chunks = doc.get("chunks") if request.include_chunks else None
+            if (
+                len(chunks or ()) > _GZIP_MIN_ITEMS
+                or len(batch.document.content) > _GZIP_MIN_CHARS
+            ):
+                context.set_compression(grpc.Compression.Gzip)
+
+            if not chunks:
+                yield batch
+                return
+
+            for start in range(0, len(chunks), _CHUNK_BATCH_SIZE):
+                _add_doc_chunks(batch.chunks, chunks[start:start + _CHUNK_BATCH_SIZE])
+                yield batch
+                batch = plagiarism_pb2.ChunkBatch()
 
         except Exception as e:
-            logger.error(f"GetDocument error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
+            logger.error(f"GetDocumentStream error: {e}")
+            context.set_code(_INTERNAL)
             context.set_details(str(e))
-            return plagiarism_pb2.GetDocumentResponse(found=False)
 
     def DeleteDocument(
         self,
@@ -263,21 +326,12 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.DeleteDocumentResponse:
         """Delete a document."""
-        try:
-            success = self.doc_manager.delete_document(request.document_id)
-
-            return plagiarism_pb2.DeleteDocumentResponse(
-                success=success,
-                message="Document deleted" if success else "Document not found",
-            )
+        success = self.doc_manager.delete_document(request.document_id)
 
-        except Exception as e:
-            logger.error(f"DeleteDocument error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return plagiarism_pb2.DeleteDocumentResponse(
-                success=False, message=str(e)
-            )
+        return plagiarism_pb2.DeleteDocumentResponse(
+            success=success,
+            message="Document deleted" if success else "Document not found",
+        )
 
     def SearchDocuments(
         self,
@@ -285,38 +339,41 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.SearchResponse:
         """Search documents."""
-        try:
-            filters = dict(request.filters) if request.filters else None
-            limit = request.limit if request.limit > 0 else 10
-            offset = request.offset if request.offset >= 0 else 0
-
-            docs, total = self.doc_manager.search_documents(
-                query=request.query or None,
-                filters=filters,
-                limit=limit,
-                offset=offset,
-            )
+        filters = request.filters if len(request.filters) else None
+        limit = request.limit if request.limit > 0 else 10
+        offset = request.offset if request.offset >= 0 else 0
+        search_after = None
+        if request.cursor:
+            try:
+                search_after = _decode_cursor(request.cursor)
+            except ValueError:
+                context.abort(_INVALID_ARGUMENT, "Invalid cursor")
+
+        docs, total, last_sort = self.doc_manager.search_documents(
+            query=request.query or None,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            search_after=search_after,
+        )
 
-            documents = []
-            for doc in docs:
-                documents.append(
-                    plagiarism_pb2.DocumentSummary(
-                        document_id=doc.get("document_id", ""),
-                        title=doc.get("title", ""),
-                        metadata=doc.get("metadata", {}),
-                        language=doc.get("language", ""),
-                        chunk_count=doc.get("chunk_count", 0),
-                        created_at=str(doc.get("created_at", "")),
-                    )
-                )
+        response = plagiarism_pb2.SearchResponse(total=total)
+        if last_sort and len(docs) == limit:
+            response.next_cursor = _encode_cursor(last_sort)
+        for doc in docs:
+            summary = response.documents.add(
+                document_id=doc.get("document_id", ""),
+                title=doc.get("title", ""),
+                language=doc.get("language", ""),
+                chunk_count=doc.get("chunk_count", 0),
+                created_at=str(doc.get("created_at", "")),
+            )
+            summary.metadata.update(doc.get("metadata") or {})
 
-            return plagiarism_pb2.SearchResponse(documents=documents, total=total)
+        if len(docs) > _GZIP_MIN_ITEMS:
+            context.set_compression(grpc.Compression.Gzip)
 
-        except Exception as e:
-            logger.error(f"SearchDocuments error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return plagiarism_pb2.SearchResponse()
+        return response
 
     def HealthCheck(
         self,
@@ -325,108 +382,91 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
     ) -> plagiarism_pb2.HealthCheckResponse:
         """Check service health."""
         try:
-            stats = self.doc_manager.get_stats()
+            stats = self._cached_stats()
 
-            components = {}
+            # Message map entries are created and filled in place
+            response = plagiarism_pb2.HealthCheckResponse()
+            components = response.components
 
             # Elasticsearch health
             es_health = stats.get("es_health", {})
-            components["elasticsearch"] = plagiarism_pb2.ComponentHealth(
-                healthy=es_health.get("healthy", False),
-                message=es_health.get("status", es_health.get("error", "Unknown")),
-            )
+            es = components["elasticsearch"]
+            es.healthy = es_health.get("healthy", False)
+            es.message = es_health.get("status", es_health.get("error", "Unknown"))
 
             # Ollama health
             ollama_health = stats.get("ollama_health", {})
-            components["ollama"] = plagiarism_pb2.ComponentHealth(
-                healthy=ollama_health.get("healthy", False),
-                message="Available" if ollama_health.get("healthy") else ollama_health.get("error", "Unknown"),
-            )
+            ollama = components["ollama"]
+            ollama.healthy = ollama_health.get("healthy", False)
+            ollama.message = "Available" if ollama_health.get("healthy") else ollama_health.get("error", "Unknown")
 
-            overall_healthy = all(c.healthy for c in components.values())
-
-            return plagiarism_pb2.HealthCheckResponse(
-                healthy=overall_healthy,
-                components=components,
-            )
+            response.healthy = all(c.healthy for c in components.values())
+            return response
 
         except Exception as e:
             logger.error(f"HealthCheck error: {e}")
             return plagiarism_pb2.HealthCheckResponse(healthy=False)
 
+    def _cached_stats(self) -> dict:
+        """doc_manager.get_stats(), reused for health_cache_seconds."""
+        # Holding the lock while probing makes concurrent callers wait for
+        # one probe rather than all running their own
+        with self._health_lock:
+            if self._health_stats is None or time.monotonic() >= self._health_expires:
+                self._health_stats = self.doc_manager.get_stats()
+                self._health_expires = time.monotonic() + self.health_cache_seconds
+            return self._health_stats
+
     def IndexPdfFromMinio(
         self,
         request: plagiarism_pb2.IndexPdfFromMinioRequest,
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.IndexPdfFromMinioResponse:
         """Index a PDF file from MinIO bucket."""
-        try:
-            logger.info(
-                f"IndexPdfFromMinio: {request.bucket_name}/{request.object_path}"
-            )
+        logger.info(
+            f"IndexPdfFromMinio: {request.bucket_name}/{request.object_path}"
+        )
 
-            # Convert metadata
-            metadata = dict(request.metadata) if request.metadata else {}
+        # Call document manager
+        result = self.doc_manager.upload_pdf_from_minio(
+            bucket_name=request.bucket_name,
+            object_path=request.object_path,
+            document_id=request.document_id or None,
+            title=request.title or None,
+            metadata=request.metadata,
+            language=request.language or None,
+        )
 
-            # Call document manager
-            result = self.doc_manager.upload_pdf_from_minio(
-                bucket_name=request.bucket_name,
-                object_path=request.object_path,
-                document_id=request.document_id or None,
-                title=request.title or None,
-                metadata=metadata,
-                language=request.language or None,
+        if not result.success:
+            return plagiarism_pb2.IndexPdfFromMinioResponse(
+                success=False,
+                document_id=result.document_id,
+                error_message=result.error_message,
             )
 
-            if not result.success:
-                return plagiarism_pb2.IndexPdfFromMinioResponse(
-                    success=False,
-                    document_id=result.document_id,
-                    error_message=result.error_message,
-                )
-
-            # Build chunk info
-            chunks = []
-            for chunk_info in result.chunks_info:
-                chunks.append(
-                    plagiarism_pb2.PdfChunkInfo(
-                        chunk_id=chunk_info["chunk_id"],
-                        section_title=chunk_info["section_title"],
-                        content_preview=chunk_info["content_preview"],
-                        element_type=chunk_info["element_type"],
-                        position=chunk_info["position"],
-                        word_count=chunk_info["word_count"],
-                    )
-                )
+        response = plagiarism_pb2.IndexPdfFromMinioResponse(
+            success=True,
+            document_id=result.document_id,
+            title=result.title,
+            total_chunks=result.total_chunks,
+        )
 
-            # Build processing metadata
-            proc_meta = result.processing_metadata
-            processing_metadata = plagiarism_pb2.PdfProcessingMetadata(
-                total_pages=proc_meta.get("total_pages", 0),
-                total_elements=proc_meta.get("total_elements", 0),
-                total_chunks=proc_meta.get("total_chunks", 0),
-                processing_time_ms=proc_meta.get("processing_time_ms", 0),
-                pdf_title=proc_meta.get("pdf_title", ""),
-                pdf_author=proc_meta.get("pdf_author", ""),
-            )
+        # Chunk info dicts use the PdfChunkInfo field names
+        add_chunk = response.chunks.add
+        for chunk_info in result.chunks_info:
+            add_chunk(**chunk_info)
 
-            return plagiarism_pb2.IndexPdfFromMinioResponse(
-                success=True,
-                document_id=result.document_id,
-                title=result.title,
-                total_chunks=result.total_chunks,
-                chunks=chunks,
-                processing_metadata=processing_metadata,
-            )
+        # Build processing metadata
+        proc_meta = result.processing_metadata
+        processing_metadata = response.processing_metadata
+        processing_metadata.total_pages = proc_meta.get("total_pages", 0)
+        processing_metadata.total_elements = proc_meta.get("total_elements", 0)
+        processing_metadata.total_chunks = proc_meta.get("total_chunks", 0)
+        processing_metadata.processing_time_ms = proc_meta.get("processing_time_ms", 0)
+        processing_metadata.pdf_title = proc_meta.get("pdf_title", "")
+        processing_metadata.pdf_author = proc_meta.get("pdf_author", "")
 
-        except Exception as e:
-            logger.error(f"IndexPdfFromMinio error: {e}", exc_info=True)
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return plagiarism_pb2.IndexPdfFromMinioResponse(
-                success=False,
-                error_message=str(e),
-            )
+        return response
 
     def CheckPdfFromMinio(
         self,
@@ -434,112 +474,237 @@ class PlagiarismServicer(plagiarism_pb2_grpc.PlagiarismServiceServicer):
         context: grpc.ServicerContext,
     ) -> plagiarism_pb2.CheckPdfFromMinioResponse:
         """Check a PDF file from MinIO for plagiarism."""
-        try:
-            logger.info(
-                f"CheckPdfFromMinio: {request.bucket_name}/{request.object_path}"
-            )
+        logger.info(
+            f"CheckPdfFromMinio: {request.bucket_name}/{request.object_path}"
+        )
 
-            # Extract options
-            options = request.options if request.HasField("options") else None
-            min_similarity = None
-            top_k = None
-            include_ai = False
-            exclude_docs = None
-
-            if options:
-                min_similarity = options.min_similarity if options.min_similarity > 0 else None
-                top_k = options.top_k if options.top_k > 0 else None
-                if options.HasField("include_ai_analysis"):
-                    include_ai = options.include_ai_analysis
-                exclude_docs = list(options.exclude_docs) if options.exclude_docs else None
-
-            # Call detector
-            result = self.detector.check_pdf_from_minio(
+        # Call detector
+        result = self._coalesced(
+            request,
+            lambda: self.detector.check_pdf_from_minio(
                 bucket_name=request.bucket_name,
                 object_path=request.object_path,
-                min_similarity=min_similarity,
-                top_k=top_k,
-                include_ai_analysis=include_ai,
-                exclude_doc_ids=exclude_docs,
-            )
+                **_check_options(request),
+            ),
+        )
 
-            return self._build_pdf_check_response(result)
+        return self._build_pdf_check_response(
+            result, self._fit_check_response(request, result, context)
+        )
 
-        except Exception as e:
-            logger.error(f"CheckPdfFromMinio error: {e}", exc_info=True)
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return plagiarism_pb2.CheckPdfFromMinioResponse(
-                success=False,
-                error_message=str(e),
+    def _coalesced(self, request, run: Callable[[], _T]) -> _T:
+        """Run a check, or wait for an identical one already in flight.
+
+        Requests are identical if they serialize to the same bytes, so the
+        options count as well as the text. Waiters get the same result, or
+        the same exception, as the call that ran.
+        """
+        key = (
+            request.DESCRIPTOR.full_name,
+            hashlib.blake2b(
+                request.SerializeToString(deterministic=True), digest_size=16
+            ).digest(),
+        )
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            running = future is not None
+            if not running:
+                future = self._inflight[key] = Future()
+        if running:
+            return future.result()
+
+        try:
+            result = run()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        future.set_result(result)
+        return result
+
+    def _fit_check_response(
+        self,
+        request,
+        result: PlagiarismResult | PdfPlagiarismResult,
+        context: grpc.ServicerContext,
+    ) -> bool:
+        """Size a check response before building it.
+
+        Text-heavy responses are gzipped, and chunk text is dropped if the
+        response would otherwise exceed the max message size.
+
+        Returns:
+            Whether ChunkAnalysis entries should carry their text
+        """
+        include_chunk_text = _include_chunk_text(request)
+        match_chars = sum(len(m.matched_text) + len(m.input_text) for m in result.matches)
+        chunk_chars = sum(len(c.text) for c in result.chunk_analysis) if include_chunk_text else 0
+
+        if match_chars + chunk_chars > _GZIP_MIN_CHARS:
+            context.set_compression(grpc.Compression.Gzip)
+
+        # Chunk text repeats the matches' input text, so it goes first rather
+        # than failing to send a result that has already been computed
+        if (
+            chunk_chars
+            and (match_chars + chunk_chars) * _MAX_BYTES_PER_CHAR > self.max_message_bytes
+        ):
+            logger.warning(
+                f"Response for {result.request_id} may exceed "
+                f"{self.max_message_bytes} bytes, omitting chunk text"
             )
+            include_chunk_text = False
+
+        return include_chunk_text
 
     def _build_pdf_check_response(
-        self, result: PdfPlagiarismResult
+        self, result: PdfPlagiarismResult, include_chunk_text: bool = True
     ) -> plagiarism_pb2.CheckPdfFromMinioResponse:
         """Build gRPC response from PdfPlagiarismResult."""
-        # Convert severity string to enum
-        severity_map = {
-            "SAFE": plagiarism_pb2.SAFE,
-            "LOW": plagiarism_pb2.LOW,
-            "MEDIUM": plagiarism_pb2.MEDIUM,
-            "HIGH": plagiarism_pb2.HIGH,
-            "CRITICAL": plagiarism_pb2.CRITICAL,
-        }
-
-        # Build matches
-        matches = []
-        for m in result.matches:
-            matches.append(
-                plagiarism_pb2.Match(
-                    document_id=m.document_id,
-                    document_title=m.document_title,
-                    matched_text=m.matched_text,
-                    input_text=m.input_text,
-                    similarity_score=m.similarity_score,
-                    position=plagiarism_pb2.Position(
-                        start=m.position_start,
-                        end=m.position_end,
-                        chunk_index=m.chunk_index,
-                    ),
-                )
-            )
-
-        # Build chunk analysis
-        chunks = []
-        for c in result.chunk_analysis:
-            chunks.append(
-                plagiarism_pb2.ChunkAnalysis(
-                    chunk_index=c.chunk_index,
-                    text=c.text,
-                    max_similarity=c.max_similarity,
-                    status=severity_map.get(c.status, plagiarism_pb2.SAFE),
-                    best_match_doc_id=c.best_match_doc_id or "",
-                )
-            )
-
-        # Build metadata
-        metadata = plagiarism_pb2.PdfCheckMetadata(
-            processing_time_ms=result.metadata.processing_time_ms,
-            pdf_extraction_time_ms=result.metadata.pdf_extraction_time_ms,
-            embedding_time_ms=result.metadata.embedding_time_ms,
-            search_time_ms=result.metadata.search_time_ms,
-            total_pages=result.metadata.total_pages,
-            total_chunks=result.metadata.total_chunks,
-            chunks_analyzed=result.metadata.chunks_analyzed,
-            documents_searched=result.metadata.documents_searched,
-            model_used=result.metadata.model_used,
-        )
-
-        return plagiarism_pb2.CheckPdfFromMinioResponse(
+        response = plagiarism_pb2.CheckPdfFromMinioResponse(
             success=result.success,
             request_id=result.request_id,
             document_title=result.document_title,
             plagiarism_percentage=result.plagiarism_percentage,
-            severity=severity_map.get(result.severity, plagiarism_pb2.SAFE),
+            severity=_SEVERITY.get(result.severity, plagiarism_pb2.SAFE),
             explanation=result.explanation,
-            matches=matches,
-            chunks=chunks,
-            metadata=metadata,
             error_message=result.error_message,
         )
+
+        # Set metadata in place instead of copying a separate message in
+        metadata = response.metadata
+        metadata.processing_time_ms = result.metadata.processing_time_ms
+        metadata.pdf_extraction_time_ms = result.metadata.pdf_extraction_time_ms
+        metadata.embedding_time_ms = result.metadata.embedding_time_ms
+        metadata.search_time_ms = result.metadata.search_time_ms
+        metadata.total_pages = result.metadata.total_pages
+        metadata.total_chunks = result.metadata.total_chunks
+        metadata.chunks_analyzed = result.metadata.chunks_analyzed
+        metadata.documents_searched = result.metadata.documents_searched
+        metadata.model_used = result.metadata.model_used
+
+        _add_matches(response.matches, result.matches)
+        _add_chunks(response.chunks, result.chunk_analysis, include_chunk_text)
+        return response
+
+
+def _fill_check_summary(response, result: PlagiarismResult) -> None:
+    """Set a CheckResponse's totals and metadata from a PlagiarismResult."""
+    response.request_id = result.request_id
+    response.plagiarism_percentage = result.plagiarism_percentage
+    response.severity = _SEVERITY.get(result.severity, plagiarism_pb2.SAFE)
+    response.explanation = result.explanation
+    metadata = response.metadata
+    metadata.processing_time_ms = result.processing_time_ms
+    metadata.chunks_analyzed = result.chunks_analyzed
+    metadata.documents_searched = result.documents_searched
+
+
+def _fill_document(document, doc: dict, include_content: bool) -> None:
+    """Set a Document message's fields from a stored document dict."""
+    document.document_id = doc.get("document_id", "")
+    document.title = doc.get("title", "")
+    if include_content:
+        document.content = doc.get("content", "")
+    document.language = doc.get("language", "")
+    document.chunk_count = doc.get("chunk_count", 0)
+    document.created_at = str(doc.get("created_at", ""))
+    document.updated_at = str(doc.get("updated_at", ""))
+    document.metadata.update(doc.get("metadata") or {})
+
+
+def _add_doc_chunks(field, chunks: list[dict]) -> None:
+    """Append stored chunks to a repeated Chunk field by field assignment."""
+    add_chunk = field.add
+    for c in chunks:
+        chunk = add_chunk()
+        chunk.chunk_id = c.get("chunk_id", "")
+        chunk.text = c.get("text", "")
+        chunk.position = c.get("position", 0)
+        chunk.word_count = c.get("word_count", 0)
+
+
+def _add_matches(field, matches) -> None:
+    """Append matches to a repeated Match field in place."""
+    for m in matches:
+        match = field.add(
+            document_id=m.document_id,
+            document_title=m.document_title,
+            matched_text=m.matched_text,
+            input_text=m.input_text,
+            similarity_score=m.similarity_score,
+        )
+        position = match.position
+        position.start = m.position_start
+        position.end = m.position_end
+        position.chunk_index = m.chunk_index
+
+
+def _add_chunks(field, chunk_analysis, include_text: bool = True) -> None:
+    """Append chunk analyses to a repeated ChunkAnalysis field in place."""
+    for c in chunk_analysis:
+        _fill_chunk(field.add(), c, include_text)
+
+
+def _fill_chunk(chunk, c, include_text: bool = True) -> None:
+    """Set a ChunkAnalysis message's fields from a chunk analysis result."""
+    chunk.chunk_index = c.chunk_index
+    if include_text:
+        chunk.text = c.text
+    chunk.max_similarity = c.max_similarity
+    # Severity levels are numbered like the proto enum
+    chunk.status = c.status_level
+    chunk.best_match_doc_id = c.best_match_doc_id or ""
+
+
+def _encode_cursor(sort_values: list) -> str:
+    """Opaque SearchDocuments page cursor from a hit's sort values."""
+    return base64.urlsafe_b64encode(json.dumps(sort_values).encode()).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> list:
+    """Sort values from a cursor made by _encode_cursor; ValueError if invalid."""
+    try:
+        sort_values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(sort_values, list):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return sort_values
+
+
+def _check_options(request) -> dict:
+    """Detector arguments from a request's optional CheckOptions."""
+    if not request.HasField("options"):
+        # Mặc định TẮT AI analysis để response nhanh
+        return {
+            "min_similarity": None,
+            "top_k": None,
+            "include_ai_analysis": False,
+            "exclude_doc_ids": None,
+        }
+
+    # Each field is read once; every protobuf attribute access is a lookup
+    options = request.options
+    min_similarity = options.min_similarity
+    top_k = options.top_k
+    exclude_docs = options.exclude_docs
+    return {
+        "min_similarity": min_similarity if min_similarity > 0 else None,
+        "top_k": top_k if top_k > 0 else None,
+        # Chỉ bật AI nếu client explicitly set = true
+        "include_ai_analysis": (
+            options.HasField("include_ai_analysis") and options.include_ai_analysis
+        ),
+        "exclude_doc_ids": list(exclude_docs) if exclude_docs else None,
+    }
+
+
+def _include_chunk_text(request) -> bool:
+    """Whether ChunkAnalysis entries carry their text (default: true)."""
+    if not request.HasField("options"):
+        return True
+    options = request.options
+    return options.include_chunk_text if options.HasField("include_chunk_text") else True
@@ -6,7 +6,7 @@ from .elasticsearch import (
     SearchResult,
     get_es_client,
 )
-from .minio_client import MinioClient, get_minio_client
+from .minio_client import MinioClient, ObjectInfo, get_minio_client
 
 __all__ = [
     "ElasticsearchClient",
@@ -15,5 +15,6 @@ __all__ = [
     "SearchResult",
     "get_es_client",
     "MinioClient",
+    "ObjectInfo",
     "get_minio_client",
 ]
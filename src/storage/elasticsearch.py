@@ -1,38 +1,79 @@
 """Elasticsearch client wrapper for plagiarism detection."""
 
+import base64
+import hashlib
 import logging
-from typing import Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterator, Mapping, Optional
 from datetime import datetime
 
+import numpy as np
 from elasticsearch import Elasticsearch, NotFoundError, BadRequestError
-from pydantic import BaseModel
+from elasticsearch.helpers import bulk
 
 from src.config import get_settings
 
+try:
+    from elasticsearch.serializer import NdjsonSerializer, OrjsonSerializer
+
+    class _OrjsonNdjsonSerializer(OrjsonSerializer, NdjsonSerializer):
+        """NDJSON serializer for _bulk bodies that encodes lines with orjson."""
+
+        mimetype = NdjsonSerializer.mimetype
+
+    _SERIALIZERS: dict[str, Any] = {
+        OrjsonSerializer.mimetype: OrjsonSerializer(),
+        NdjsonSerializer.mimetype: _OrjsonNdjsonSerializer(),
+    }
+except ImportError:  # orjson not installed, keep the client's stdlib serializers
+    _SERIALIZERS = {}
+
 logger = logging.getLogger(__name__)
 
+# Chunks fetched per request when reading a document's chunks; larger
+# documents are paged with search_after on (position, chunk_id)
+_CHUNK_PAGE_SIZE = 1000
+_CHUNK_SORT = [{"position": "asc"}, {"chunk_id": "asc"}]
+
 
-class DocumentChunk(BaseModel):
+# Documents, chunks and search results are plain dataclasses: they are built
+# in bulk from data that is already typed, so pydantic validation is pure overhead
+@dataclass(slots=True, frozen=True)
+class DocumentChunk:
     """A chunk of document with embedding."""
     chunk_id: str
     text: str
     embedding: list[float]
     position: int
     word_count: int
+    section_title: str = ""
+    # Precomputed lexical features so queries don't re-normalize stored chunks
+    normalized_text: str = ""
+    token_hashes: bytes = b""
 
 
-class DocumentData(BaseModel):
+@dataclass(slots=True)
+class DocumentData:
     """Document data for storage."""
     document_id: str
     title: str
     content: str
     chunks: list[DocumentChunk]
     language: str
-    metadata: dict[str, str] = {}
+    metadata: dict[str, str] = field(default_factory=dict)
     created_at: Optional[datetime] = None
+    # Full-text searchable but kept out of _source; for documents whose
+    # content is rebuilt from their chunks on read (PDFs). One value per
+    # chunk, so the text is never joined into a second copy
+    searchable_content: list[str] = field(default_factory=list)
 
 
-class SearchResult(BaseModel):
+@dataclass(slots=True)
+class SearchResult:
     """Search result from vector search."""
     document_id: str
     chunk_id: str
@@ -40,7 +81,9 @@ class SearchResult(BaseModel):
     matched_text: str
     similarity_score: float
     position: int
-    metadata: dict[str, str] = {}
+    metadata: dict[str, str] = field(default_factory=dict)
+    matched_normalized_text: str = ""
+    matched_token_hashes: bytes = b""
 
 
 class ElasticsearchClient:
@@ -49,6 +92,18 @@ class ElasticsearchClient:
     def __init__(self):
         self.settings = get_settings()
         self._client: Optional[Elasticsearch] = None
+        # LRU of (expiry, vector_search results); the generation changes on
+        # every write so searches that raced a write are never served afterwards
+        self._search_cache: OrderedDict[
+            tuple, tuple[float, list[SearchResult]]
+        ] = OrderedDict()
+        self._search_lock = threading.Lock()
+        self._search_generation = 0
+        # Open ingest_mode blocks per index; only the outermost one changes
+        # the index settings, and restores the ones saved when it opened
+        self._ingest_depth: dict[str, int] = {}
+        self._ingest_saved: dict[str, dict[str, Any]] = {}
+        self._ingest_lock = threading.Lock()
 
     @property
     def client(self) -> Elasticsearch:
@@ -65,6 +120,11 @@ class ElasticsearchClient:
                 basic_auth=auth,
                 verify_certs=False,
                 request_timeout=30,
+                # Chunk bodies are mostly embedding floats, which gzip well;
+                # the pool must cover the detector, upload and stats threads
+                http_compress=self.settings.es_http_compress,
+                connections_per_node=self.settings.es_connections_per_node,
+                serializers=_SERIALIZERS,
             )
         return self._client
 
@@ -100,6 +160,7 @@ class ElasticsearchClient:
 
         mappings = {
             "mappings": {
+                "_source": {"excludes": ["searchable_content"]},
                 "properties": {
                     "document_id": {"type": "keyword"},
                     "title": {
@@ -108,6 +169,7 @@ class ElasticsearchClient:
                         "fields": {"keyword": {"type": "keyword"}},
                     },
                     "content": {"type": "text", "analyzer": "standard"},
+                    "searchable_content": {"type": "text", "analyzer": "standard"},
                     "language": {"type": "keyword"},
                     "metadata": {"type": "object", "enabled": True},
                     "created_at": {"type": "date"},
@@ -117,7 +179,7 @@ class ElasticsearchClient:
             },
             "settings": {
                 "number_of_shards": 1,
-                "number_of_replicas": 0,
+                "number_of_replicas": self.settings.es_number_of_replicas,
                 "index": {"knn": True},
             },
         }
@@ -143,6 +205,25 @@ class ElasticsearchClient:
             else:
                 return True
 
+        embedding_mapping = {
+            "type": "dense_vector",
+            "dims": self.settings.embedding_dims,
+            "element_type": self.settings.embedding_element_type,
+            "index": True,
+            # Float vectors are stored unit-length (see _encode_vector), where
+            # dot_product ranks like cosine without normalizing per comparison
+            "similarity": (
+                "dot_product"
+                if self.settings.embedding_element_type == "float"
+                else "cosine"
+            ),
+        }
+        # Byte vectors are already int8; only float vectors get a quantized graph
+        if self.settings.embedding_element_type == "float":
+            embedding_mapping["index_options"] = {
+                "type": self.settings.embedding_index_type
+            }
+
         mappings = {
             "mappings": {
                 "properties": {
@@ -150,21 +231,19 @@ class ElasticsearchClient:
                     "document_id": {"type": "keyword"},
                     "document_title": {"type": "text"},
                     "text": {"type": "text", "analyzer": "standard"},
-                    "embedding": {
-                        "type": "dense_vector",
-                        "dims": self.settings.embedding_dims,
-                        "index": True,
-                        "similarity": "cosine",
-                    },
+                    "embedding": embedding_mapping,
                     "position": {"type": "integer"},
                     "word_count": {"type": "integer"},
+                    "section_title": {"type": "keyword", "index": False},
+                    "normalized_text": {"type": "text", "index": False},
+                    "token_hashes": {"type": "binary"},
                     "metadata": {"type": "object"},
                     "created_at": {"type": "date"},
                 }
             },
             "settings": {
                 "number_of_shards": 1,
-                "number_of_replicas": 0,
+                "number_of_replicas": self.settings.es_number_of_replicas,
             },
         }
 
@@ -176,96 +255,321 @@ class ElasticsearchClient:
             logger.error(f"Failed to create chunks index: {e}")
             return False
 
-    # ==================== CRUD Operations ====================
+    @property
+    def chunks_index_name(self) -> str:
+        """Get chunks index name."""
+        return f"{self.index_name}_chunks"
+
+    @contextmanager
+    def ingest_mode(
+        self,
+        indices: Optional[list[str]] = None,
+        force_merge: bool = False,
+        max_num_segments: int = 5,
+    ) -> Iterator[None]:
+        """Relax index settings for bulk loading.
+
+        Disables periodic refresh and replicas while the block runs, then
+        restores the settings the indices had before and refreshes so the
+        loaded documents become searchable. Optionally force-merges segments
+        afterwards. An index whose settings can't be read is left untouched.
+
+        Blocks may overlap or nest: settings change when the first block on an
+        index opens and are restored when the last one closes.
+
+        Args:
+            indices: Indices to tune (default: documents and chunks indices)
+            force_merge: Run _forcemerge after restoring settings
+            max_num_segments: Target segment count for force merge
+        """
+        indices = indices or [self.index_name, self.chunks_index_name]
+
+        with self._ingest_lock:
+            for index in indices:
+                depth = self._ingest_depth.get(index, 0)
+                self._ingest_depth[index] = depth + 1
+                if depth:
+                    continue
+                try:
+                    saved = self._index_settings(index)
+                    self.client.indices.put_settings(
+                        index=index,
+                        settings={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+                    )
+                    self._ingest_saved[index] = saved
+                except Exception as e:
+                    logger.warning(f"Failed to enable ingest mode for {index}: {e}")
 
-    def index_document(self, document: DocumentData) -> bool:
-        """Index a document and its chunks."""
         try:
-            # Index main document
-            doc_body = {
-                "document_id": document.document_id,
-                "title": document.title,
-                "content": document.content,
-                "language": document.language,
-                "metadata": document.metadata,
-                "chunk_count": len(document.chunks),
-                "created_at": document.created_at or datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
-            }
+            yield
+        finally:
+            with self._ingest_lock:
+                for index in indices:
+                    depth = self._ingest_depth[index] - 1
+                    if depth:
+                        self._ingest_depth[index] = depth
+                        continue
+                    del self._ingest_depth[index]
+                    saved = self._ingest_saved.pop(index, None)
+                    if saved is not None:
+                        self._restore_index_settings(
+                            index, saved, force_merge, max_num_segments
+                        )
 
-            self.client.index(
-                index=self.index_name,
-                id=document.document_id,
-                document=doc_body,
-            )
+    def _index_settings(self, index: str) -> dict[str, Any]:
+        """Current refresh and replica settings of an index.
+
+        A setting left at its default is returned as None, which restores
+        the default when put back.
+        """
+        result = self.client.indices.get_settings(
+            index=index, name="index.refresh_interval,index.number_of_replicas"
+        )
+        current = result[index]["settings"].get("index", {})
+        return {
+            "refresh_interval": current.get("refresh_interval"),
+            "number_of_replicas": current.get("number_of_replicas"),
+        }
 
-            # Index chunks with embeddings
-            chunks_index = f"{self.index_name}_chunks"
-            for chunk in document.chunks:
-                chunk_body = {
-                    "chunk_id": chunk.chunk_id,
-                    "document_id": document.document_id,
-                    "document_title": document.title,
-                    "text": chunk.text,
-                    "embedding": chunk.embedding,
-                    "position": chunk.position,
-                    "word_count": chunk.word_count,
-                    "metadata": document.metadata,
-                    "created_at": datetime.utcnow(),
-                }
-                self.client.index(
-                    index=chunks_index,
-                    id=chunk.chunk_id,
-                    document=chunk_body,
+    def _restore_index_settings(
+        self,
+        index: str,
+        saved: dict[str, Any],
+        force_merge: bool,
+        max_num_segments: int,
+    ) -> None:
+        """Put back the refresh and replica settings saved for an index."""
+        try:
+            self.client.indices.put_settings(index=index, settings={"index": saved})
+            self.client.indices.refresh(index=index)
+            if force_merge:
+                self.client.indices.forcemerge(
+                    index=index, max_num_segments=max_num_segments
                 )
+        except Exception as e:
+            logger.error(f"Failed to restore settings for {index}: {e}")
+
+    def _encode_vector(self, embedding: list[float]) -> np.ndarray | str:
+        """Encode an embedding for the configured dense_vector element type.
+
+        Float vectors are scaled to unit length, which dot_product requires
+        and cosine ignores. For 'byte' the vector is scaled to int8 and sent
+        hex-encoded, about 2 bytes per dimension instead of ~20 for a JSON
+        float. Scaling each vector by its own max keeps cosine unchanged.
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self.settings.embedding_element_type != "byte":
+            norm = float(np.linalg.norm(vector))
+            return vector / norm if norm > 0 else vector
+
+        peak = float(np.abs(vector).max()) if vector.size else 0.0
+        if peak > 0:
+            vector = vector * (127.0 / peak)
+        return np.rint(vector).astype(np.int8).tobytes().hex()
+
+    # ==================== CRUD Operations ====================
 
-            # Refresh to make documents searchable immediately
-            self.client.indices.refresh(index=self.index_name)
-            self.client.indices.refresh(index=chunks_index)
+    def _document_body(self, document: DocumentData) -> dict[str, Any]:
+        """Build the stored body of a document."""
+        body = {
+            "document_id": document.document_id,
+            "title": document.title,
+            "content": document.content,
+            "language": document.language,
+            "metadata": document.metadata,
+            "chunk_count": len(document.chunks),
+            "created_at": document.created_at or datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+        if document.searchable_content:
+            body["searchable_content"] = document.searchable_content
+        return body
+
+    def _chunk_body(self, document: DocumentData, chunk: DocumentChunk) -> dict[str, Any]:
+        """Build the stored body of a document chunk."""
+        return {
+            "chunk_id": chunk.chunk_id,
+            "document_id": document.document_id,
+            "document_title": document.title,
+            "text": chunk.text,
+            "embedding": self._encode_vector(chunk.embedding),
+            "position": chunk.position,
+            "word_count": chunk.word_count,
+            "section_title": chunk.section_title,
+            "normalized_text": chunk.normalized_text,
+            "token_hashes": base64.b64encode(chunk.token_hashes).decode("ascii"),
+            "metadata": document.metadata,
+            "created_at": datetime.utcnow(),
+        }
 
+    def index_document(self, document: DocumentData, refresh: bool = True) -> bool:
+        """Index a document and its chunks in one _bulk request.
+
+        Args:
+            document: Document to index
+            refresh: Wait until it is searchable (off for bulk loads)
+        """
+        success = self.index_documents([document], refresh=refresh)[0]
+        if success:
             logger.info(
                 f"Indexed document {document.document_id} with {len(document.chunks)} chunks"
             )
-            return True
+        return success
+
+    def index_documents(
+        self, documents: list[DocumentData], refresh: bool = True
+    ) -> list[bool]:
+        """Index several documents and their chunks in one _bulk request.
+
+        Args:
+            documents: Documents to index
+            refresh: Wait until they are searchable (off for bulk loads)
+
+        Returns:
+            Success flag per document, in input order. A document fails if
+            its own write or any of its chunk writes failed.
+        """
+        if not documents:
+            return []
+
+        chunks_index = self.chunks_index_name
+        owner: dict[str, int] = {}
+        actions = []
+        for i, document in enumerate(documents):
+            owner[document.document_id] = i
+            actions.append({
+                "_index": self.index_name,
+                "_id": document.document_id,
+                "_source": self._document_body(document),
+            })
+            for chunk in document.chunks:
+                owner[chunk.chunk_id] = i
+                actions.append({
+                    "_index": chunks_index,
+                    "_id": chunk.chunk_id,
+                    "_source": self._chunk_body(document, chunk),
+                })
 
+        try:
+            _, errors = bulk(
+                self.client,
+                actions,
+                raise_on_error=False,
+                refresh=self._refresh_mode(refresh),
+            )
         except Exception as e:
-            logger.error(f"Failed to index document: {e}")
+            logger.error(f"Failed to bulk index documents: {e}")
+            return [False] * len(documents)
+        finally:
+            # Part of the batch may have been written even if bulk raised
+            self._invalidate_search_cache()
+
+        success = [True] * len(documents)
+        for error in errors:
+            item = next(iter(error.values()))
+            i = owner.get(item.get("_id"))
+            if i is not None:
+                success[i] = False
+            logger.error(f"Failed to index {item.get('_id')}: {item.get('error')}")
+
+        logger.info(
+            f"Bulk indexed {success.count(True)}/{len(documents)} documents"
+        )
+        return success
+
+    def _refresh_mode(self, refresh: bool) -> bool | str:
+        """Bulk refresh parameter for a write that should become searchable."""
+        if not refresh:
             return False
+        with self._ingest_lock:
+            ingesting = bool(self._ingest_depth)
+        # wait_for returns once the next periodic refresh has made the writes
+        # visible instead of forcing a new segment per call. Ingest mode turns
+        # periodic refresh off, so wait_for would block until the request
+        # times out; refresh explicitly instead.
+        return True if ingesting else "wait_for"
 
     def get_document(
         self, document_id: str, include_chunks: bool = False
     ) -> Optional[dict[str, Any]]:
         """Get document by ID."""
+        if include_chunks:
+            return self._get_document_with_chunks(document_id)
+
         try:
             result = self.client.get(index=self.index_name, id=document_id)
-            doc = result["_source"]
-
-            if include_chunks:
-                chunks = self._get_document_chunks(document_id)
-                doc["chunks"] = chunks
-
-            return doc
+            return result["_source"]
         except NotFoundError:
             return None
         except Exception as e:
             logger.error(f"Failed to get document: {e}")
             return None
 
-    def _get_document_chunks(self, document_id: str) -> list[dict]:
-        """Get all chunks for a document."""
-        chunks_index = f"{self.index_name}_chunks"
+    def _get_document_with_chunks(self, document_id: str) -> Optional[dict[str, Any]]:
+        """Get a document and its chunks in one _msearch round-trip."""
         try:
-            result = self.client.search(
-                index=chunks_index,
-                query={"term": {"document_id": document_id}},
-                size=1000,
-                sort=[{"position": "asc"}],
+            result = self.client.msearch(
+                searches=[
+                    {"index": self.index_name},
+                    {"query": {"ids": {"values": [document_id]}}, "size": 1},
+                    {"index": self.chunks_index_name},
+                    self._chunk_search(document_id),
+                ],
             )
-            return [hit["_source"] for hit in result["hits"]["hits"]]
+            doc_result, chunks_result = result["responses"]
+            for response in (doc_result, chunks_result):
+                if "error" in response:
+                    raise RuntimeError(response["error"])
+
+            hits = doc_result["hits"]["hits"]
+            if not hits:
+                return None
+            doc = hits[0]["_source"]
+            doc["chunks"] = self._collect_chunks(document_id, chunks_result["hits"]["hits"])
+            return doc
+        except Exception as e:
+            logger.error(f"Failed to get document: {e}")
+            return None
+
+    def get_document_chunks(self, document_id: str) -> list[dict]:
+        """Get all chunks for a document."""
+        try:
+            return self._collect_chunks(document_id)
         except Exception as e:
             logger.error(f"Failed to get chunks: {e}")
             return []
 
+    def _chunk_search(
+        self, document_id: str, search_after: Optional[list] = None
+    ) -> dict[str, Any]:
+        """Search for one page of a document's chunks, in position order."""
+        search: dict[str, Any] = {
+            "query": {"term": {"document_id": document_id}},
+            "size": _CHUNK_PAGE_SIZE,
+            "sort": _CHUNK_SORT,
+        }
+        if search_after:
+            search["search_after"] = search_after
+        return search
+
+    def _collect_chunks(
+        self, document_id: str, hits: Optional[list[dict]] = None
+    ) -> list[dict]:
+        """Chunks of a document, from a first page of hits if already fetched."""
+        if hits is None:
+            hits = self.client.search(
+                index=self.chunks_index_name, **self._chunk_search(document_id)
+            )["hits"]["hits"]
+
+        chunks = [hit["_source"] for hit in hits]
+        while len(hits) == _CHUNK_PAGE_SIZE:
+            hits = self.client.search(
+                index=self.chunks_index_name,
+                **self._chunk_search(document_id, hits[-1]["sort"]),
+            )["hits"]["hits"]
+            chunks.extend(hit["_source"] for hit in hits)
+        return chunks
+
     def delete_document(self, document_id: str) -> bool:
         """Delete document and its chunks."""
         try:
@@ -278,6 +582,7 @@ class ElasticsearchClient:
                 index=chunks_index,
                 query={"term": {"document_id": document_id}},
             )
+            self._invalidate_search_cache()
 
             logger.info(f"Deleted document: {document_id}")
             return True
@@ -291,11 +596,20 @@ class ElasticsearchClient:
     def search_documents(
         self,
         query: Optional[str] = None,
-        filters: Optional[dict[str, str]] = None,
+        filters: Optional[Mapping[str, str]] = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> tuple[list[dict], int]:
-        """Search documents by text query and/or filters."""
+        search_after: Optional[list] = None,
+    ) -> tuple[list[dict], int, Optional[list]]:
+        """Search documents by text query and/or filters.
+
+        Pass the sort values returned with the previous page as
+        search_after to page without from/size, whose cost grows with the
+        offset; offset is ignored then.
+
+        Returns:
+            Tuple of (documents, total count, sort values of the last hit)
+        """
         must_clauses = []
 
         if query:
@@ -303,7 +617,7 @@ class ElasticsearchClient:
                 {
                     "multi_match": {
                         "query": query,
-                        "fields": ["title^2", "content"],
+                        "fields": ["title^2", "content", "searchable_content"],
                     }
                 }
             )
@@ -314,21 +628,28 @@ class ElasticsearchClient:
 
         search_query = {"bool": {"must": must_clauses}} if must_clauses else {"match_all": {}}
 
+        # document_id breaks created_at ties so search_after never skips a hit
+        if search_after:
+            page: dict[str, Any] = {"search_after": search_after}
+        else:
+            page = {"from_": offset}
+
         try:
             result = self.client.search(
                 index=self.index_name,
                 query=search_query,
-                from_=offset,
                 size=limit,
-                sort=[{"created_at": "desc"}],
+                sort=[{"created_at": "desc"}, {"document_id": "asc"}],
+                **page,
             )
 
-            docs = [hit["_source"] for hit in result["hits"]["hits"]]
+            hits = result["hits"]["hits"]
+            docs = [hit["_source"] for hit in hits]
             total = result["hits"]["total"]["value"]
-            return docs, total
+            return docs, total, hits[-1]["sort"] if hits else None
         except Exception as e:
             logger.error(f"Search failed: {e}")
-            return [], 0
+            return [], 0, None
 
     # ==================== Vector Search ====================
 
@@ -339,7 +660,60 @@ class ElasticsearchClient:
         min_score: float = 0.5,
         exclude_doc_ids: Optional[list[str]] = None,
     ) -> list[SearchResult]:
-        """Search for similar chunks using vector similarity."""
+        """Search for similar chunks using vector similarity.
+
+        When vector_search_cache_size is set, results are memoized per query
+        until this process next writes to the indices or the TTL expires.
+        """
+        cache_size = self.settings.vector_search_cache_size
+        ttl = self.settings.vector_search_cache_ttl
+        key = None
+        if cache_size > 0 and ttl > 0:
+            digest = hashlib.blake2b(
+                np.asarray(embedding, dtype=np.float32).tobytes(), digest_size=16
+            ).digest()
+            key = (
+                self._search_generation, digest, top_k, min_score,
+                tuple(sorted(exclude_doc_ids or ())),
+            )
+            cached = None
+            with self._search_lock:
+                entry = self._search_cache.get(key)
+                if entry is not None:
+                    expires, cached = entry
+                    if expires <= time.monotonic():
+                        # Other writers (replicas, scripts) don't invalidate
+                        del self._search_cache[key]
+                        cached = None
+                    else:
+                        self._search_cache.move_to_end(key)
+            # Callers rescore results in place, so each gets its own copies
+            if cached is not None:
+                return [replace(r) for r in cached]
+
+        try:
+            results = self._knn_search(embedding, top_k, min_score, exclude_doc_ids)
+        except Exception as e:
+            logger.error(f"Vector search failed: {e}")
+            return []
+
+        if key is not None:
+            with self._search_lock:
+                self._search_cache[key] = (
+                    time.monotonic() + ttl, [replace(r) for r in results]
+                )
+                if len(self._search_cache) > cache_size:
+                    self._search_cache.popitem(last=False)
+        return results
+
+    def _knn_search(
+        self,
+        embedding: list[float],
+        top_k: int,
+        min_score: float,
+        exclude_doc_ids: Optional[list[str]],
+    ) -> list[SearchResult]:
+        """Run a kNN search on the chunks index and build its results."""
         chunks_index = f"{self.index_name}_chunks"
 
         # Build filter for exclusions
@@ -349,67 +723,67 @@ class ElasticsearchClient:
                 "bool": {"must_not": [{"terms": {"document_id": exclude_doc_ids}}]}
             }
 
-        try:
-            # kNN search
-            knn_query = {
-                "field": "embedding",
-                "query_vector": embedding,
-                "k": top_k,
-                "num_candidates": top_k * 10,
-            }
-
-            if filter_clause:
-                knn_query["filter"] = filter_clause
-
-            result = self.client.search(
-                index=chunks_index,
-                knn=knn_query,
-                size=top_k,
-                _source=["chunk_id", "document_id", "document_title", "text", "position", "metadata"],
-            )
-
-            results = []
-            for hit in result["hits"]["hits"]:
-                score = hit["_score"]
-                # Elasticsearch returns scores, convert to similarity
-                # For cosine similarity, score is already between 0 and 1
-                if score >= min_score:
-                    source = hit["_source"]
-                    results.append(
-                        SearchResult(
-                            document_id=source["document_id"],
-                            chunk_id=source["chunk_id"],
-                            document_title=source.get("document_title", ""),
-                            matched_text=source["text"],
-                            similarity_score=score,
-                            position=source.get("position", 0),
-                            metadata=source.get("metadata", {}),
-                        )
-                    )
-
-            # Group by document and limit results per source
-            return self._limit_results_per_source(
-                results, self.settings.max_results_per_source
-            )
-
-        except Exception as e:
-            logger.error(f"Vector search failed: {e}")
-            return []
+        # kNN search
+        knn_query = {
+            "field": "embedding",
+            "query_vector": self._encode_vector(embedding),
+            "k": top_k,
+            "num_candidates": top_k * 10,
+        }
 
-    def _limit_results_per_source(
-        self, results: list[SearchResult], max_per_source: int
-    ) -> list[SearchResult]:
-        """Limit results per source document to avoid bias."""
+        if filter_clause:
+            knn_query["filter"] = filter_clause
+
+        result = self.client.search(
+            index=chunks_index,
+            knn=knn_query,
+            size=top_k,
+            _source=[
+                "chunk_id", "document_id", "document_title", "text", "position",
+                "metadata", "normalized_text", "token_hashes",
+            ],
+        )
+
+        # Hits come sorted by score, so the first below min_score ends the
+        # scan; the per-source cap is applied before a result is built
+        max_per_source = self.settings.max_results_per_source
         doc_counts: dict[str, int] = {}
-        filtered_results = []
+        results = []
+        for hit in result["hits"]["hits"]:
+            score = hit["_score"]
+            # Elasticsearch returns scores, convert to similarity
+            # cosine and dot_product on unit vectors both score in [0, 1]
+            if score < min_score:
+                break
+            source = hit["_source"]
+            doc_id = source["document_id"]
+            count = doc_counts.get(doc_id, 0)
+            if count >= max_per_source:
+                continue
+            doc_counts[doc_id] = count + 1
+            results.append(
+                SearchResult(
+                    document_id=doc_id,
+                    chunk_id=source["chunk_id"],
+                    document_title=source.get("document_title", ""),
+                    matched_text=source["text"],
+                    similarity_score=score,
+                    position=source.get("position", 0),
+                    metadata=source.get("metadata", {}),
+                    matched_normalized_text=source.get("normalized_text", ""),
+                    matched_token_hashes=base64.b64decode(
+                        source.get("token_hashes", "")
+                    ),
+                )
+            )
 
-        for result in results:
-            doc_id = result.document_id
-            if doc_counts.get(doc_id, 0) < max_per_source:
-                filtered_results.append(result)
-                doc_counts[doc_id] = doc_counts.get(doc_id, 0) + 1
+        return results
 
-        return filtered_results
+    def _invalidate_search_cache(self) -> None:
+        """Drop memoized vector_search results after a write."""
+        with self._search_lock:
+            self._search_generation += 1
+            self._search_cache.clear()
 
     def get_document_count(self) -> int:
         """Get total document count."""
@@ -429,11 +803,15 @@ class ElasticsearchClient:
 
 # Singleton instance
 _es_client: Optional[ElasticsearchClient] = None
+_es_client_lock = threading.Lock()
 
 
 def get_es_client() -> ElasticsearchClient:
     """Get singleton ES client instance."""
     global _es_client
     if _es_client is None:
-        _es_client = ElasticsearchClient()
+        # Two gRPC workers starting at once must not open two connection pools
+        with _es_client_lock:
+            if _es_client is None:
+                _es_client = ElasticsearchClient()
     return _es_client
@@ -1,50 +1,157 @@
 """MinIO client wrapper for file storage."""
 
+import asyncio
+import hashlib
+import io
+import json
 import logging
+import math
 import os
+import queue
+import random
+import socket
+import struct
+import tarfile
 import tempfile
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, BinaryIO, Hashable, NamedTuple, Optional
 from pathlib import Path
 
+import certifi
+import urllib3
 from minio import Minio
 from minio.error import S3Error
+from urllib3.connection import HTTPConnection
 
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from an object response per write to the sink
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Chunks download_file may read ahead of its writer thread (1 MiB each)
+_WRITE_QUEUE_DEPTH = 8
+
+# Encodings urllib3 can decode here (zstd needs zstandard installed), offered
+# on whole-object GETs so a compressing proxy can shrink text on the wire.
+# A byte range of an encoded body is meaningless, so ranged GETs omit it.
+_ACCEPT_ENCODING = urllib3.util.make_headers(accept_encoding=True)
+
+# Probe idle pooled connections so dead ones are dropped, not reused mid-request
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _KEEPALIVE_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+
+# Distinct (bucket, prefix, recursive) listings kept by list_objects
+_LIST_CACHE_SIZE = 512
+
+# Objects whose stat (or absence) is remembered; for how long is configured
+# by minio_stat_cache_ttl and minio_missing_cache_ttl
+_STAT_CACHE_SIZE = 4096
+
+# Seconds a health_check verdict is reused, so frequent probes cost one LIST
+_HEALTH_CACHE_TTL = 2.0
+
+# Upper bound on the random delay before each ranged GET starts, in seconds;
+# staggering keeps the connections from ramping up in lockstep
+_RANGE_START_JITTER = 0.05
+
+# A pack is a tar of small objects followed by a JSON index of member
+# {name: [offset, length]} and, in the last 8 bytes, the index's offset.
+# Its tail is read in one GET, which holds the index for typical packs.
+_PACK_FOOTER = struct.Struct(">Q")
+_PACK_TAIL_SIZE = 64 << 10
+# Pack keys are content hashes, so an index never goes stale
+_PACK_INDEX_CACHE_SIZE = 256
+_PACK_INDEX_CACHE_TTL = 600.0
+
+
+class ObjectInfo(NamedTuple):
+    """An object from a bucket listing."""
+
+    name: str
+    size: int
+    last_modified: Optional[datetime]
+    is_dir: bool
+
+
+# Reads an SDK listing entry's ObjectInfo fields in one C-level call
+_object_fields = attrgetter("object_name", "size", "last_modified", "is_dir")
+
 
 class MinioClient:
     """MinIO client for file storage operations."""
 
     def __init__(self):
-        self.settings = get_settings()
-        self._client: Optional[Minio] = None
-
-    @property
-    def client(self) -> Minio:
-        """Get or create MinIO client."""
-        if self._client is None:
-            self._client = Minio(
-                endpoint=self.settings.minio_url,
-                access_key=self.settings.minio_access_key,
-                secret_key=self.settings.minio_secret_key,
-                secure=self.settings.minio_use_ssl,
-            )
-        return self._client
+        settings = get_settings()
+        self.max_connections = settings.minio_max_connections
+        # The SDK's own pool keeps 10 connections; ranged and concurrent
+        # downloads need more, kept alive so each skips the handshake
+        self._http_client = urllib3.PoolManager(
+            maxsize=self.max_connections,
+            block=False,
+            timeout=urllib3.Timeout(connect=5, read=60),
+            retries=urllib3.Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+            socket_options=HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        )
+        # Minio opens no connection until the first request, so it is built
+        # up front and every call site reads a plain attribute
+        self.client = Minio(
+            endpoint=settings.minio_url,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            secure=settings.minio_use_ssl,
+            http_client=self._http_client,
+        )
+        self._list_cache = _TTLCache(_LIST_CACHE_SIZE, settings.minio_list_cache_ttl)
+        # Only this process's writes invalidate these; other clients' changes
+        # show up once the entries expire
+        self._stat_cache = _TTLCache(_STAT_CACHE_SIZE, settings.minio_stat_cache_ttl)
+        self._missing_cache = _TTLCache(_STAT_CACHE_SIZE, settings.minio_missing_cache_ttl)
+        self._pack_indexes = _TTLCache(_PACK_INDEX_CACHE_SIZE, _PACK_INDEX_CACHE_TTL)
+        self._health: Optional[tuple[float, dict]] = None
+        self._health_lock = threading.Lock()
 
     def health_check(self) -> dict:
-        """Check MinIO connection health."""
-        try:
-            buckets = self.client.list_buckets()
-            return {
-                "healthy": True,
-                "buckets_count": len(buckets),
-                "message": "MinIO connection successful",
-            }
-        except Exception as e:
-            logger.error(f"MinIO health check failed: {e}")
-            return {"healthy": False, "error": str(e)}
+        """Check MinIO connection health.
+
+        The verdict is reused for a couple of seconds; concurrent callers
+        wait for one list_buckets rather than each sending their own.
+        """
+        with self._health_lock:
+            if self._health is not None and time.monotonic() < self._health[0]:
+                return dict(self._health[1])
+
+            try:
+                buckets = self.client.list_buckets()
+                health = {
+                    "healthy": True,
+                    "buckets_count": len(buckets),
+                    "message": "MinIO connection successful",
+                }
+            except Exception as e:
+                logger.error(f"MinIO health check failed: {e}")
+                health = {"healthy": False, "error": str(e)}
+
+            self._health = (time.monotonic() + _HEALTH_CACHE_TTL, health)
+            return dict(health)
+
+    async def health_check_async(self) -> dict:
+        """health_check without blocking the event loop."""
+        return await asyncio.to_thread(self.health_check)
 
     def bucket_exists(self, bucket_name: str) -> bool:
         """Check if bucket exists."""
@@ -56,29 +163,48 @@ class MinioClient:
 
     def object_exists(self, bucket_name: str, object_path: str) -> bool:
         """Check if object exists in bucket."""
-        try:
-            self.client.stat_object(bucket_name, object_path)
-            return True
-        except S3Error:
-            return False
+        return self._stat(bucket_name, object_path) is not None
 
     def get_object_info(self, bucket_name: str, object_path: str) -> Optional[dict]:
         """Get object metadata."""
+        info = self._stat(bucket_name, object_path)
+        return dict(info) if info is not None else None
+
+    def _stat(self, bucket_name: str, object_path: str) -> Optional[dict]:
+        """stat_object, remembering the result (or absence) for the configured TTLs.
+
+        object_exists followed by get_object_info costs one HEAD in total.
+        """
+        key = (bucket_name, object_path)
+        info = self._stat_cache.get(key)
+        if info is not None:
+            return info
+        if self._missing_cache.get(key) is not None:
+            return None
+
         try:
             stat = self.client.stat_object(bucket_name, object_path)
-            return {
-                "size": stat.size,
-                "content_type": stat.content_type,
-                "last_modified": stat.last_modified,
-                "etag": stat.etag,
-                "metadata": stat.metadata,
-            }
         except S3Error as e:
-            logger.error(f"Failed to get object info: {e}")
+            logger.debug(f"stat_object {bucket_name}/{object_path} failed: {e}")
+            self._missing_cache.set(key, True)
             return None
 
+        info = {
+            "size": stat.size,
+            "content_type": stat.content_type,
+            "last_modified": stat.last_modified,
+            "etag": stat.etag,
+            "metadata": stat.metadata,
+        }
+        self._stat_cache.set(key, info)
+        return info
+
     def download_file(
-        self, bucket_name: str, object_path: str, local_path: Optional[str] = None
+        self,
+        bucket_name: str,
+        object_path: str,
+        local_path: Optional[str] = None,
+        temp_dir: Optional[str] = None,
     ) -> Optional[str]:
         """
         Download file from MinIO to local path.
@@ -87,6 +213,7 @@ class MinioClient:
             bucket_name: MinIO bucket name
             object_path: Path to object in bucket
             local_path: Optional local path to save file. If None, creates temp file.
+            temp_dir: Directory for the temp file, e.g. a tmpfs (default: system temp)
 
         Returns:
             Local file path if successful, None otherwise.
@@ -94,16 +221,15 @@ class MinioClient:
         temp_file_created = False
         try:
             if local_path is None:
-                # Create temp file with same extension
-                suffix = Path(object_path).suffix or ".pdf"
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=suffix
-                )
-                local_path = temp_file.name
-                temp_file.close()
+                local_path = _temp_path(object_path, temp_dir)
                 temp_file_created = True
 
-            self.client.fget_object(bucket_name, object_path, local_path)
+            # Writes happen on another thread, so the socket keeps being read
+            # while the previous chunk goes to disk
+            with _QueuedFileSink(local_path) as sink:
+                written = self.download_file_stream(bucket_name, object_path, sink)
+            if written is None:
+                raise OSError(f"Download of {bucket_name}/{object_path} failed")
             logger.info(f"Downloaded {bucket_name}/{object_path} to {local_path}")
             return local_path
 
@@ -118,73 +244,558 @@ class MinioClient:
                 os.remove(local_path)
             return None
 
-    def download_file_to_memory(
-        self, bucket_name: str, object_path: str
-    ) -> Optional[bytes]:
+    def download_file_parallel(
+        self,
+        bucket_name: str,
+        object_path: str,
+        local_path: Optional[str] = None,
+        part_size: int = 8 << 20,
+        concurrency: int = 8,
+        temp_dir: Optional[str] = None,
+    ) -> Optional[str]:
         """
-        Download file from MinIO to memory.
+        Download file from MinIO with concurrent ranged GETs.
+
+        A single GET rarely fills a fast link; the object is split into
+        part_size ranges fetched over up to concurrency connections, each
+        written at its own offset of a presized file.
+
+        Args:
+            bucket_name: MinIO bucket name
+            object_path: Path to object in bucket
+            local_path: Optional local path to save file. If None, creates temp file.
+            part_size: Bytes per ranged GET
+            concurrency: Ranged GETs in flight at once
+            temp_dir: Directory for the temp file, e.g. a tmpfs (default: system temp)
+
+        Returns:
+            Local file path if successful, None otherwise.
+        """
+        temp_file_created = False
+        fd = None
+        try:
+            size = self.client.stat_object(bucket_name, object_path).size
+
+            if local_path is None:
+                local_path = _temp_path(object_path, temp_dir)
+                temp_file_created = True
+
+            fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            if size:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(fd, 0, size)
+                else:
+                    os.ftruncate(fd, size)
+
+            def fetch(start: int) -> bool:
+                time.sleep(random.random() * _RANGE_START_JITTER)
+                length = min(part_size, size - start)
+                written = self.download_file_stream(
+                    bucket_name, object_path, _FileRangeSink(fd, start),
+                    offset=start, length=length,
+                )
+                return written == length
+
+            parts = range(0, size, part_size)
+            workers = max(1, min(concurrency, math.ceil(size / part_size)))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="minio-range"
+            ) as executor:
+                if not all(executor.map(fetch, parts)):
+                    raise OSError(f"Ranged download of {bucket_name}/{object_path} failed")
+
+            logger.info(
+                f"Downloaded {bucket_name}/{object_path} to {local_path} "
+                f"({size} bytes, {len(parts)} parts)"
+            )
+            return local_path
+
+        except Exception as e:
+            logger.error(f"Failed to download file in parallel: {e}")
+            if temp_file_created and local_path and os.path.exists(local_path):
+                os.remove(local_path)
+            return None
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def download_file_stream(
+        self,
+        bucket_name: str,
+        object_path: str,
+        sink: BinaryIO,
+        offset: int = 0,
+        length: int = 0,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+        expected_md5: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Stream an object from MinIO into a writable sink.
+
+        Only chunk_size bytes are held at a time, however large the object.
 
         Args:
             bucket_name: MinIO bucket name
             object_path: Path to object in bucket
+            sink: Object with a write() method, e.g. a file opened "wb"
+            offset: First byte to read
+            length: Bytes to read from offset (0 reads to the end)
+            chunk_size: Bytes read per write to the sink
+            expected_md5: Hex MD5 the bytes read must have, checked as they stream
 
         Returns:
-            File content as bytes if successful, None otherwise.
+            Number of bytes written if successful, None otherwise.
         """
         response = None
+        # Hashing each chunk as it arrives reads it while still in cache,
+        # rather than in a second pass over the whole object
+        hasher = hashlib.md5(usedforsecurity=False) if expected_md5 else None
         try:
-            response = self.client.get_object(bucket_name, object_path)
-            data = response.read()
-            logger.info(f"Downloaded {bucket_name}/{object_path} to memory ({len(data)} bytes)")
-            return data
+            response = self.client.get_object(
+                bucket_name, object_path, offset=offset, length=length,
+                request_headers=None if offset or length else _ACCEPT_ENCODING,
+            )
+            written = 0
+            for data in response.stream(chunk_size):
+                sink.write(data)
+                if hasher:
+                    hasher.update(data)
+                written += len(data)
+
+            if hasher and hasher.hexdigest() != expected_md5:
+                logger.error(
+                    f"Checksum mismatch for {bucket_name}/{object_path}: "
+                    f"expected {expected_md5}, got {hasher.hexdigest()}"
+                )
+                return None
+            return written
         except S3Error as e:
-            logger.error(f"Failed to download file to memory: {e}")
+            logger.error(f"Failed to stream file: {e}")
             return None
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error(f"Unexpected error streaming file: {e}")
             return None
         finally:
             if response:
                 response.close()
                 response.release_conn()
 
+    def download_file_to_bytes(
+        self, bucket_name: str, object_path: str, verify: bool = False
+    ) -> Optional[bytearray]:
+        """
+        Download file from MinIO to memory.
+
+        The buffer is sized from stat_object up front and filled in place,
+        so the object is never copied or reallocated while it downloads.
+
+        Args:
+            bucket_name: MinIO bucket name
+            object_path: Path to object in bucket
+            verify: Check the content against the object's ETag when it is a
+                plain MD5 (single-part upload without SSE-KMS)
+
+        Returns:
+            File content if successful, None otherwise.
+        """
+        try:
+            stat = self.client.stat_object(bucket_name, object_path)
+        except S3Error as e:
+            logger.error(f"Failed to download file to memory: {e}")
+            return None
+
+        size = stat.size
+        data = bytearray(size)
+        if size:
+            # Range to the stat'd size so an object rewritten meanwhile can't overflow
+            with memoryview(data) as view:
+                written = self.download_file_stream(
+                    bucket_name, object_path, _BufferSink(view), length=size,
+                    expected_md5=_etag_md5(stat.etag) if verify else None,
+                )
+            if written != size:
+                return None
+
+        logger.info(f"Downloaded {bucket_name}/{object_path} to memory ({size} bytes)")
+        return data
+
+    def download_many(
+        self, bucket_name: str, object_paths: list[str], concurrency: int = 16
+    ) -> dict[str, Optional[bytes]]:
+        """
+        Download several objects to memory concurrently.
+
+        Small objects are dominated by round-trip time, so fetching them in
+        parallel takes about ceil(N / concurrency) round-trips instead of N.
+
+        Args:
+            bucket_name: MinIO bucket name
+            object_paths: Paths to objects in bucket
+            concurrency: GETs in flight at once (capped by the connection pool)
+
+        Returns:
+            Content per object path; None for objects that failed to download.
+        """
+        def fetch(object_path: str) -> Optional[bytes]:
+            buffer = io.BytesIO()
+            if self.download_file_stream(bucket_name, object_path, buffer) is None:
+                return None
+            return buffer.getvalue()
+
+        paths = list(dict.fromkeys(object_paths))
+        if not paths:
+            return {}
+
+        # More threads than pooled connections would only queue on the pool
+        workers = min(concurrency, self.max_connections, len(paths))
+        with ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="minio-get"
+        ) as executor:
+            return dict(zip(paths, executor.map(fetch, paths)))
+
+    def write_pack(
+        self, bucket_name: str, members: dict[str, bytes], prefix: str = "packs/"
+    ) -> Optional[str]:
+        """
+        Store many small objects as one tar "pack" object.
+
+        Each member is then read back with a single ranged GET, so N small
+        objects cost one PUT and no per-object LIST or HEAD.
+
+        Args:
+            bucket_name: MinIO bucket name
+            members: Content per member name
+            prefix: Folder the pack is stored under
+
+        Returns:
+            Key of the pack if successful, None otherwise.
+        """
+        buffer = io.BytesIO()
+        index: dict[str, list[int]] = {}
+        with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            for name, data in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = 0
+                tar.addfile(info, io.BytesIO(data))
+                # tar.offset is now past the data and its padding to a whole block
+                blocks = -(-len(data) // tarfile.BLOCKSIZE)
+                index[name] = [tar.offset - blocks * tarfile.BLOCKSIZE, len(data)]
+
+        # Tar readers stop at the end-of-archive blocks and ignore the index
+        index_offset = buffer.tell()
+        buffer.write(json.dumps(index, separators=(",", ":")).encode())
+        buffer.write(_PACK_FOOTER.pack(index_offset))
+
+        size = buffer.tell()
+        with buffer.getbuffer() as view:
+            digest = hashlib.blake2b(view, digest_size=16).hexdigest()
+        pack_key = f"{prefix}{digest}.tar"
+        buffer.seek(0)
+        try:
+            self.client.put_object(
+                bucket_name, pack_key, buffer, size,
+                content_type="application/x-tar",
+            )
+        except S3Error as e:
+            logger.error(f"Failed to write pack {bucket_name}/{pack_key}: {e}")
+            return None
+
+        self.invalidate_prefix(bucket_name, pack_key)
+        self._pack_indexes.set((bucket_name, pack_key), index)
+        logger.info(f"Wrote pack {bucket_name}/{pack_key} ({len(index)} members)")
+        return pack_key
+
+    def read_pack_member(
+        self, bucket_name: str, pack_key: str, member: str
+    ) -> Optional[bytes]:
+        """
+        Read one member of a pack written by write_pack.
+
+        The pack's index is cached, so after the first member each read is a
+        single ranged GET.
+
+        Args:
+            bucket_name: MinIO bucket name
+            pack_key: Key returned by write_pack
+            member: Member name
+
+        Returns:
+            Member content if found, None otherwise.
+        """
+        index = self._pack_index(bucket_name, pack_key)
+        if index is None:
+            return None
+        entry = index.get(member)
+        if entry is None:
+            logger.warning(f"Member {member} not in pack {bucket_name}/{pack_key}")
+            return None
+
+        offset, length = entry
+        return self._read_range(bucket_name, pack_key, offset, length)
+
+    def _pack_index(self, bucket_name: str, pack_key: str) -> Optional[dict]:
+        """Index of a pack, from cache or from the tail of the object."""
+        key = (bucket_name, pack_key)
+        index = self._pack_indexes.get(key)
+        if index is not None:
+            return index
+
+        info = self._stat(bucket_name, pack_key)
+        if info is None or info["size"] < _PACK_FOOTER.size:
+            logger.error(f"Pack {bucket_name}/{pack_key} not found or truncated")
+            return None
+
+        size = info["size"]
+        tail_start = max(0, size - _PACK_TAIL_SIZE)
+        tail = self._read_range(bucket_name, pack_key, tail_start, size - tail_start)
+        if tail is None:
+            return None
+
+        (index_offset,) = _PACK_FOOTER.unpack_from(tail, len(tail) - _PACK_FOOTER.size)
+        index_end = size - _PACK_FOOTER.size
+        if index_offset >= tail_start:
+            raw = tail[index_offset - tail_start:index_end - tail_start]
+        else:
+            # Index larger than the tail read: fetch it exactly
+            raw = self._read_range(
+                bucket_name, pack_key, index_offset, index_end - index_offset
+            )
+            if raw is None:
+                return None
+
+        try:
+            index = json.loads(raw)
+        except ValueError as e:
+            logger.error(f"Invalid pack index in {bucket_name}/{pack_key}: {e}")
+            return None
+
+        self._pack_indexes.set(key, index)
+        return index
+
+    def _read_range(
+        self, bucket_name: str, object_path: str, offset: int, length: int
+    ) -> Optional[bytes]:
+        """Bytes [offset, offset + length) of an object, or None on failure."""
+        data = bytearray(length)
+        if not length:
+            return bytes(data)
+        with memoryview(data) as view:
+            written = self.download_file_stream(
+                bucket_name, object_path, _BufferSink(view),
+                offset=offset, length=length,
+            )
+        if written != length:
+            return None
+        return bytes(data)
+
     def list_objects(
-        self, bucket_name: str, prefix: str = "", recursive: bool = True
-    ) -> list[dict]:
-        """List objects in bucket with optional prefix filter."""
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        recursive: bool = True,
+        strict_prefix: bool = True,
+    ) -> list[ObjectInfo]:
+        """List objects in bucket with optional prefix filter.
+
+        A recursive listing of a folder-like prefix ("docs/2024") is scoped
+        to that folder ("docs/2024/"), which the server can seek to instead
+        of scanning every key that merely starts with it. Pass
+        strict_prefix=False for a plain prefix match.
+
+        Listings are reused for minio_list_cache_ttl seconds; writers call
+        invalidate_prefix to drop the ones they made stale.
+        """
+        if (
+            strict_prefix
+            and recursive
+            and prefix
+            and not prefix.endswith("/")
+            and "." not in prefix.rsplit("/", 1)[-1]
+        ):
+            logger.debug(f"list_objects: scoping prefix {prefix!r} to {prefix + '/'!r}")
+            prefix += "/"
+
+        key = (bucket_name, prefix, recursive)
+        cached = self._list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         try:
             objects = self.client.list_objects(
                 bucket_name, prefix=prefix, recursive=recursive
             )
-            return [
-                {
-                    "name": obj.object_name,
-                    "size": obj.size,
-                    "last_modified": obj.last_modified,
-                    "is_dir": obj.is_dir,
-                }
-                for obj in objects
-            ]
+            # Rows are built in C, without a Python-level __init__ per object
+            result = list(map(ObjectInfo._make, map(_object_fields, objects)))
         except S3Error as e:
             logger.error(f"Failed to list objects: {e}")
             return []
 
+        self._list_cache.set(key, result)
+        return list(result)
+
+    def invalidate_prefix(self, bucket_name: str, prefix: str = "") -> None:
+        """Drop cached listings and stats that could cover objects under prefix."""
+        self._list_cache.discard_if(
+            lambda key: key[0] == bucket_name
+            and (key[1].startswith(prefix) or prefix.startswith(key[1]))
+        )
+        for cache in (self._stat_cache, self._missing_cache):
+            cache.discard_if(
+                lambda key: key[0] == bucket_name and key[1].startswith(prefix)
+            )
+
     def close(self):
-        """Close the MinIO client and release resources."""
-        if self._client:
-            # MinIO client uses urllib3 connection pool internally
-            # Setting to None allows garbage collection
-            self._client = None
-            logger.info("MinIO client closed")
+        """Close pooled connections; later calls open new ones as needed."""
+        self._http_client.clear()
+        logger.info("MinIO client closed")
+
+
+def _etag_md5(etag: Optional[str]) -> Optional[str]:
+    """The MD5 an ETag stands for, or None if it is not a plain MD5.
+
+    Multipart ETags ("<md5>-<parts>") and encrypted objects' ETags do not
+    hash the content and cannot be checked against it.
+    """
+    etag = (etag or "").strip('"').lower()
+    if len(etag) == 32 and all(c in "0123456789abcdef" for c in etag):
+        return etag
+    return None
+
+
+def _temp_path(object_path: str, temp_dir: Optional[str] = None) -> str:
+    """Create an empty temp file named with the object's extension."""
+    # mkstemp leaves no open file object or finalizer behind, unlike
+    # NamedTemporaryFile(delete=False)
+    fd, path = tempfile.mkstemp(
+        suffix=Path(object_path).suffix or ".pdf", prefix="minio_dl_", dir=temp_dir
+    )
+    os.close(fd)
+    return path
+
+
+class _TTLCache:
+    """Thread-safe LRU whose entries also expire ttl seconds after being set."""
 
+    __slots__ = ("_maxsize", "_ttl", "_entries", "_lock")
 
-# Singleton instance
-_minio_client: Optional[MinioClient] = None
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
 
+    def get(self, key: Hashable) -> Any:
+        """Cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
 
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting the least recently used entry when full."""
+        if self._ttl <= 0 or self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_if(self, predicate) -> None:
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+class _BufferSink:
+    """Writable sink filling a preallocated buffer from the start."""
+
+    __slots__ = ("_view", "_offset")
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._offset = 0
+
+    def write(self, data: bytes) -> int:
+        end = self._offset + len(data)
+        self._view[self._offset:end] = data
+        self._offset = end
+        return len(data)
+
+
+class _FileRangeSink:
+    """Writable sink writing to a file descriptor from a fixed offset."""
+
+    __slots__ = ("_fd", "_offset")
+
+    def __init__(self, fd: int, offset: int):
+        self._fd = fd
+        self._offset = offset
+
+    def write(self, data: bytes) -> int:
+        # pwrite leaves the shared file position alone, so ranges can interleave
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(self._fd, view, self._offset)
+            self._offset += written
+            view = view[written:]
+        return len(data)
+
+
+class _QueuedFileSink:
+    """Writable sink handing chunks to a thread that writes them to a file."""
+
+    __slots__ = ("_file", "_queue", "_thread", "_error")
+
+    def __init__(self, path: str, depth: int = _WRITE_QUEUE_DEPTH):
+        self._file = open(path, "wb")
+        self._queue: queue.Queue[Optional[bytes]] = queue.Queue(depth)
+        self._error: Optional[OSError] = None
+        self._thread = threading.Thread(
+            target=self._run, name="minio-write", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (data := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    self._file.write(data)
+                except OSError as e:
+                    self._error = e
+
+    def write(self, data: bytes) -> int:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(data)
+        return len(data)
+
+    def close(self) -> None:
+        """Wait for queued chunks to be written, raising any write error."""
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "_QueuedFileSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@lru_cache(maxsize=1)
 def get_minio_client() -> MinioClient:
-    """Get singleton MinIO client instance."""
-    global _minio_client
-    if _minio_client is None:
-        _minio_client = MinioClient()
-    return _minio_client
+    """Get singleton MinIO client instance.
+
+    Tests can call get_minio_client.cache_clear() for a fresh instance.
+    """
+    return MinioClient()
@@ -4,6 +4,8 @@ import pytest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -31,7 +33,9 @@ def sample_document():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_embedding():
-    """Mock embedding vector."""
-    return [0.1] * 768  # 768-dimensional vector
+    """Mock embedding vector, shared by all tests and so read-only."""
+    embedding = np.full(768, 0.1, dtype=np.float32)  # 768-dimensional vector
+    embedding.setflags(write=False)
+    return embedding
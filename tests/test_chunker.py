@@ -7,9 +7,10 @@ from src.core.chunker import TextChunker, TextChunk
 class TestTextChunker:
     """Test cases for TextChunker."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.chunker = TextChunker(
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures; the chunker is stateless, so tests share one."""
+        cls.chunker = TextChunker(
             chunk_size=10,  # Small for testing
             chunk_overlap=2,
             min_chunk_size=3,
@@ -112,6 +113,13 @@ class TestTextChunker:
         chunks = self.chunker.chunk_text("   ")
         assert len(chunks) == 0
 
+    def test_chunk_normalized_text(self):
+        """Test pre-normalized input chunks the same as raw input."""
+        text = "  one two\n\nthree four five six seven eight nine ten eleven twelve  "
+        normalized = self.chunker.normalize_text(text)
+
+        assert self.chunker.chunk_text_normalized(normalized) == self.chunker.chunk_text(text)
+
 
 class TestTextChunk:
     """Test cases for TextChunk dataclass."""
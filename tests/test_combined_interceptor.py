@@ -0,0 +1,215 @@
+"""Tests for the combined logging and metrics interceptor."""
+
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+from unittest.mock import MagicMock
+
+from src.metrics import CombinedInterceptor, MetricsInterceptor
+from src.metrics.metrics import REGISTRY
+
+_SERVICE = "test.Interceptor"
+
+
+def _unary_error(request, context):
+    raise RuntimeError("boom")
+
+
+def _unary_set_code(request, context):
+    context.set_code(grpc.StatusCode.NOT_FOUND)
+    context.set_details("no such document")
+    return b""
+
+
+def _unary_abort(request, context):
+    context.abort(grpc.StatusCode.INVALID_ARGUMENT, "bad cursor")
+
+
+def _unary_ok(request, context):
+    return request
+
+
+def _stream_ok(request, context):
+    yield b"1"
+    yield b"2"
+
+
+def _stream_error(request, context):
+    yield b"1"
+    raise RuntimeError("mid-stream")
+
+
+def _stream_unary_count(requests, context):
+    return b"%d" % sum(1 for _ in requests)
+
+
+_HANDLERS = {
+    "UnaryError": grpc.unary_unary_rpc_method_handler(_unary_error),
+    "UnarySetCode": grpc.unary_unary_rpc_method_handler(_unary_set_code),
+    "UnaryAbort": grpc.unary_unary_rpc_method_handler(_unary_abort),
+    "UnaryOk": grpc.unary_unary_rpc_method_handler(_unary_ok),
+    "StreamOk": grpc.unary_stream_rpc_method_handler(_stream_ok),
+    "StreamError": grpc.unary_stream_rpc_method_handler(_stream_error),
+    "StreamUnary": grpc.stream_unary_rpc_method_handler(_stream_unary_count),
+}
+
+
+@pytest.fixture(params=["combined", "metrics"])
+def served(request):
+    """Serve the test handlers through one interceptor, in process.
+
+    Each interceptor gets its own service name so their counters stay apart.
+    """
+    if request.param == "combined":
+        interceptor = CombinedInterceptor(service_name="test")
+        interceptor._logging._log_request = MagicMock()
+        service = f"{_SERVICE}Combined"
+    else:
+        interceptor = MetricsInterceptor(service_name="test")
+        service = f"{_SERVICE}Metrics"
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2), interceptors=[interceptor]
+    )
+    server.add_generic_rpc_handlers(
+        [grpc.method_handlers_generic_handler(service, _HANDLERS)]
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    yield request.param, interceptor, channel, service
+    channel.close()
+    server.stop(None)
+
+
+def _count(method: str, status: str) -> float:
+    """Current grpc_requests_total for method and status."""
+    return REGISTRY.get_sample_value(
+        "grpc_requests_total", {"method": method, "status": status}
+    ) or 0.0
+
+
+def _wait_for_count(method: str, status: str, expected: float) -> float:
+    """Wait for an RPC recorded at termination to show up in the counter."""
+    deadline = time.monotonic() + 5
+    while _count(method, status) < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return _count(method, status)
+
+
+def _in_flight() -> float:
+    """Current grpc_requests_in_flight."""
+    return REGISTRY.get_sample_value("grpc_requests_in_flight")
+
+
+class TestStatusAccounting:
+    """Test cases for the status recorded for each way an RPC can end."""
+
+    def _call(self, served, name, kind="unary_unary", request=b"x"):
+        """Invoke a test method; return (method, result or RpcError)."""
+        _, _, channel, service = served
+        method = f"/{service}/{name}"
+        try:
+            call = getattr(channel, kind)(method)
+            result = call(request)
+            if kind == "unary_stream":
+                result = list(result)
+            return method, result
+        except grpc.RpcError as e:
+            return method, e
+
+    def _logged(self, served):
+        """Trace log entries written by the combined interceptor."""
+        kind, interceptor, *_ = served
+        if kind != "combined":
+            return None
+        return [call.kwargs for call in interceptor._logging._log_request.call_args_list]
+
+    def test_unary_error_is_internal(self, served):
+        """Test an unhandled servicer error is aborted and counted as an error."""
+        kind = served[0]
+        method, error = self._call(served, "UnaryError")
+
+        expected = "INTERNAL" if kind == "combined" else "UNKNOWN"
+        assert error.code().name == expected
+        assert _wait_for_count(method, expected, 1) == 1
+        assert _count(method, "OK") == 0
+        if kind == "combined":
+            (entry,) = self._logged(served)
+            assert entry["success"] is False and entry["error"] == "boom"
+
+    def test_set_code(self, served):
+        """Test a code set by the servicer is recorded with its details."""
+        method, error = self._call(served, "UnarySetCode")
+
+        assert error.code() == grpc.StatusCode.NOT_FOUND
+        assert _wait_for_count(method, "NOT_FOUND", 1) == 1
+        if served[0] == "combined":
+            (entry,) = self._logged(served)
+            assert entry["error"] == "no such document"
+
+    def test_abort_keeps_its_code(self, served):
+        """Test context.abort is recorded with, and returns, the servicer's code."""
+        method, error = self._call(served, "UnaryAbort")
+
+        assert error.code() == grpc.StatusCode.INVALID_ARGUMENT
+        assert _wait_for_count(method, "INVALID_ARGUMENT", 1) == 1
+        assert _count(method, "INTERNAL") == 0
+
+    def test_unary_ok(self, served):
+        """Test a successful call is counted as OK."""
+        method, result = self._call(served, "UnaryOk")
+
+        assert result == b"x"
+        assert _wait_for_count(method, "OK", 1) == 1
+
+    def test_stream_ok(self, served):
+        """Test a completed response stream is counted once as OK."""
+        method, result = self._call(served, "StreamOk", "unary_stream")
+
+        assert result == [b"1", b"2"]
+        assert _wait_for_count(method, "OK", 1) == 1
+        if served[0] == "combined":
+            (entry,) = self._logged(served)
+            assert entry["success"] is True
+
+    def test_mid_stream_error(self, served):
+        """Test an error after the first message is counted once as an error."""
+        kind = served[0]
+        method, error = self._call(served, "StreamError", "unary_stream")
+
+        expected = "INTERNAL" if kind == "combined" else "UNKNOWN"
+        assert error.code().name == expected
+        assert _wait_for_count(method, expected, 1) == 1
+        # Give a stray termination callback the chance to count it again
+        time.sleep(0.1)
+        assert _count(method, expected) == 1
+        assert _count(method, "OK") == 0
+        if kind == "combined":
+            (entry,) = self._logged(served)
+            assert entry["success"] is False and entry["error"] == "mid-stream"
+
+    def test_stream_request_count(self, served):
+        """Test streamed requests are counted in the trace log."""
+        method, result = self._call(
+            served, "StreamUnary", "stream_unary", iter([b"a", b"b", b"c"])
+        )
+
+        assert result == b"3"
+        assert _wait_for_count(method, "OK", 1) == 1
+        if served[0] == "combined":
+            (entry,) = self._logged(served)
+            assert entry["request_count"] == 3
+
+    def test_in_flight_returns_to_zero(self, served):
+        """Test every RPC that starts is also finished in the gauge."""
+        before = _in_flight()
+        self._call(served, "UnaryOk")
+        self._call(served, "UnaryError")
+        self._call(served, "StreamError", "unary_stream")
+        deadline = time.monotonic() + 5
+        while _in_flight() != before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _in_flight() == before
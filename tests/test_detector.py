@@ -1,9 +1,10 @@
 """Tests for plagiarism detector."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 
 from src.core.detector import (
+    _map_bounded,
     PlagiarismDetector,
     PlagiarismResult,
     ChunkAnalysisResult,
@@ -13,38 +14,41 @@ from src.core.chunker import TextChunk
 from src.storage.elasticsearch import SearchResult
 
 
-class TestPlagiarismDetector:
-    """Test cases for PlagiarismDetector."""
-
-    @pytest.fixture
-    def mock_detector(self):
-        """Create detector with mocked dependencies."""
-        with patch("src.core.detector.get_es_client") as mock_es, \
-             patch("src.core.detector.get_ollama_client") as mock_ollama, \
-             patch("src.core.detector.get_chunker") as mock_chunker, \
-             patch("src.core.detector.get_analyzer") as mock_analyzer:
+@pytest.fixture(scope="module")
+def shared_detector():
+    """Create detector with mocked dependencies, once for the module."""
+    with patch.multiple(
+        "src.core.detector",
+        get_es_client=DEFAULT,
+        get_ollama_client=DEFAULT,
+        get_chunker=DEFAULT,
+        get_analyzer=DEFAULT,
+    ):
+        detector = PlagiarismDetector()
+        detector.es_client = MagicMock()
+        detector.ollama_client = MagicMock()
+        detector.chunker = MagicMock()
+        detector.analyzer = MagicMock()
 
-            # Setup mocks
-            mock_es_instance = MagicMock()
-            mock_es.return_value = mock_es_instance
-            mock_es_instance.get_document_count.return_value = 100
+        yield detector
 
-            mock_ollama_instance = MagicMock()
-            mock_ollama.return_value = mock_ollama_instance
 
-            mock_chunker_instance = MagicMock()
-            mock_chunker.return_value = mock_chunker_instance
-
-            mock_analyzer_instance = MagicMock()
-            mock_analyzer.return_value = mock_analyzer_instance
-
-            detector = PlagiarismDetector()
-            detector.es_client = mock_es_instance
-            detector.ollama_client = mock_ollama_instance
-            detector.chunker = mock_chunker_instance
-            detector.analyzer = mock_analyzer_instance
+class TestPlagiarismDetector:
+    """Test cases for PlagiarismDetector."""
 
-            yield detector
+    @pytest.fixture
+    def mock_detector(self, shared_detector):
+        """Shared detector with its mocks reset to a clean state."""
+        for mock in (
+            shared_detector.es_client,
+            shared_detector.ollama_client,
+            shared_detector.chunker,
+            shared_detector.analyzer,
+        ):
+            mock.reset_mock(return_value=True, side_effect=True)
+        shared_detector.es_client.get_document_count.return_value = 100
+
+        return shared_detector
 
     def test_empty_text_returns_safe(self, mock_detector):
         """Test empty text returns SAFE result."""
@@ -119,6 +123,40 @@ class TestPlagiarismDetector:
         assert result.severity == "CRITICAL"
         assert len(result.matches) == 1
 
+    def test_stream_yields_each_chunk_then_result(self, mock_detector):
+        """Test streaming check yields per-chunk updates and returns the result."""
+        mock_detector.chunker.chunk_text.return_value = [
+            TextChunk(text="first", position=0, start_char=0, end_char=5, word_count=1),
+            TextChunk(text="second", position=1, start_char=6, end_char=12, word_count=1),
+        ]
+        mock_detector.ollama_client.embed_batch.return_value = [[0.1] * 768] * 2
+        mock_detector.es_client.vector_search.side_effect = [
+            [],
+            [
+                SearchResult(
+                    document_id="doc1",
+                    chunk_id="chunk1",
+                    document_title="Source Document",
+                    matched_text="second",
+                    similarity_score=0.98,
+                    position=0,
+                )
+            ],
+        ]
+
+        stream = mock_detector.check_plagiarism_stream(
+            "first second", include_ai_analysis=False
+        )
+        updates = []
+        with pytest.raises(StopIteration) as stop:
+            while True:
+                updates.append(next(stream))
+
+        assert [analysis.chunk_index for analysis, _ in updates] == [0, 1]
+        assert [len(matches) for _, matches in updates] == [0, 1]
+        assert stop.value.value.chunks_analyzed == 2
+        assert len(stop.value.value.matches) == 1
+
     def test_calculate_base_percentage(self, mock_detector):
         """Test base percentage calculation."""
         chunks = [
@@ -194,6 +232,46 @@ class TestPlagiarismDetector:
         assert unique[1].matched_chunk_id == "chunk_a"
 
 
+class TestMapBounded:
+    """Test cases for _map_bounded."""
+
+    def test_keeps_order_and_window(self):
+        """Test results come in input order with at most window calls in flight."""
+        executor = MagicMock()
+        submitted = []
+
+        def submit(fn, item):
+            submitted.append(item)
+            future = Mock()
+            future.result.return_value = fn(item)
+            return future
+
+        executor.submit.side_effect = submit
+        results = _map_bounded(executor, lambda x: x * 10, range(5), window=2)
+
+        assert next(results) == 0
+        assert submitted == [0, 1]
+        assert list(results) == [10, 20, 30, 40]
+
+    def test_cancels_pending_on_close(self):
+        """Test abandoning the iterator cancels calls not yet consumed."""
+        executor = MagicMock()
+        futures = []
+
+        def submit(fn, item):
+            futures.append(Mock())
+            return futures[-1]
+
+        executor.submit.side_effect = submit
+        results = _map_bounded(executor, str, range(5), window=3)
+        next(results)
+        results.close()
+
+        assert len(futures) == 3
+        for future in futures[1:]:
+            future.cancel.assert_called_once()
+
+
 class TestPlagiarismResult:
     """Test cases for PlagiarismResult dataclass."""
 
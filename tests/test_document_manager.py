@@ -0,0 +1,168 @@
+"""Tests for document manager."""
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.chunker import TextChunker
+from src.core.document_manager import DocumentManager
+from src.core.pdf_processor import PdfChunk, PdfProcessingResult
+
+
+@pytest.fixture
+def manager():
+    """Manager with a real chunker and mocked Ollama and Elasticsearch."""
+    manager = DocumentManager.__new__(DocumentManager)
+    manager.chunker = TextChunker(chunk_size=5, chunk_overlap=1, min_chunk_size=2)
+    manager.ollama_client = MagicMock()
+    manager.ollama_client.embed_batch.side_effect = lambda texts: [[1.0] for _ in texts]
+    manager.es_client = MagicMock()
+    manager.es_client.index_document.return_value = True
+    return manager
+
+
+def _doc(title: str, words: int = 12) -> dict:
+    """Upload dict with enough words to chunk."""
+    return {"title": title, "content": " ".join(f"w{i}" for i in range(words))}
+
+
+def _pdf_chunk(name: str, position: int) -> PdfChunk:
+    """PDF chunk with predictable text."""
+    return PdfChunk(
+        chunk_id=f"{name}_{position}", section_title="S", text=f"{name} text {position}",
+        element_type="NarrativeText", position=position, word_count=3,
+    )
+
+
+class TestBatchUploadStream:
+    """Test cases for the embed/index upload pipeline."""
+
+    def test_results_in_input_order(self, manager):
+        """Test every document is embedded, indexed and reported in order."""
+        results = list(manager.batch_upload_stream(_doc(str(i)) for i in range(5)))
+
+        assert [r.title for r in results] == ["0", "1", "2", "3", "4"]
+        assert all(r.success for r in results)
+        assert manager.es_client.index_document.call_count == 5
+
+    def test_indexing_overlaps_next_embedding(self, manager):
+        """Test document i+1 is embedded while document i is being indexed."""
+        embedding_second = threading.Event()
+        overlapped = []
+
+        def embed_batch(texts):
+            if any(text.startswith("second") for text in texts):
+                embedding_second.set()
+            return [[1.0] for _ in texts]
+
+        def index_document(doc_data, refresh=True):
+            if doc_data.title == "first":
+                overlapped.append(embedding_second.wait(5))
+            return True
+
+        manager.ollama_client.embed_batch.side_effect = embed_batch
+        manager.es_client.index_document.side_effect = index_document
+        second = {"title": "second", "content": "second " + _doc("")["content"]}
+
+        results = list(manager.batch_upload_stream([_doc("first"), second]))
+
+        assert overlapped == [True]
+        assert [r.success for r in results] == [True, True]
+
+    def test_failures_reported_in_place(self, manager):
+        """Test empty, unembeddable and unindexable documents fail alone."""
+        def embed_batch(texts):
+            if any(text.startswith("boom") for text in texts):
+                raise RuntimeError("ollama down")
+            return [[1.0] for _ in texts]
+
+        manager.ollama_client.embed_batch.side_effect = embed_batch
+        manager.es_client.index_document.side_effect = (
+            lambda doc_data, refresh=True: doc_data.title != "unindexed"
+        )
+        documents = [
+            _doc("ok"),
+            {"title": "empty", "content": ""},
+            {"title": "embed", "content": "boom " + _doc("")["content"]},
+            _doc("unindexed"),
+        ]
+
+        results = list(manager.batch_upload_stream(documents))
+
+        assert [(r.title, r.success) for r in results] == [
+            ("ok", True), ("empty", False), ("embed", False), ("unindexed", False)
+        ]
+        assert results[2].error == "ollama down"
+
+
+class TestBatchUploadPdfs:
+    """Test cases for batch PDF uploads from MinIO."""
+
+    @pytest.fixture
+    def pdf_manager(self, manager, monkeypatch):
+        """Manager whose worker pool parses PDFs inline from canned results."""
+        parsed = {
+            "a.pdf": PdfProcessingResult(
+                success=True, document_title="A",
+                chunks=[_pdf_chunk("a", 0), _pdf_chunk("a", 1)],
+            ),
+            "b.pdf": PdfProcessingResult(
+                success=False, document_title="", error_message="bad pdf"
+            ),
+            "c.pdf": PdfProcessingResult(
+                success=True, document_title="C", chunks=[_pdf_chunk("c", 0)]
+            ),
+        }
+        monkeypatch.setattr(
+            "src.core.document_manager._process_pdf_worker",
+            lambda bucket, path, doc_id: parsed[path],
+        )
+
+        class InlinePool:
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        manager.pdf_processor = MagicMock()
+        manager.pdf_processor.worker_pool.return_value = InlinePool()
+        manager.es_client.index_documents.side_effect = lambda docs: [True] * len(docs)
+        return manager
+
+    def test_one_embedding_batch_and_bulk_write(self, pdf_manager):
+        """Test parsed PDFs share one embed_batch and one index_documents call."""
+        results = pdf_manager.batch_upload_pdfs_from_minio(
+            [("docs", "a.pdf"), ("docs", "b.pdf"), ("docs", "c.pdf")], language="en"
+        )
+
+        assert [(r.title, r.success) for r in results] == [
+            ("A", True), ("", False), ("C", True)
+        ]
+        assert results[1].error_message == "bad pdf"
+        pdf_manager.ollama_client.embed_batch.assert_called_once_with(
+            ["a text 0", "a text 1", "c text 0"]
+        )
+        (docs,), _ = pdf_manager.es_client.index_documents.call_args
+        assert [len(doc.chunks) for doc in docs] == [2, 1]
+        assert docs[1].metadata["source_path"] == "c.pdf"
+
+    def test_leaves_index_settings_alone(self, pdf_manager):
+        """Test batch uploads don't switch the shared indices to ingest mode."""
+        pdf_manager.batch_upload_pdfs_from_minio([("docs", "a.pdf")], language="en")
+
+        pdf_manager.es_client.ingest_mode.assert_not_called()
+        pdf_manager.es_client.index_document.assert_not_called()
+
+    def test_embedding_failure_fails_parsed_pdfs(self, pdf_manager):
+        """Test an embedding error fails every PDF that was parsed."""
+        pdf_manager.ollama_client.embed_batch.side_effect = RuntimeError("ollama down")
+
+        results = pdf_manager.batch_upload_pdfs_from_minio(
+            [("docs", "a.pdf"), ("docs", "b.pdf")], language="en"
+        )
+
+        assert [r.error_message for r in results] == ["ollama down", "bad pdf"]
+        pdf_manager.es_client.index_documents.assert_not_called()
+
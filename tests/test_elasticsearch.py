@@ -0,0 +1,259 @@
+"""Tests for Elasticsearch client."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.storage.elasticsearch import DocumentData, ElasticsearchClient
+
+
+@pytest.fixture
+def es_client():
+    """Create client with a mocked Elasticsearch connection."""
+    client = ElasticsearchClient()
+    client._client = MagicMock()
+    return client
+
+
+def _put_settings(es_client):
+    """Index settings sent by put_settings, as (index, settings) pairs."""
+    return [
+        (call.kwargs["index"], call.kwargs["settings"]["index"])
+        for call in es_client.client.indices.put_settings.call_args_list
+    ]
+
+
+class TestIngestMode:
+    """Test cases for ingest_mode."""
+
+    @pytest.fixture(autouse=True)
+    def current_settings(self, es_client):
+        """Index settings an operator changed from the defaults."""
+        es_client.client.indices.get_settings.return_value = {
+            "docs": {
+                "settings": {"index": {"refresh_interval": "30s", "number_of_replicas": "2"}}
+            }
+        }
+
+    def test_restores_original_settings(self, es_client):
+        """Test settings are relaxed on entry and set back to what they were."""
+        with es_client.ingest_mode(indices=["docs"]):
+            assert _put_settings(es_client) == [
+                ("docs", {"refresh_interval": "-1", "number_of_replicas": 0})
+            ]
+
+        assert _put_settings(es_client)[-1] == (
+            "docs", {"refresh_interval": "30s", "number_of_replicas": "2"}
+        )
+        es_client.client.indices.refresh.assert_called_once_with(index="docs")
+        es_client.client.indices.get_settings.assert_called_once()
+
+    def test_defaults_restored_as_defaults(self, es_client):
+        """Test settings left at their default are reset rather than pinned."""
+        es_client.client.indices.get_settings.return_value = {
+            "docs": {"settings": {"index": {"number_of_replicas": "1"}}}
+        }
+        with es_client.ingest_mode(indices=["docs"]):
+            pass
+
+        assert _put_settings(es_client)[-1] == (
+            "docs", {"refresh_interval": None, "number_of_replicas": "1"}
+        )
+
+    def test_unreadable_settings_left_alone(self, es_client):
+        """Test an index whose settings can't be read is never changed."""
+        es_client.client.indices.get_settings.side_effect = RuntimeError("forbidden")
+        with es_client.ingest_mode(indices=["docs"]):
+            pass
+
+        assert _put_settings(es_client) == []
+        assert es_client._ingest_depth == {}
+
+    def test_overlapping_blocks_restore_once(self, es_client):
+        """Test only the outermost block changes and restores settings."""
+        outer = es_client.ingest_mode(indices=["docs"])
+        inner = es_client.ingest_mode(indices=["docs"])
+
+        outer.__enter__()
+        inner.__enter__()
+        assert len(_put_settings(es_client)) == 1
+
+        outer.__exit__(None, None, None)
+        assert len(_put_settings(es_client)) == 1
+        assert es_client._ingest_depth == {"docs": 1}
+
+        inner.__exit__(None, None, None)
+        settings = _put_settings(es_client)
+        assert len(settings) == 2
+        assert settings[1][1]["refresh_interval"] == "30s"
+        assert es_client._ingest_depth == {}
+        es_client.client.indices.get_settings.assert_called_once()
+
+    def test_restores_after_error(self, es_client):
+        """Test settings are restored when the block raises."""
+        with pytest.raises(RuntimeError):
+            with es_client.ingest_mode(indices=["docs"]):
+                raise RuntimeError("boom")
+
+        assert len(_put_settings(es_client)) == 2
+        assert es_client._ingest_depth == {}
+
+
+class TestIndexRefresh:
+    """Test cases for the refresh mode of index writes."""
+
+    @pytest.fixture
+    def bulk(self, monkeypatch):
+        """Patch the bulk helper, recording its refresh argument."""
+        mock = MagicMock(return_value=(1, []))
+        monkeypatch.setattr("src.storage.elasticsearch.bulk", mock)
+        return mock
+
+    @pytest.fixture
+    def document(self):
+        """Document without chunks."""
+        return DocumentData(
+            document_id="doc1", title="Doc", content="text", chunks=[], language="en"
+        )
+
+    def test_waits_for_periodic_refresh(self, es_client, bulk, document):
+        """Test a searchable write waits for the next periodic refresh."""
+        assert es_client.index_documents([document]) == [True]
+        assert bulk.call_args.kwargs["refresh"] == "wait_for"
+
+    def test_no_refresh_when_not_requested(self, es_client, bulk, document):
+        """Test bulk loads skip refresh entirely."""
+        es_client.index_documents([document], refresh=False)
+        assert bulk.call_args.kwargs["refresh"] is False
+
+    def test_refreshes_explicitly_during_ingest_mode(self, es_client, bulk, document):
+        """Test uploads during ingest mode refresh instead of waiting forever."""
+        with es_client.ingest_mode(indices=["docs"]):
+            assert es_client.index_document(document) is True
+            assert bulk.call_args.kwargs["refresh"] is True
+
+        es_client.index_document(document)
+        assert bulk.call_args.kwargs["refresh"] == "wait_for"
+
+
+class TestSearchableContent:
+    """Test cases for content indexed without being stored."""
+
+    def test_indexed_but_not_stored(self, es_client):
+        """Test searchable_content is mapped, excluded from _source and searched."""
+        es_client.client.indices.exists.return_value = False
+        es_client.create_index()
+
+        body = es_client.client.indices.create.call_args_list[0].kwargs["body"]
+        assert body["mappings"]["_source"] == {"excludes": ["searchable_content"]}
+        assert "searchable_content" in body["mappings"]["properties"]
+
+        es_client.client.search.return_value = {"hits": {"hits": [], "total": {"value": 0}}}
+        es_client.search_documents(query="học máy")
+        query = es_client.client.search.call_args.kwargs["query"]
+        fields = query["bool"]["must"][0]["multi_match"]["fields"]
+        assert "searchable_content" in fields
+
+    def test_body_only_carries_it_when_set(self, es_client):
+        """Test text documents don't send an empty searchable_content."""
+        document = DocumentData(
+            document_id="doc1", title="Doc", content="text", chunks=[], language="en"
+        )
+        assert "searchable_content" not in es_client._document_body(document)
+
+        document.searchable_content = ["chunk one", "chunk two"]
+        assert es_client._document_body(document)["searchable_content"] == [
+            "chunk one", "chunk two"
+        ]
+
+
+class TestVectorSearchCache:
+    """Test cases for the vector_search result cache."""
+
+    @pytest.fixture
+    def cached_client(self, es_client, monkeypatch):
+        """Client with the cache enabled and a mocked kNN search."""
+        monkeypatch.setattr(es_client.settings, "vector_search_cache_size", 16)
+        monkeypatch.setattr(es_client.settings, "vector_search_cache_ttl", 10.0)
+        es_client._knn_search = MagicMock(return_value=[])
+        return es_client
+
+    def test_disabled_by_default(self, es_client):
+        """Test every search reaches Elasticsearch unless the cache is enabled."""
+        es_client._knn_search = MagicMock(return_value=[])
+        es_client.vector_search([1.0, 0.0])
+        es_client.vector_search([1.0, 0.0])
+        assert es_client._knn_search.call_count == 2
+
+    def test_reused_until_ttl_expires(self, cached_client, monkeypatch):
+        """Test a repeated search is served from memory only within the TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("src.storage.elasticsearch.time.monotonic", lambda: now[0])
+
+        cached_client.vector_search([1.0, 0.0])
+        cached_client.vector_search([1.0, 0.0])
+        assert cached_client._knn_search.call_count == 1
+
+        now[0] += 11
+        cached_client.vector_search([1.0, 0.0])
+        assert cached_client._knn_search.call_count == 2
+
+    def test_dropped_after_write(self, cached_client):
+        """Test a write by this process invalidates cached searches."""
+        cached_client.vector_search([1.0, 0.0])
+        cached_client._invalidate_search_cache()
+        cached_client.vector_search([1.0, 0.0])
+        assert cached_client._knn_search.call_count == 2
+
+
+class TestDocumentChunks:
+    """Test cases for reading all chunks of a document."""
+
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        """Page chunks two at a time."""
+        monkeypatch.setattr("src.storage.elasticsearch._CHUNK_PAGE_SIZE", 2)
+
+    def _hits(self, *positions):
+        """Search hits for chunks at the given positions."""
+        return {
+            "hits": {
+                "hits": [
+                    {"_source": {"position": p}, "sort": [p, f"c{p}"]}
+                    for p in positions
+                ]
+            }
+        }
+
+    def test_pages_past_first_request(self, es_client):
+        """Test chunks beyond one page are fetched with search_after."""
+        es_client.client.search.side_effect = [
+            self._hits(0, 1), self._hits(2, 3), self._hits(4)
+        ]
+
+        chunks = es_client.get_document_chunks("doc1")
+
+        assert [c["position"] for c in chunks] == [0, 1, 2, 3, 4]
+        calls = es_client.client.search.call_args_list
+        assert "search_after" not in calls[0].kwargs
+        assert calls[1].kwargs["search_after"] == [1, "c1"]
+        assert calls[2].kwargs["search_after"] == [3, "c3"]
+
+    def test_exact_page_multiple_ends_on_empty_page(self, es_client):
+        """Test a full last page is followed by one empty request."""
+        es_client.client.search.side_effect = [self._hits(0, 1), self._hits()]
+        assert len(es_client.get_document_chunks("doc1")) == 2
+
+    def test_document_with_chunks_continues_msearch_page(self, es_client):
+        """Test include_chunks pages on from the chunks returned by _msearch."""
+        es_client.client.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": [{"_source": {"document_id": "doc1"}}]}},
+                self._hits(0, 1),
+            ]
+        }
+        es_client.client.search.return_value = self._hits(2)
+
+        doc = es_client.get_document("doc1", include_chunks=True)
+
+        assert [c["position"] for c in doc["chunks"]] == [0, 1, 2]
+        assert es_client.client.search.call_args.kwargs["search_after"] == [1, "c1"]
@@ -0,0 +1,141 @@
+"""Tests for lexical matcher."""
+
+import pytest
+
+from src.core.lexical_matcher import (
+    calculate_combined_similarity,
+    calculate_lexical_similarity,
+    LexicalFeatures,
+    calculate_asymmetric_lexical_similarity,
+    has_citation,
+    jaccard_from_hashes,
+    jaccard_similarity,
+    lexical_features,
+    token_hashes,
+)
+
+
+class TestCombinedSimilarity:
+    """Test cases for calculate_combined_similarity."""
+
+    def test_default_mode_is_asymmetric(self):
+        """Test default mode matches explicit asymmetric mode."""
+        input_text = "một hai ba bốn năm sáu bảy tám chín mười"
+        matched_text = "một hai ba"
+
+        default, _ = calculate_combined_similarity(0.9, input_text, matched_text)
+        explicit, _ = calculate_combined_similarity(
+            0.9, input_text, matched_text, mode="asymmetric"
+        )
+
+        assert default == explicit
+
+    def test_symmetric_mode_uses_lexical_similarity(self):
+        """Test symmetric mode uses the symmetric lexical score."""
+        input_text = "một hai ba bốn năm sáu bảy tám chín mười"
+        matched_text = "một hai ba"
+
+        _, details = calculate_combined_similarity(
+            0.9, input_text, matched_text, mode="symmetric"
+        )
+
+        assert details["lexical_score"] == pytest.approx(
+            calculate_lexical_similarity(input_text, matched_text)
+        )
+
+    def test_unknown_mode_raises(self):
+        """Test unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            calculate_combined_similarity(0.9, "a b c", "a b c", mode="other")
+
+    def test_citation_penalty(self):
+        """Test cited input text is penalized."""
+        text = "Kết quả nghiên cứu cho thấy hiệu quả cao (Nguyen, 2024)"
+        assert has_citation(text)
+
+        combined, details = calculate_combined_similarity(0.9, text, text)
+
+        assert details["has_citation"] is True
+        assert details["citation_penalty"] == 0.15
+        assert combined < 0.9
+
+
+class TestHasCitation:
+    """Test cases for citation detection."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Kết quả (Nguyen, 2024) cho thấy",
+            "như đã chỉ ra [1, 2]",
+            "nguồn: Bộ Y tế",
+            "Theo Nguyen thì",
+            "Phát và đtg đã chứng minh",
+            "Smith ET AL reported",
+        ],
+    )
+    def test_detects_each_pattern(self, text):
+        """Test every citation pattern is detected, case-insensitively."""
+        assert has_citation(text)
+
+    def test_plain_text_has_no_citation(self):
+        """Test text without citations is not flagged."""
+        assert not has_citation("Văn bản này không có trích dẫn nào cả")
+
+
+class TestTokenHashes:
+    """Test cases for stable token hashing."""
+
+    def test_hashes_are_unique_and_sorted(self):
+        """Test duplicate words collapse to one sorted hash."""
+        hashes = token_hashes("b a b c a")
+
+        assert hashes.size == 3
+        assert list(hashes) == sorted(hashes)
+
+    def test_jaccard_from_hashes_matches_word_sets(self):
+        """Test hashed Jaccard equals the word-set Jaccard."""
+        text1 = "một hai ba bốn"
+        text2 = "ba bốn năm"
+
+        assert jaccard_from_hashes(
+            token_hashes(text1), token_hashes(text2)
+        ) == pytest.approx(jaccard_similarity(text1, text2))
+
+    def test_empty_text(self):
+        """Test empty text has no hashes."""
+        assert token_hashes("").size == 0
+        assert jaccard_from_hashes(token_hashes(""), token_hashes("a")) == 0.0
+
+
+class TestLexicalFeatures:
+    """Test cases for precomputed lexical features."""
+
+    def test_stored_features_round_trip(self):
+        """Test features survive encoding to bytes and back."""
+        features = lexical_features("Một hai, ba bốn!")
+        stored = LexicalFeatures.from_stored(
+            features.normalized, features.encoded_hashes()
+        )
+
+        assert stored.normalized == "một hai ba bốn"
+        assert list(stored.hashes) == list(features.hashes)
+
+    def test_precomputed_features_match_raw_text(self):
+        """Test combined scoring gives the same result with stored features."""
+        input_text = "một hai ba bốn năm sáu bảy tám chín mười"
+        matched_text = "một hai ba"
+        stored = lexical_features(matched_text)
+
+        _, details = calculate_combined_similarity(
+            0.9,
+            input_text,
+            matched_text,
+            matched_features=LexicalFeatures.from_stored(
+                stored.normalized, stored.encoded_hashes()
+            ),
+        )
+
+        assert details["lexical_score"] == pytest.approx(
+            calculate_asymmetric_lexical_similarity(input_text, matched_text)
+        )
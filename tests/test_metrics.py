@@ -0,0 +1,123 @@
+"""Tests for the metrics HTTP server."""
+
+import http.client
+
+import pytest
+
+from prometheus_client.core import CollectorRegistry
+
+from src.metrics import MetricsServer
+from src.metrics.metrics import AtomicGauge, NsHistogram
+
+
+@pytest.fixture(scope="module")
+def metrics_port():
+    """Run a metrics server on a free port for the module."""
+    server = MetricsServer("test", port=0)
+    server.start()
+    yield server._server.server_address[1]
+    server.stop()
+
+
+def _request(port: int, method: str, path: str, headers: dict = None):
+    """Send one request and return (status, headers, body)."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        conn.request(method, path, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+class TestMetricsHandler:
+    """Test cases for MetricsHandler."""
+
+    def test_get_metrics(self, metrics_port):
+        """Test GET /metrics returns the registry with an ETag."""
+        status, headers, body = _request(metrics_port, "GET", "/metrics")
+
+        assert status == 200
+        assert b"service_info" in body
+        assert headers["ETag"]
+
+    def test_query_string_is_ignored(self, metrics_port):
+        """Test scrapers adding query parameters still get metrics."""
+        status, _, body = _request(metrics_port, "GET", "/metrics?name[]=up")
+
+        assert status == 200
+        assert b"service_info" in body
+
+    def test_head_sends_no_body(self, metrics_port):
+        """Test HEAD returns the GET headers without a body."""
+        status, headers, body = _request(metrics_port, "HEAD", "/metrics")
+
+        assert status == 200
+        assert int(headers["Content-Length"]) > 0
+        assert body == b""
+
+    def test_if_none_match(self, metrics_port):
+        """Test an unchanged payload is answered with 304."""
+        _, headers, _ = _request(metrics_port, "GET", "/metrics")
+        status, _, body = _request(
+            metrics_port, "GET", "/metrics", {"If-None-Match": headers["ETag"]}
+        )
+
+        assert status == 304
+        assert body == b""
+
+    def test_health_and_unknown_paths(self, metrics_port):
+        """Test /health answers OK and other paths or methods 404."""
+        assert _request(metrics_port, "GET", "/health")[::2] == (200, b"OK")
+        assert _request(metrics_port, "GET", "/other")[0] == 404
+        assert _request(metrics_port, "POST", "/metrics")[0] == 404
+
+
+class TestAtomicGauge:
+    """Test cases for AtomicGauge."""
+
+    def test_inc_dec_value(self):
+        """Test the exposed value is increments minus decrements per child."""
+        registry = CollectorRegistry()
+        gauge = AtomicGauge("jobs", "Jobs", ["queue"], registry=registry)
+        fast = gauge.labels("fast")
+        for _ in range(3):
+            fast.inc()
+        fast.dec()
+        gauge.labels(queue="slow").inc()
+
+        assert gauge.labels("fast") is fast
+        assert registry.get_sample_value("jobs", {"queue": "fast"}) == 2
+        assert registry.get_sample_value("jobs", {"queue": "slow"}) == 1
+        # Reading the value leaves it unchanged
+        assert registry.get_sample_value("jobs", {"queue": "fast"}) == 2
+
+    def test_label_count_checked(self):
+        """Test a wrong number of label values is rejected."""
+        gauge = AtomicGauge("jobs", "Jobs", ["queue"], registry=CollectorRegistry())
+        with pytest.raises(ValueError):
+            gauge.labels("a", "b")
+
+
+class TestNsHistogram:
+    """Test cases for NsHistogram.observe_ns."""
+
+    def test_matches_observe_in_seconds(self):
+        """Test nanosecond observations land in the same buckets as seconds."""
+        registry = CollectorRegistry()
+        histogram = NsHistogram(
+            "took_seconds", "Took", buckets=[0.01, 0.1, 1], registry=registry
+        )
+        for duration_ns in (5_000_000, 10_000_000, 10_000_001, 2_000_000_000):
+            histogram.observe_ns(duration_ns)
+
+        def bucket(le: str) -> float:
+            return registry.get_sample_value("took_seconds_bucket", {"le": le})
+
+        # Bounds are inclusive, as for observe()
+        assert bucket("0.01") == 2
+        assert bucket("0.1") == 3
+        assert bucket("1.0") == 3
+        assert bucket("+Inf") == 4
+        assert registry.get_sample_value("took_seconds_count") == 4
+        assert registry.get_sample_value("took_seconds_sum") == pytest.approx(2.025000001)
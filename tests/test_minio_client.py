@@ -0,0 +1,204 @@
+"""Tests for MinIO client."""
+
+import io
+import tarfile
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from minio.error import S3Error
+
+from src.storage.minio_client import MinioClient
+
+
+def _stat(size: int) -> SimpleNamespace:
+    """stat_object result for an object of the given size."""
+    return SimpleNamespace(
+        size=size, content_type="a/b", last_modified=None, etag="e", metadata={}
+    )
+
+
+def _s3_error(code: str = "NoSuchKey") -> S3Error:
+    """S3Error as raised by the SDK for a missing object."""
+    return S3Error(code, "missing", "/b/o", "req", "host", MagicMock())
+
+
+@pytest.fixture
+def make_minio(monkeypatch):
+    """Build clients with given settings overrides and a mocked SDK client."""
+
+    def make(**settings) -> MinioClient:
+        from src.config import get_settings
+
+        for name, value in settings.items():
+            monkeypatch.setattr(get_settings(), name, value)
+        client = MinioClient()
+        client.client = MagicMock()
+        return client
+
+    return make
+
+
+class TestStatCache:
+    """Test cases for the object stat cache."""
+
+    def test_stat_reused_within_ttl(self, make_minio):
+        """Test object_exists then get_object_info costs one stat."""
+        minio = make_minio(minio_stat_cache_ttl=10.0)
+        minio.client.stat_object.return_value = _stat(3)
+
+        assert minio.object_exists("b", "o")
+        assert minio.get_object_info("b", "o")["size"] == 3
+        assert minio.client.stat_object.call_count == 1
+
+    def test_ttl_zero_disables(self, make_minio):
+        """Test a zero TTL stats the object on every call."""
+        minio = make_minio(minio_stat_cache_ttl=0.0, minio_missing_cache_ttl=0.0)
+        minio.client.stat_object.side_effect = [_s3_error(), _stat(3)]
+
+        # Uploaded right after a failed check: seen on the next call
+        assert not minio.object_exists("b", "o")
+        assert minio.object_exists("b", "o")
+        assert minio.client.stat_object.call_count == 2
+
+
+@pytest.fixture
+def store(make_minio, monkeypatch):
+    """Client backed by an in-memory object store, recording ranged reads."""
+    monkeypatch.setattr("src.storage.minio_client._RANGE_START_JITTER", 0)
+    minio = make_minio()
+    minio.objects = {}
+    minio.reads = []
+    minio.client.stat_object.side_effect = lambda bucket, path: _stat(
+        len(minio.objects[path])
+    )
+
+    def download_file_stream(bucket, path, sink, offset=0, length=0, **kwargs):
+        minio.reads.append((path, offset, length))
+        if path not in minio.objects:
+            return None
+        data = minio.objects[path]
+        data = data[offset:offset + length] if length else data[offset:]
+        sink.write(data)
+        return len(data)
+
+    minio.download_file_stream = download_file_stream
+    return minio
+
+
+class TestDownloadFileParallel:
+    """Test cases for ranged parallel downloads."""
+
+    def test_splits_into_ranges(self, store, tmp_path):
+        """Test the object is fetched as part_size ranges and reassembled."""
+        store.objects["o"] = bytes(range(250))
+        path = store.download_file_parallel(
+            "b", "o", local_path=str(tmp_path / "o"), part_size=100
+        )
+
+        assert open(path, "rb").read() == bytes(range(250))
+        assert sorted(store.reads) == [("o", 0, 100), ("o", 100, 100), ("o", 200, 50)]
+
+    def test_zero_size_object(self, store, tmp_path):
+        """Test an empty object gives an empty file without any GET."""
+        store.objects["o"] = b""
+        path = store.download_file_parallel("b", "o", local_path=str(tmp_path / "o"))
+
+        assert open(path, "rb").read() == b""
+        assert store.reads == []
+
+    def test_failed_range_removes_temp_file(self, store, tmp_path):
+        """Test a short range fails the download and drops the temp file."""
+        store.objects["o"] = bytes(250)
+        fetch = store.download_file_stream
+        store.download_file_stream = lambda *a, **kw: (
+            None if kw["offset"] == 100 else fetch(*a, **kw)
+        )
+
+        assert store.download_file_parallel(
+            "b", "o", part_size=100, temp_dir=str(tmp_path)
+        ) is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDownloadMany:
+    """Test cases for concurrent multi-object downloads."""
+
+    def test_fetches_each_path_once(self, store):
+        """Test duplicate paths are fetched once and failures map to None."""
+        store.objects.update({"a": b"1", "b": b"22"})
+        result = store.download_many("b", ["a", "b", "a", "missing"])
+
+        assert result == {"a": b"1", "b": b"22", "missing": None}
+        assert sorted(path for path, *_ in store.reads) == ["a", "b", "missing"]
+
+    def test_whole_object_reads(self, store):
+        """Test objects are read whole rather than by range."""
+        store.objects["a"] = b"abc"
+        store.download_many("b", ["a"])
+        assert store.reads == [("a", 0, 0)]
+
+    def test_empty(self, store):
+        """Test no paths means no requests."""
+        assert store.download_many("b", []) == {}
+
+
+class TestPacks:
+    """Test cases for tar pack objects."""
+
+    @pytest.fixture
+    def packs(self, store):
+        """Store whose PUTs are kept, so packs can be read back."""
+        store.client.put_object.side_effect = (
+            lambda bucket, key, data, size, **kwargs: store.objects.__setitem__(
+                key, data.read(size)
+            )
+        )
+        return store
+
+    def _read_cold(self, packs, pack_key, member):
+        """Read a member as a process that has not seen the pack's index."""
+        packs._pack_indexes.discard_if(lambda key: True)
+        packs.reads.clear()
+        return packs.read_pack_member("b", pack_key, member)
+
+    def test_round_trip(self, packs):
+        """Test members read back from the index offsets, in one tail GET."""
+        members = {"a.txt": b"alpha", "b.txt": b"", "c.bin": bytes(range(256)) * 3}
+        pack_key = packs.write_pack("b", members)
+
+        assert pack_key.startswith("packs/") and pack_key.endswith(".tar")
+        for name, data in members.items():
+            assert self._read_cold(packs, pack_key, name) == data
+            # Tail holding the index, then the member's range if it has bytes
+            assert len(packs.reads) == (2 if data else 1)
+
+        with tarfile.open(fileobj=io.BytesIO(packs.objects[pack_key])) as tar:
+            assert {m.name: tar.extractfile(m).read() for m in tar} == members
+
+    def test_index_larger_than_tail(self, packs, monkeypatch):
+        """Test an index that doesn't fit the tail read is fetched exactly."""
+        monkeypatch.setattr("src.storage.minio_client._PACK_TAIL_SIZE", 64)
+        members = {f"member-{i:03d}": str(i).encode() for i in range(50)}
+        pack_key = packs.write_pack("b", members)
+
+        assert self._read_cold(packs, pack_key, "member-042") == b"42"
+        (_, tail_offset, tail_length), (_, index_offset, index_length), _ = packs.reads
+        size = len(packs.objects[pack_key])
+        assert (tail_offset, tail_length) == (size - 64, 64)
+        assert index_offset + index_length == size - 8
+        assert index_length > 64
+
+    def test_index_cached_after_write(self, packs):
+        """Test the writer reads members without fetching the index."""
+        pack_key = packs.write_pack("b", {"a": b"alpha"})
+        packs.reads.clear()
+
+        assert packs.read_pack_member("b", pack_key, "a") == b"alpha"
+        assert len(packs.reads) == 1
+
+    def test_unknown_member(self, packs):
+        """Test a name not in the pack reads as None."""
+        pack_key = packs.write_pack("b", {"a": b"alpha"})
+        assert packs.read_pack_member("b", pack_key, "missing") is None
@@ -0,0 +1,69 @@
+"""Tests for Ollama embedding clients."""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.embedding import BatchingOllamaClient
+
+
+@pytest.fixture
+def ollama_client():
+    """Mocked Ollama client embedding each text as [len(text)]."""
+    client = MagicMock()
+    client.embed_one_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    return client
+
+
+class TestBatchingOllamaClient:
+    """Test cases for BatchingOllamaClient."""
+
+    def test_flushes_when_batch_is_full(self, ollama_client):
+        """Test max_batch queued texts go out as one request without waiting."""
+        batcher = BatchingOllamaClient(ollama_client, max_batch=3, max_wait_ms=10_000)
+
+        start = time.monotonic()
+        futures = [batcher.embed(text) for text in ("a", "bb", "ccc")]
+        results = [future.result(timeout=5) for future in futures]
+
+        assert time.monotonic() - start < 5
+        assert results == [[1.0], [2.0], [3.0]]
+        ollama_client.embed_one_batch.assert_called_once_with(["a", "bb", "ccc"])
+
+    def test_flushes_partial_batch_after_max_wait(self, ollama_client):
+        """Test a partial batch is sent once its first text has waited max_wait."""
+        batcher = BatchingOllamaClient(ollama_client, max_batch=100, max_wait_ms=50)
+
+        futures = [batcher.embed(text) for text in ("a", "bb")]
+
+        assert [future.result(timeout=5) for future in futures] == [[1.0], [2.0]]
+        ollama_client.embed_one_batch.assert_called_once_with(["a", "bb"])
+
+    def test_errors_fail_only_their_batch(self, ollama_client):
+        """Test a failed batch rejects its futures and later batches still run."""
+        batcher = BatchingOllamaClient(ollama_client, max_batch=1, max_wait_ms=0)
+        ollama_client.embed_one_batch.side_effect = [RuntimeError("down"), [[2.0]]]
+
+        with pytest.raises(RuntimeError):
+            batcher.embed("a").result(timeout=5)
+        assert batcher.embed("bb").result(timeout=5) == [2.0]
+
+    def test_worker_survives_dispatch_errors(self, ollama_client):
+        """Test the worker thread keeps serving after a batch can't be submitted."""
+        batcher = BatchingOllamaClient(ollama_client, max_batch=1, max_wait_ms=0)
+        submit = batcher._executor.submit
+        calls = []
+
+        def flaky_submit(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise RuntimeError("shutdown")
+            return submit(*args)
+
+        batcher._executor.submit = flaky_submit
+
+        with pytest.raises(RuntimeError):
+            batcher.embed("a").result(timeout=5)
+        assert batcher.embed("bb").result(timeout=5) == [2.0]
+        assert batcher._worker.is_alive()
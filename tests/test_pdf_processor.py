@@ -0,0 +1,128 @@
+"""Tests for PDF processor."""
+
+from concurrent.futures import Future
+
+import pytest
+from unittest.mock import MagicMock
+
+from pypdf import PdfWriter
+
+from src.core.pdf_processor import PdfProcessingResult, PdfProcessor
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Write a blank PDF with the given number of pages."""
+
+    def make(pages: int) -> str:
+        writer = PdfWriter()
+        for _ in range(pages):
+            writer.add_blank_page(width=200, height=200)
+        path = tmp_path / f"{pages}.pdf"
+        with open(path, "wb") as f:
+            writer.write(f)
+        return str(path)
+
+    return make
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """Processor whose partitioning and pipeline are mocked."""
+    processor = PdfProcessor()
+    monkeypatch.setattr(processor.settings, "pdf_parallel_min_pages", 5)
+    monkeypatch.setattr(processor.settings, "pdf_cache_dir", "")
+    parallel_result = PdfProcessingResult(success=True, document_title="parallel")
+    processor._process_pdf_parallel = MagicMock(return_value=parallel_result)
+    processor._partition_cached = MagicMock(return_value=[])
+    processor._build_result = MagicMock(
+        return_value=PdfProcessingResult(success=True, document_title="serial")
+    )
+    return processor
+
+
+class TestParallelThreshold:
+    """Test cases for splitting large PDFs across processes."""
+
+    def test_small_pdf_partitioned_in_process(self, processor, make_pdf):
+        """Test PDFs below the threshold are partitioned in one go."""
+        result = processor.process_pdf(make_pdf(4), "doc1")
+
+        assert result.document_title == "serial"
+        processor._process_pdf_parallel.assert_not_called()
+
+    def test_large_pdf_partitioned_in_parallel(self, processor, make_pdf):
+        """Test PDFs at the threshold go to the parallel path."""
+        result = processor.process_pdf(make_pdf(5), "doc1")
+
+        assert result.document_title == "parallel"
+        reader = processor._process_pdf_parallel.call_args.args[1]
+        assert len(reader.pages) == 5
+        processor._partition_cached.assert_not_called()
+
+    def test_zero_disables(self, processor, make_pdf, monkeypatch):
+        """Test a zero threshold never splits."""
+        monkeypatch.setattr(processor.settings, "pdf_parallel_min_pages", 0)
+        assert processor.process_pdf(make_pdf(50), "doc1").document_title == "serial"
+        processor._process_pdf_parallel.assert_not_called()
+
+
+class TestParallelPartition:
+    """Test cases for partitioning page ranges in worker processes."""
+
+    @pytest.fixture
+    def parallel(self, monkeypatch):
+        """Processor whose worker pool runs tasks inline."""
+        processor = PdfProcessor()
+        monkeypatch.setattr(processor.settings, "pdf_parallel_min_pages", 1)
+        monkeypatch.setattr(processor.settings, "pdf_parallel_workers", 3)
+        monkeypatch.setattr(processor.settings, "pdf_cache_dir", "")
+        pools = []
+
+        class InlinePool:
+            def __init__(self, max_workers, mp_context):
+                self.max_workers = max_workers
+                self.submitted = []
+                pools.append(self)
+
+            def submit(self, fn, *args):
+                self.submitted.append(args)
+                future = Future()
+                future.set_result([])
+                return future
+
+        monkeypatch.setattr("src.core.pdf_processor.ProcessPoolExecutor", InlinePool)
+        processor.pools = pools
+        processor._build_result = MagicMock(
+            return_value=PdfProcessingResult(success=True, document_title="parallel")
+        )
+        return processor
+
+    def test_pool_shared_across_calls(self, parallel, make_pdf):
+        """Test one pool of pdf_parallel_workers serves every large PDF."""
+        parallel.process_pdf(make_pdf(25), "doc1")
+        parallel.process_pdf(make_pdf(25), "doc2")
+
+        assert len(parallel.pools) == 1
+        assert parallel.pools[0].max_workers == 3
+        # 10 pages per task
+        assert len(parallel.pools[0].submitted) == 6
+
+    def test_ranges_keep_original_filename(self, parallel, make_pdf):
+        """Test split files are partitioned under the uploaded file's name."""
+        pdf_path = make_pdf(25)
+        parallel.process_pdf(pdf_path, "doc1")
+
+        for split_path, _, _, metadata_filename in parallel.pools[0].submitted:
+            assert split_path != pdf_path
+            assert metadata_filename == pdf_path
+
+    def test_close_stops_pool(self, parallel, make_pdf):
+        """Test close shuts the pool down and a later PDF starts a new one."""
+        parallel.process_pdf(make_pdf(5), "doc1")
+        parallel.pools[0].shutdown = MagicMock()
+        parallel.close()
+
+        parallel.pools[0].shutdown.assert_called_once()
+        parallel.process_pdf(make_pdf(5), "doc2")
+        assert len(parallel.pools) == 2
@@ -0,0 +1,236 @@
+"""Tests for the gRPC plagiarism service."""
+
+import threading
+from concurrent.futures import Future
+
+import grpc
+import pytest
+from unittest.mock import MagicMock
+
+from src import plagiarism_pb2
+from src.core.document_manager import UploadResult
+from src.services.plagiarism_service import (
+    PlagiarismServicer,
+    _decode_cursor,
+    _encode_cursor,
+)
+
+
+@pytest.fixture
+def servicer():
+    """Servicer without backends, built without connecting to them."""
+    servicer = PlagiarismServicer.__new__(PlagiarismServicer)
+    servicer.doc_manager = MagicMock()
+    servicer.upload_workers = 2
+    servicer._inflight = {}
+    servicer._inflight_lock = threading.Lock()
+    return servicer
+
+
+class _LazyFuture(Future):
+    """Future that runs its work when the result is first asked for."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self._call = (fn, args)
+
+    def result(self, timeout=None):
+        if not self.done():
+            fn, args = self._call
+            self.set_result(fn(*args))
+        return super().result(timeout)
+
+
+class TestUploadResults:
+    """Test cases for bulk windowing of streamed uploads."""
+
+    @pytest.fixture
+    def uploads(self, servicer, monkeypatch):
+        """Servicer whose bulk uploads run only once their results are read."""
+        monkeypatch.setattr("src.services.plagiarism_service._BULK_UPLOAD_DOCS", 3)
+        servicer.consumed = 0
+        servicer.batches = []
+
+        def upload_documents_bulk(batch):
+            servicer.batches.append(([doc["title"] for doc in batch], servicer.consumed))
+            return [
+                UploadResult(
+                    document_id=doc["title"], title=doc["title"], chunks_created=1,
+                    success=doc["title"] != "bad", message="",
+                    error="failed" if doc["title"] == "bad" else None,
+                )
+                for doc in batch
+            ]
+
+        servicer.doc_manager.upload_documents_bulk = upload_documents_bulk
+        servicer._upload_executor = MagicMock()
+        servicer._upload_executor.submit.side_effect = _LazyFuture
+        return servicer
+
+    def _requests(self, servicer, titles):
+        """Upload requests, counting how many the servicer has read."""
+        for title in titles:
+            servicer.consumed += 1
+            yield plagiarism_pb2.UploadRequest(title=title, content="text")
+
+    def test_results_in_input_order(self, uploads):
+        """Test documents go out in bulk batches and come back in order."""
+        titles = ["0", "1", "bad", "3", "4", "5", "6"]
+        results = list(uploads._upload_results(self._requests(uploads, titles)))
+
+        assert [r.title for r in results] == titles
+        assert [r.success for r in results] == [True, True, False, True, True, True, True]
+        assert results[2].error == "failed"
+        assert [batch for batch, _ in uploads.batches] == [
+            ["0", "1", "bad"], ["3", "4", "5"], ["6"]
+        ]
+
+    def test_window_bounds_read_ahead(self, uploads):
+        """Test at most upload_workers batches are buffered ahead of results."""
+        titles = [str(i) for i in range(12)]
+        results = uploads._upload_results(self._requests(uploads, titles))
+
+        next(results)
+        # The first batch is collected once the second one fills the window
+        assert uploads.consumed == 6
+        list(results)
+        assert [consumed for _, consumed in uploads.batches] == [6, 9, 12, 12]
+
+    def test_byte_limit_flushes(self, uploads, monkeypatch):
+        """Test large documents flush before the document limit is reached."""
+        monkeypatch.setattr("src.services.plagiarism_service._BULK_UPLOAD_BYTES", 8)
+        list(uploads._upload_results(self._requests(uploads, ["0", "1", "2"])))
+        assert [batch for batch, _ in uploads.batches] == [["0", "1"], ["2"]]
+
+
+class TestCoalesced:
+    """Test cases for sharing identical in-flight checks."""
+
+    def _run_concurrently(self, servicer, count, request, run):
+        """Call _coalesced count times at once, holding the first run open."""
+        looked_up = threading.Semaphore(0)
+        release = threading.Event()
+        outcomes = [None] * count
+
+        class Inflight(dict):
+            def get(self, key, default=None):
+                looked_up.release()
+                return super().get(key, default)
+
+        servicer._inflight = Inflight()
+
+        def blocked_run():
+            release.wait(5)
+            return run()
+
+        def call(i):
+            try:
+                outcomes[i] = servicer._coalesced(request, blocked_run)
+            except Exception as e:
+                outcomes[i] = e
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        # Every caller has checked for an in-flight run before it completes
+        for _ in range(count):
+            assert looked_up.acquire(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        return outcomes
+
+    def test_identical_requests_share_one_run(self, servicer):
+        """Test concurrent identical requests get the one run's result."""
+        run = MagicMock(return_value="result")
+        request = plagiarism_pb2.CheckRequest(text="same text")
+
+        outcomes = self._run_concurrently(servicer, 3, request, run)
+
+        assert outcomes == ["result"] * 3
+        run.assert_called_once()
+        assert servicer._inflight == {}
+
+    def test_waiters_get_the_exception(self, servicer):
+        """Test a failed run raises the same exception in every caller."""
+        error = RuntimeError("detector down")
+        request = plagiarism_pb2.CheckRequest(text="same text")
+
+        outcomes = self._run_concurrently(
+            servicer, 2, request, MagicMock(side_effect=error)
+        )
+
+        assert outcomes == [error, error]
+        assert servicer._inflight == {}
+
+    def test_different_requests_run_separately(self, servicer):
+        """Test requests differing only in options are not shared."""
+        run = MagicMock(return_value="result")
+        plain = plagiarism_pb2.CheckRequest(text="same text")
+        with_options = plagiarism_pb2.CheckRequest(text="same text")
+        with_options.options.SetInParent()
+
+        servicer._coalesced(plain, run)
+        servicer._coalesced(with_options, run)
+        assert run.call_count == 2
+
+
+class TestCursor:
+    """Test cases for SearchDocuments page cursors."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the sort values it was made from."""
+        sort_values = [1.5, "doc-1", 1700000000000]
+        cursor = _encode_cursor(sort_values)
+
+        assert cursor.isascii() and "/" not in cursor and "+" not in cursor
+        assert _decode_cursor(cursor) == sort_values
+
+    @pytest.mark.parametrize(
+        "cursor", ["not a cursor!", "bm90IGpzb24=", _encode_cursor({"a": 1}), "đ"]
+    )
+    def test_invalid_raises_value_error(self, cursor):
+        """Test malformed, non-JSON and non-list cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            _decode_cursor(cursor)
+
+    def test_next_page_cursor(self, servicer):
+        """Test a full page carries a cursor that resumes after its last hit."""
+        servicer.doc_manager.search_documents.return_value = (
+            [{"document_id": "a"}, {"document_id": "b"}], 5, [0.9, "b"]
+        )
+        response = servicer.SearchDocuments(
+            plagiarism_pb2.SearchRequest(query="q", limit=2), MagicMock()
+        )
+
+        servicer.SearchDocuments(
+            plagiarism_pb2.SearchRequest(query="q", limit=2, cursor=response.next_cursor),
+            MagicMock(),
+        )
+        search_after = servicer.doc_manager.search_documents.call_args.kwargs["search_after"]
+        assert search_after == [0.9, "b"]
+
+    def test_last_page_has_no_cursor(self, servicer):
+        """Test a short page ends pagination."""
+        servicer.doc_manager.search_documents.return_value = (
+            [{"document_id": "a"}], 1, [0.9, "a"]
+        )
+        response = servicer.SearchDocuments(
+            plagiarism_pb2.SearchRequest(query="q", limit=2), MagicMock()
+        )
+        assert response.next_cursor == ""
+
+    def test_invalid_cursor_aborts(self, servicer):
+        """Test a bad cursor is rejected with INVALID_ARGUMENT before searching."""
+        context = MagicMock()
+        context.abort.side_effect = RuntimeError("aborted")
+
+        with pytest.raises(RuntimeError):
+            servicer.SearchDocuments(
+                plagiarism_pb2.SearchRequest(query="q", cursor="garbage"), context
+            )
+
+        context.abort.assert_called_once_with(
+            grpc.StatusCode.INVALID_ARGUMENT, "Invalid cursor"
+        )
+        servicer.doc_manager.search_documents.assert_not_called()